@@ -10,6 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 import functools
+from typing import Optional
 
 from ...logger._pyforge_logger import _PyForgeLogger
 from ..exceptions.exceptions import ConfigurationUpdateBlocked
@@ -20,12 +21,22 @@ class _ConfigBlocker:
 
     __logger = _PyForgeLogger._get_logger()
     __block_config_update = False
+    __nb_blocks = 0
 
     @classmethod
     def _block(cls):
         if not cls.__block_config_update:
             cls.__logger.debug("Blocking configuration update.")
             cls.__block_config_update = True
+            cls.__nb_blocks += 1
+
+    @classmethod
+    def _block_id(cls) -> Optional[int]:
+        """Return an identifier of the current blocking period, or None if the configuration is not blocked.
+
+        The configuration cannot be updated as long as the identifier does not change.
+        """
+        return cls.__nb_blocks if cls.__block_config_update else None
 
     @classmethod
     def _unblock(cls):
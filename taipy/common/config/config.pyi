@@ -919,6 +919,9 @@ class Config:
                 been made on inputs.<br/>
                 The default value is False.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+                The *execution_mode* property selects how the jobs of the task are executed in
+                *"standalone"* and *"threaded"* job execution modes: *"process"*, *"thread"*, or
+                *"async"* for a coroutine function run on an event loop.
 
         Returns:
             The new task configuration.
@@ -964,8 +967,8 @@ class Config:
 
         Arguments:
             mode (Optional[str]): The job execution mode.
-                Possible values are: *"standalone"* or *"development"*.
-            max_nb_of_workers (Optional[int, str]): Parameter used only in *"standalone"* mode.
+                Possible values are: *"standalone"*, *"threaded"*, or *"development"*.
+            max_nb_of_workers (Optional[int, str]): Parameter used only in *"standalone"* and *"threaded"* modes.
                 This indicates the maximum number of jobs able to run in parallel.<br/>
                 The default value is 2.<br/>
                 A string can be provided to dynamically set the value using an environment
@@ -988,6 +991,8 @@ class Config:
         mode: Optional[str] = None,
         version_number: Optional[str] = None,
         force: Optional[bool] = None,
+        entity_cache_size: Optional[int] = None,
+        notification_queue_size: Optional[int] = None,
         **properties,
     ) -> "CoreSection":
         """Configure the Orchestrator service.
@@ -1002,9 +1007,11 @@ class Config:
                 used in conjunction with the *root_folder* attribute. That means the storage path is
                 <root_folder><storage_folder> (The default path is "./pyforge/.pyforge/").
             repository_type (Optional[str]): The type of the repository to be used to store PyForge data.
-                The default value is "filesystem".
+                Possible values are *"filesystem"* or *"sql"* (a SQLite database). The default value is "filesystem".
             repository_properties (Optional[Dict[str, Union[str, int]]]): A dictionary of additional properties
-                to be used by the repository.
+                to be used by the repository. With the *"sql"* repository type, the *db_location* property
+                sets the path of the SQLite database file. The default value is
+                "<pyforge_storage_folder>/pyforge.sqlite3".
             read_entity_retry (Optional[int]): Number of retries to read an entity from the repository
                 before return failure. The default value is 3.
             mode (Optional[str]): Indicates the mode of the version management system.
@@ -1016,6 +1023,12 @@ class Config:
                  In development mode, the version number is ignored.
             force (Optional[bool]): If True, PyForge will override a version even if the configuration
                 has changed and run the application.
+            entity_cache_size (Optional[int]): Maximum number of entities kept in memory by each entity
+                manager to avoid reading them again from the repository. The value 0 disables the cache.
+                The default value is 1000.
+            notification_queue_size (Optional[int]): Maximum number of events waiting to be delivered to
+                the registered listeners by a background thread while the Orchestrator service runs. The
+                value 0 delivers the events synchronously when they are published. The default value is 0.
             **properties (Dict[str, Any]): A keyworded variable length list of additional arguments configure the
                 behavior of the `Orchestrator^` service.
 
@@ -10,7 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 import functools
-from typing import Dict, Type
+from typing import Dict, Optional, Type
 
 from .._manager._manager import _Manager
 from ..common._check_dependencies import EnterpriseEditionUtils
@@ -99,7 +99,7 @@ def _self_reload(manager: str):
     return __reload
 
 
-def _self_setter(manager):
+def _self_setter(manager, attribute_name: Optional[str] = None):
     def __set_entity(fct):
         @functools.wraps(fct)
         def _do_set_entity(self, *args, **kwargs):
@@ -108,7 +108,7 @@ def _self_setter(manager):
             event = _make_event(
                 self,
                 EventOperation.UPDATE,
-                attribute_name=fct.__name__,
+                attribute_name=attribute_name or fct.__name__,
                 attribute_value=value,
             )
             if not self._is_in_context:
@@ -0,0 +1,129 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+from collections import OrderedDict, UserDict, UserList
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple, Type
+
+
+class _EntityCache:
+    """
+    Bounded LRU cache of the entities loaded by a manager, keyed by entity id.
+
+    Each entity is stored along with the repository stamp it was loaded with. An entity is only served
+    again if the stamp of the stored entity did not change in the meantime, so that modifications made
+    by other processes are never hidden.
+
+    The cached entities are never handed out: each hit returns a clone whose containers (lists, dicts,
+    sets, properties, ...) are copied, so that callers can modify it as freely as a freshly loaded entity.
+    The referenced entities (e.g., the data nodes of a task) are reloaded through their own manager, and
+    the other attributes are shared.
+
+    Attributes:
+        capacity (int): The maximum number of entities kept in the cache. 0 disables the cache.
+        hits (int): The number of lookups served by the cache.
+        misses (int): The number of lookups that required loading the entity from the repository.
+    """
+
+    __IMMUTABLE_TYPES = frozenset({str, int, float, bool, type(None), datetime, timedelta})
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.__entries: OrderedDict[str, Tuple[Hashable, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def _get(self, entity_id: str, stamp: Optional[Hashable]) -> Optional[Any]:
+        with self._lock:
+            entry = self.__entries.get(entity_id)
+            if entry is None or stamp is None or entry[0] != stamp:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(entity_id)
+            self.hits += 1
+        return self._clone(entry[1])
+
+    def _put(self, entity_id: str, stamp: Optional[Hashable], entity: Any):
+        if stamp is None or self.capacity <= 0:
+            return
+        with self._lock:
+            self.__entries[entity_id] = (stamp, entity)
+            self.__entries.move_to_end(entity_id)
+            self.__evict()
+
+    def _resize(self, capacity: int):
+        with self._lock:
+            self.capacity = capacity
+            self.__evict()
+
+    def _invalidate(self, entity_ids: Iterable[str]):
+        with self._lock:
+            for entity_id in entity_ids:
+                self.__entries.pop(entity_id, None)
+
+    def _clear(self):
+        with self._lock:
+            self.__entries.clear()
+
+    def _stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": len(self.__entries), "capacity": self.capacity, "hits": self.hits, "misses": self.misses}
+
+    @classmethod
+    def _clone(cls, entity: Any) -> Any:
+        from .._entity._entity import _Entity
+        from .._entity._reload import _Reloader
+
+        def _refresh(nested_entity: _Entity) -> _Entity:
+            return _Reloader()._reload(nested_entity._MANAGER_NAME, nested_entity)
+
+        clone = object.__new__(type(entity))
+        memo: Dict[int, Any] = {id(entity): clone}
+        clone.__dict__.update(
+            {name: cls.__clone_value(value, memo, _Entity, _refresh) for name, value in vars(entity).items()}
+        )
+        return clone
+
+    @classmethod
+    def __clone_value(cls, value: Any, memo: Dict[int, Any], entity_type: Type, refresh: Callable) -> Any:
+        value_type = type(value)
+        if value_type in cls.__IMMUTABLE_TYPES:
+            return value
+        if (cloned := memo.get(id(value))) is not None:
+            return cloned
+        if value_type is dict:
+            cloned = {k: cls.__clone_value(v, memo, entity_type, refresh) for k, v in value.items()}
+        elif value_type is list:
+            cloned = [cls.__clone_value(v, memo, entity_type, refresh) for v in value]
+        elif value_type is set:
+            cloned = {cls.__clone_value(v, memo, entity_type, refresh) for v in value}
+        elif isinstance(value, entity_type):
+            # The referenced entities are served up to date, as they would be by loading the entity again.
+            cloned = refresh(value)
+        elif isinstance(value, (UserDict, UserList)):
+            cloned = object.__new__(value_type)
+            memo[id(value)] = cloned
+            cloned.__dict__.update(
+                {name: cls.__clone_value(v, memo, entity_type, refresh) for name, v in vars(value).items()}
+            )
+        else:
+            return value
+        memo[id(value)] = cloned
+        return cloned
+
+    def __evict(self):
+        while len(self.__entries) > max(self.capacity, 0):
+            self.__entries.popitem(last=False)
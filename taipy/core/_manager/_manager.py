@@ -9,8 +9,9 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Dict, Generic, Iterable, List, Optional, TypeVar, Union
+from typing import Dict, Generic, Iterable, Iterator, List, Optional, TypeVar, Union
 
+from pyforge.common.config import Config
 from pyforge.common.logger._pyforge_logger import _PyForgeLogger
 
 from .._entity._entity_ids import _EntityIds
@@ -18,6 +19,7 @@ from .._repository._abstract_repository import _AbstractRepository
 from ..exceptions.exceptions import ModelNotFound
 from ..notification import Event, EventOperation, Notifier
 from ..reason import EntityDoesNotExist, ReasonCollection
+from ._entity_cache import _EntityCache
 
 EntityType = TypeVar("EntityType")
 
@@ -33,6 +35,7 @@ class _Manager(Generic[EntityType]):
         Deletes all entities.
         """
         cls._repository._delete_all()
+        cls._entity_cache()._clear()
         if hasattr(cls, "_EVENT_ENTITY_TYPE"):
             Notifier.publish(
                 Event(
@@ -48,6 +51,7 @@ class _Manager(Generic[EntityType]):
         Deletes entities by a list of ids.
         """
         cls._repository._delete_many(ids)
+        cls._entity_cache()._invalidate(ids)
         if hasattr(cls, "_EVENT_ENTITY_TYPE"):
             for entity_id in ids:
                 Notifier.publish(
@@ -65,6 +69,7 @@ class _Manager(Generic[EntityType]):
         Deletes entities by version number.
         """
         cls._repository._delete_by(attribute="version", value=version_number)
+        cls._entity_cache()._clear()
         if hasattr(cls, "_EVENT_ENTITY_TYPE"):
             Notifier.publish(
                 Event(
@@ -80,6 +85,7 @@ class _Manager(Generic[EntityType]):
         Deletes an entity by id.
         """
         cls._repository._delete(id)
+        cls._entity_cache()._invalidate([id])
         if hasattr(cls, "_EVENT_ENTITY_TYPE"):
             Notifier.publish(
                 Event(
@@ -95,6 +101,16 @@ class _Manager(Generic[EntityType]):
         Save or update an entity.
         """
         cls._repository._save(entity)
+        cls._entity_cache()._invalidate([entity.id])  # type: ignore
+
+    @classmethod
+    def _set_many(cls, entities: Iterable[EntityType]):
+        """
+        Save or update several entities at once.
+        """
+        entities = list(entities)
+        cls._repository._save_many(entities)
+        cls._entity_cache()._invalidate([entity.id for entity in entities])  # type: ignore
 
     @classmethod
     def _get_all(cls, version_number: Optional[str] = "all") -> List[EntityType]:
@@ -113,17 +129,100 @@ class _Manager(Generic[EntityType]):
             filters = []
         return cls._repository._load_all(filters)
 
+    @classmethod
+    def _get_page_by(
+        cls,
+        filters: Optional[List[Dict]] = None,
+        order_by: str = "id",
+        descending: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[EntityType]:
+        """
+        Returns a page of the entities based on a criteria, sorted by a stored attribute then by id.
+        """
+        return cls._repository._load_page(filters or [], order_by, descending, offset, limit)
+
+    @classmethod
+    def _iter_all_by(
+        cls, filters: Optional[List[Dict]] = None, order_by: str = "id", descending: bool = False
+    ) -> Iterator[EntityType]:
+        """
+        Lazily iterates over the entities based on a criteria, sorted by a stored attribute then by id.
+        """
+        return cls._repository._iter_all(filters or [], order_by, descending)
+
     @classmethod
     def _get(cls, entity: Union[str, EntityType], default=None) -> EntityType:
         """
         Returns an entity by id or reference.
         """
         entity_id = entity if isinstance(entity, str) else entity.id  # type: ignore
+        cache = cls._entity_cache()
+        if cache.capacity <= 0:
+            stamp = None
+        else:
+            stamp = cls._repository._get_stamp(entity_id)
+            if (cached := cache._get(entity_id, stamp)) is not None:
+                return cached
         try:
-            return cls._repository._load(entity_id)
+            loaded = cls._repository._load(entity_id)
         except ModelNotFound:
             cls._logger.error(f"{cls._ENTITY_NAME} not found: {entity_id}")
             return default
+        # The stamp is read before loading: if the entity is saved in the meantime, the stamps differ and the
+        # outdated entity is never served.
+        if stamp is not None:
+            cache._put(entity_id, stamp, loaded)
+            return cache._clone(loaded)
+        return loaded
+
+    @classmethod
+    def _get_many(cls, entities: Iterable[Union[str, EntityType]]) -> List[EntityType]:
+        """
+        Returns several entities by ids or references, in the same order. The entities not found are ignored.
+        """
+        entity_ids = [entity if isinstance(entity, str) else entity.id for entity in entities]  # type: ignore
+        cache = cls._entity_cache()
+        found: Dict[str, EntityType] = {}
+        stamps = {}
+        for entity_id in dict.fromkeys(entity_ids):
+            if cache.capacity <= 0:
+                stamps[entity_id] = None
+                continue
+            stamps[entity_id] = stamp = cls._repository._get_stamp(entity_id)
+            if (cached := cache._get(entity_id, stamp)) is not None:
+                found[entity_id] = cached
+        if missing := [entity_id for entity_id in stamps if entity_id not in found]:
+            for loaded in cls._repository._load_many(missing):
+                if (stamp := stamps[loaded.id]) is not None:  # type: ignore
+                    cache._put(loaded.id, stamp, loaded)  # type: ignore
+                    loaded = cache._clone(loaded)
+                found[loaded.id] = loaded  # type: ignore
+        for entity_id in stamps:
+            if entity_id not in found:
+                cls._logger.error(f"{cls._ENTITY_NAME} not found: {entity_id}")
+        return [found[entity_id] for entity_id in entity_ids if entity_id in found]
+
+    @classmethod
+    def _entity_cache(cls) -> _EntityCache:
+        """
+        Returns the cache of the entities loaded by this manager.
+        """
+        capacity = int(Config.core.entity_cache_size or 0)
+        if (cache := cls.__dict__.get("_cache")) is None:
+            cache = _EntityCache(capacity)
+            cls._cache = cache
+        elif cache.capacity != capacity:
+            cache._resize(capacity)
+        return cache
+
+    @classmethod
+    def _get_cache_stats(cls) -> Dict[str, int]:
+        """
+        Returns the size, capacity, hits and misses counters of the entity cache.
+        """
+        return cls._entity_cache()._stats()
 
     @classmethod
     def _exists(cls, entity_id: str) -> ReasonCollection:
@@ -0,0 +1,76 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import asyncio
+from concurrent.futures import Executor, Future
+from threading import Lock, Thread, current_thread
+from typing import Any, Callable
+
+
+class _AsyncExecutor(Executor):
+    """Executor running coroutine functions concurrently on an event loop that runs in a dedicated thread."""
+
+    def __init__(self, thread_name: str = "pyforge_async_executor"):
+        self._loop = asyncio.new_event_loop()
+        self._shutdown = False
+        self._shutdown_lock = Lock()
+        self._thread = Thread(target=self.__run_loop, name=thread_name, daemon=True)
+        self._thread.start()
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        """Schedule the coroutine function `fn(*args, **kwargs)` on the event loop."""
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot schedule new futures after shutdown.")
+            return asyncio.run_coroutine_threadsafe(fn(*args, **kwargs), self._loop)
+
+    def add_done_callback(self, future: Future, fn: Callable[[Future], Any]) -> None:
+        """Attach `fn` to a future returned by `submit()`, to be called off the event loop once it is done.
+
+        The done callbacks of the futures are otherwise called on the event loop thread, where a blocking call
+        (e.g., a repository access) stalls all the other coroutines. They are handed off to the default executor
+        of the event loop instead.
+        """
+
+        def hand_off(done_future: Future) -> None:
+            if current_thread() is self._thread:
+                self._loop.run_in_executor(None, fn, done_future)
+            else:  # The future was already done when the callback was attached.
+                fn(done_future)
+
+        future.add_done_callback(hand_off)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Stop the event loop once the scheduled coroutines are done, or cancelled if `cancel_futures` is True."""
+        with self._shutdown_lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+        drained = asyncio.run_coroutine_threadsafe(self.__drain(cancel_futures), self._loop)
+        drained.add_done_callback(lambda _: self._loop.call_soon_threadsafe(self._loop.stop))
+        if wait:
+            self._thread.join()
+
+    def __run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+            self._loop.run_until_complete(self._loop.shutdown_default_executor())
+        finally:
+            self._loop.close()
+
+    @staticmethod
+    async def __drain(cancel: bool):
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        if cancel:
+            for task in tasks:
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -10,7 +10,6 @@
 # specific language governing permissions and limitations under the License.
 
 import threading
-import time
 import traceback
 from abc import abstractmethod
 from queue import Empty
@@ -32,6 +31,8 @@ class _JobDispatcher(threading.Thread):
     _STOP_FLAG = False
     stop_wait = True
     stop_timeout = None
+    # Safety net for the jobs put in the queue without waking the dispatcher up (e.g., by a custom orchestrator).
+    _MAX_IDLE_TIME = 1.0
     _logger = _PyForgeLogger._get_logger()
 
     def __init__(self, orchestrator: _AbstractOrchestrator):
@@ -39,6 +40,7 @@ class _JobDispatcher(threading.Thread):
         self.daemon = True
         self.orchestrator = orchestrator
         self.lock = self.orchestrator.lock  # type: ignore
+        self._wake_up_condition = threading.Condition()
         Config.block_update()
 
     def start(self):
@@ -57,23 +59,32 @@ class _JobDispatcher(threading.Thread):
             timeout (Optional[float]): The maximum time to wait. If None, the method will wait indefinitely.
         """
         self._STOP_FLAG = True
+        self._wake_up()
         if wait and self.is_running():
             self._logger.debug("Waiting for the dispatcher thread to stop...")
             self.join(timeout=timeout)
 
+    def _wake_up(self):
+        """Wake the dispatcher up so that it checks again if a job can be dispatched.
+
+        This must be called each time a job is put in the queue of jobs to run or a worker becomes available.
+        """
+        with self._wake_up_condition:
+            self._wake_up_condition.notify_all()
+
     def run(self):
         self._logger.debug("Job dispatcher started.")
         while not self._STOP_FLAG:
-            if not self._can_execute():
-                time.sleep(0.2)  # We need to sleep to avoid busy waiting.
-                continue
+            with self._wake_up_condition:
+                if not self._wake_up_condition.wait_for(self.__is_ready_to_dispatch, timeout=self._MAX_IDLE_TIME):
+                    continue
 
             with self.lock:
                 self._logger.debug("Acquiring lock to check jobs to run.")
                 job = None
                 try:
                     if not self._STOP_FLAG:
-                        job = self.orchestrator.jobs_to_run.get(block=True, timeout=0.1)
+                        job = self.orchestrator.jobs_to_run.get_nowait()
                 except Empty:  # In case the last job of the queue has been removed.
                     pass
             if job:
@@ -87,6 +98,9 @@ class _JobDispatcher(threading.Thread):
                     self._logger.exception(e)
         self._logger.debug("Job dispatcher stopped.")
 
+    def __is_ready_to_dispatch(self) -> bool:
+        return self._STOP_FLAG or (not self.orchestrator.jobs_to_run.empty() and self._can_execute())
+
     @abstractmethod
     def _can_execute(self) -> bool:
         """Returns True if the dispatcher have resources to dispatch a new job."""
@@ -128,13 +142,14 @@ class _JobDispatcher(threading.Thread):
         data_manager = _DataManagerFactory._build_manager()
         if len(task.output) == 0:
             return True
-        are_outputs_in_cache = all(data_manager._get(dn.id).is_valid for dn in task.output.values())
+        outputs = data_manager._get_many(task.output.values())
+        are_outputs_in_cache = all(dn.is_valid for dn in outputs)
         if not are_outputs_in_cache:
             return True
         if len(task.input) == 0:
             return False
-        input_last_edit = max(data_manager._get(dn.id).last_edit_date for dn in task.input.values())
-        output_last_edit = min(data_manager._get(dn.id).last_edit_date for dn in task.output.values())
+        input_last_edit = max(dn.last_edit_date for dn in data_manager._get_many(task.input.values()))
+        output_last_edit = min(dn.last_edit_date for dn in outputs)
         return input_last_edit > output_last_edit
 
     @abstractmethod
@@ -9,33 +9,46 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import hashlib
 import multiprocessing as mp
-from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from functools import partial
 from threading import Lock
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional, Tuple
 
 from pyforge.common.config import Config
 from pyforge.common.config._serializer._toml_serializer import _TomlSerializer
+from pyforge.common.config.common._config_blocker import _ConfigBlocker
 
+from ...config.task_config import TaskConfig
 from ...job.job import Job
 from .._abstract_orchestrator import _AbstractOrchestrator
+from ._async_executor import _AsyncExecutor
 from ._job_dispatcher import _JobDispatcher
 from ._task_function_wrapper import _TaskFunctionWrapper
 
 
 class _StandaloneJobDispatcher(_JobDispatcher):
-    """Manages job dispatching (instances of `Job^` class) in an asynchronous way using a ProcessPoolExecutor."""
+    """Manages job dispatching (instances of `Job^` class) in an asynchronous way using a ProcessPoolExecutor.
+
+    The jobs of the tasks configured with another execution mode are dispatched to a ThreadPoolExecutor
+    (*"thread"*) or to an event loop (*"async"*), created on first use. All the executors share the same
+    number of available workers.
+    """
 
     _nb_available_workers_lock = Lock()
     _DEFAULT_MAX_NB_OF_WORKERS = 2
+    _DEFAULT_EXECUTION_MODE = TaskConfig._PROCESS_EXECUTION_MODE
+    _serialized_config: Tuple[str, str] = ("", "")
+    _serialized_config_block_id: Optional[int] = None
+    _worker_config_hash: Optional[str] = None
 
     def __init__(self, orchestrator: _AbstractOrchestrator, subproc_initializer: Optional[Callable] = None):
         super().__init__(orchestrator)
-        max_workers = Config.job_config.max_nb_of_workers or self._DEFAULT_MAX_NB_OF_WORKERS
-        self._executor: Executor = ProcessPoolExecutor(
-            max_workers=max_workers, initializer=subproc_initializer, mp_context=mp.get_context("spawn")
-        )
+        self._max_workers = Config.job_config.max_nb_of_workers or self._DEFAULT_MAX_NB_OF_WORKERS
+        self._subproc_initializer = subproc_initializer
+        self._executors: Dict[str, Executor] = {}
+        self._executor: Executor = self._create_executor(self._DEFAULT_EXECUTION_MODE)
         self._nb_available_workers = self._executor._max_workers  # type: ignore
 
     def _can_execute(self) -> bool:
@@ -47,6 +60,8 @@ class _StandaloneJobDispatcher(_JobDispatcher):
     def run(self):
         with self._executor:
             super().run()
+        for executor in self._executors.values():
+            executor.shutdown()
         self._logger.debug("Standalone job dispatcher: Pool executor shut down.")
 
     def _dispatch(self, job: Job):
@@ -58,13 +73,69 @@ class _StandaloneJobDispatcher(_JobDispatcher):
         with self._nb_available_workers_lock:
             self._nb_available_workers -= 1
             self._logger.debug(f"Setting nb_available_workers to {self._nb_available_workers} in the dispatch method.")
-        config_as_string = _TomlSerializer()._serialize(Config._applied_config)  # type: ignore[attr-defined]
+        execution_mode = self._get_execution_mode(job)
+        executor = self._get_executor(execution_mode)
+        wrapper = _TaskFunctionWrapper(job.id, job.task)
+        if execution_mode == TaskConfig._PROCESS_EXECUTION_MODE:
+            config_as_string, config_hash = self._get_serialized_config()
+            config = {"config_hash": config_hash}
+            if config_hash != self._worker_config_hash:
+                config["config_as_string"] = config_as_string
+            future = executor.submit(wrapper, **config)
+        elif execution_mode == TaskConfig._ASYNC_EXECUTION_MODE:
+            future = executor.submit(wrapper.execute_async)
+        else:
+            # The worker threads share the configuration of the current process.
+            future = executor.submit(wrapper)
+        update_job_status = partial(self._update_job_status_from_future, job)
+        if isinstance(executor, _AsyncExecutor):
+            # The job status is updated off the event loop, so as not to stall the other coroutines.
+            executor.add_done_callback(future, update_job_status)
+        else:
+            future.add_done_callback(update_job_status)
+
+    def _get_execution_mode(self, job: Job) -> str:
+        execution_mode = job.task.properties.get(TaskConfig._EXECUTION_MODE_KEY)
+        return execution_mode if execution_mode in TaskConfig._EXECUTION_MODES else self._DEFAULT_EXECUTION_MODE
+
+    def _get_executor(self, execution_mode: str) -> Executor:
+        if execution_mode == self._DEFAULT_EXECUTION_MODE:
+            return self._executor
+        if execution_mode not in self._executors:
+            self._executors[execution_mode] = self._create_executor(execution_mode)
+        return self._executors[execution_mode]
 
-        future = self._executor.submit(_TaskFunctionWrapper(job.id, job.task), config_as_string=config_as_string)
-        future.add_done_callback(partial(self._update_job_status_from_future, job))
+    def _create_executor(self, execution_mode: str) -> Executor:
+        if execution_mode == TaskConfig._THREAD_EXECUTION_MODE:
+            return ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="pyforge_worker")
+        if execution_mode == TaskConfig._ASYNC_EXECUTION_MODE:
+            return _AsyncExecutor()
+        # The workers receive the configuration once, when they start. It is only sent again along with the jobs
+        # if it changes.
+        config_as_string, self._worker_config_hash = self._get_serialized_config()
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            initializer=_TaskFunctionWrapper._initialize_worker,
+            initargs=(config_as_string, self._worker_config_hash, self._subproc_initializer),
+            mp_context=mp.get_context("spawn"),
+        )
+
+    def _get_serialized_config(self) -> Tuple[str, str]:
+        """Return the applied configuration serialized as a string, and its hash.
+
+        The configuration is only serialized again if it may have been updated since the previous call.
+        """
+        block_id = _ConfigBlocker._block_id()
+        if block_id is None or block_id != self._serialized_config_block_id:
+            config_as_string = _TomlSerializer()._serialize(Config._applied_config)  # type: ignore[attr-defined]
+            config_hash = hashlib.sha256(config_as_string.encode("utf-8")).hexdigest()
+            self._serialized_config = (config_as_string, config_hash)
+            self._serialized_config_block_id = block_id
+        return self._serialized_config
 
     def _update_job_status_from_future(self, job: Job, ft):
         with self._nb_available_workers_lock:
             self._nb_available_workers += 1
             self._logger.debug(f"Setting nb_available_workers to {self._nb_available_workers} in the callback method.")
+        self._wake_up()
         self._update_job_status(job, ft.result())
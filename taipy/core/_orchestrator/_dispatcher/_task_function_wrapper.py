@@ -9,7 +9,9 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Any, List
+import asyncio
+import inspect
+from typing import Any, Callable, List, Optional
 
 from pyforge.common.config import Config
 from pyforge.common.config._serializer._toml_serializer import _TomlSerializer
@@ -27,6 +29,10 @@ logger = _PyForgeLogger._get_logger()
 class _TaskFunctionWrapper:
     """Wrapper around task function."""
 
+    # The configuration a worker process was initialized with, and the hash of the configuration it applied.
+    _worker_config_as_string: Optional[str] = None
+    _applied_config_hash: Optional[str] = None
+
     def __init__(self, job_id: JobId, task: Task):
         self.job_id = job_id
         self.task = task
@@ -35,23 +41,68 @@ class _TaskFunctionWrapper:
         """Make this object callable as a function. Actually calls `execute`."""
         return self.execute(**kwargs)
 
+    @classmethod
+    def _initialize_worker(
+        cls, config_as_string: str, config_hash: str, subproc_initializer: Optional[Callable] = None
+    ) -> None:
+        """Initialize a worker process with the configuration, so that it is not sent along with each job."""
+        if subproc_initializer:
+            subproc_initializer()
+        cls._worker_config_as_string = config_as_string
+        cls.__apply_config(config_as_string, config_hash)
+
+    @classmethod
+    def __apply_config(cls, config_as_string: str, config_hash: Optional[str]) -> None:
+        Config._applied_config._update(_TomlSerializer()._deserialize(config_as_string))
+        Config.block_update()
+        cls._applied_config_hash = config_hash
+
     def execute(self, **kwargs):
-        """Execute the wrapped function. If `config_as_string` is given, then it will be reapplied to the config."""
+        """Execute the wrapped function.
+
+        If `config_as_string` is given, then it will be reapplied to the config, unless its `config_hash` is the
+        hash of the config already applied. If only `config_hash` is given, the config the worker was initialized
+        with is reapplied if another config was applied in the meantime.
+        """
         try:
-            if config_as_string := kwargs.pop("config_as_string", None):
-                Config._applied_config._update(_TomlSerializer()._deserialize(config_as_string))
-                Config.block_update()
+            config_as_string = kwargs.pop("config_as_string", None)
+            config_hash = kwargs.pop("config_hash", None)
+            if config_hash is not None and config_as_string is None:
+                config_as_string = self._worker_config_as_string
+            if config_as_string and (config_hash is None or config_hash != self._applied_config_hash):
+                self.__apply_config(config_as_string, config_hash)
 
             inputs = list(self.task.input.values())
             outputs = list(self.task.output.values())
 
             arguments = self._read_inputs(inputs)
             results = self._execute_fct(arguments)
+            if inspect.iscoroutine(results):
+                results = asyncio.run(results)
             return self._write_data(outputs, results, self.job_id)
         except Exception as e:
             logger.error("Error during task function execution!", exc_info=1)
             return [e]
 
+    async def execute_async(self):
+        """Execute the wrapped function on the running event loop.
+
+        The inputs are read and the outputs are written in a separate thread, so that the event loop is free to
+        run other jobs in the meantime.
+        """
+        try:
+            inputs = list(self.task.input.values())
+            outputs = list(self.task.output.values())
+
+            arguments = await asyncio.to_thread(self._read_inputs, inputs)
+            results = self._execute_fct(arguments)
+            if inspect.isawaitable(results):
+                results = await results
+            return await asyncio.to_thread(self._write_data, outputs, results, self.job_id)
+        except Exception as e:
+            logger.error("Error during task function execution!", exc_info=1)
+            return [e]
+
     def _read_inputs(self, inputs: List[DataNode]) -> List[Any]:
         data_manager = _DataManagerFactory._build_manager()
         return [data_manager._get(dn.id).read_or_raise() for dn in inputs]
@@ -0,0 +1,23 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from ...config.task_config import TaskConfig
+from ._standalone_job_dispatcher import _StandaloneJobDispatcher
+
+
+class _ThreadedJobDispatcher(_StandaloneJobDispatcher):
+    """Manages job dispatching (instances of `Job^` class) in an asynchronous way using a ThreadPoolExecutor.
+
+    The jobs run in worker threads of the current process, which suits the I/O-bound tasks. The tasks can
+    still be configured to run in worker processes (*"process"*) or on an event loop (*"async"*).
+    """
+
+    _DEFAULT_EXECUTION_MODE = TaskConfig._THREAD_EXECUTION_MODE
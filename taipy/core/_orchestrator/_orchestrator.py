@@ -11,19 +11,21 @@
 
 import itertools
 from datetime import datetime
-from queue import Queue
+from queue import Empty, Queue, SimpleQueue
 from threading import Lock
 from time import sleep
-from typing import Callable, Iterable, List, Optional, Set, Union
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from pyforge.common.config import Config
 from pyforge.common.logger._pyforge_logger import _PyForgeLogger
 
 from .._entity.submittable import Submittable
 from ..data._data_manager_factory import _DataManagerFactory
+from ..data.data_node import DataNode
 from ..job._job_manager_factory import _JobManagerFactory
 from ..job.job import Job
 from ..job.job_id import JobId
+from ..notification import EventEntityType, EventOperation, Notifier
 from ..submission._submission_manager_factory import _SubmissionManagerFactory
 from ..submission.submission import Submission
 from ..task.task import Task
@@ -38,6 +40,14 @@ class _Orchestrator(_AbstractOrchestrator):
     jobs_to_run: Queue = Queue()
     blocked_jobs: List[Job] = []
 
+    # Index of the blocked jobs by the ids of the input data nodes they wait for, and the other way around.
+    # When a job completes, only the jobs waiting for its outputs are checked again.
+    __jobs_waiting_for: Dict[str, Dict[JobId, Job]] = {}
+    __awaited_inputs: Dict[JobId, Set[str]] = {}
+    # Registration to the data node updates, only while some jobs are blocked, to also check again the jobs
+    # waiting for the data nodes unlocked outside of the execution of the jobs (e.g., written by a user).
+    __data_node_updates: Optional[Tuple[str, SimpleQueue]] = None
+
     lock = Lock()
     __logger = _PyForgeLogger._get_logger()
 
@@ -170,8 +180,8 @@ class _Orchestrator(_AbstractOrchestrator):
     @classmethod
     def _update_submission_status(cls, job: Job) -> None:
         submission_manager = _SubmissionManagerFactory._build_manager()
-        if submission := submission_manager._get(job.submit_id):
-            submission_manager._update_submission_status(submission, job)
+        if submission_manager._exists(job.submit_id):
+            submission_manager._update_submission_status(job.submit_id, job)
         else:
             submissions = submission_manager._get_all()
             cls.__logger.error(f"Submission {job.submit_id} not found.")
@@ -198,9 +208,16 @@ class _Orchestrator(_AbstractOrchestrator):
                 job.pending()
                 pending_jobs.append(job)
 
+        cls.__sync_blocked_jobs_index()
+        if blocked_jobs and (not cls.blocked_jobs or cls.__data_node_updates is None):
+            cls.__start_watching_unlocked_data_nodes()
         cls.blocked_jobs.extend(blocked_jobs)
+        for job in blocked_jobs:
+            cls.__index_blocked_job(job)
         for job in pending_jobs:
             cls.jobs_to_run.put(job)
+        if pending_jobs:
+            cls.__wake_up_dispatcher()
 
     @classmethod
     def _wait_until_job_finished(cls, jobs: Union[List[Job], Job], timeout: Optional[Union[float, int]] = None) -> None:
@@ -234,7 +251,7 @@ class _Orchestrator(_AbstractOrchestrator):
         """
         input_data_nodes = obj.task.input.values() if isinstance(obj, Job) else obj.input.values()
         data_manager = _DataManagerFactory._build_manager()
-        return any(not data_manager._get(dn.id).is_ready_for_reading for dn in input_data_nodes)
+        return any(not dn.is_ready_for_reading for dn in data_manager._get_many(input_data_nodes))
 
     @staticmethod
     def _unlock_edit_on_jobs_outputs(jobs: Union[Job, List[Job], Set[Job]]) -> None:
@@ -246,15 +263,25 @@ class _Orchestrator(_AbstractOrchestrator):
     def _on_status_change(cls, job: Job) -> None:
         if job.is_completed() or job.is_skipped():
             cls.__logger.debug(f"{job.id} has been completed or skipped. Unblocking jobs.")
-            cls.__unblock_jobs()
+            cls.__unblock_jobs(job.task.output.values())
         elif job.is_failed():
             cls._fail_subsequent_jobs(job)
 
     @classmethod
-    def __unblock_jobs(cls) -> None:
+    def __unblock_jobs(cls, written_data_nodes: Iterable[DataNode]) -> None:
         with cls.lock:
             cls.__logger.debug("Acquiring lock to unblock jobs.")
-            for job in cls.blocked_jobs:
+            candidates = cls.__sync_blocked_jobs_index()
+            data_node_ids = cls.__pop_unlocked_data_node_ids()
+            data_node_ids.update(data_node.id for data_node in written_data_nodes)
+            for data_node_id in data_node_ids:
+                for job in cls.__jobs_waiting_for.pop(data_node_id, {}).values():
+                    awaited_inputs = cls.__awaited_inputs[job.id]
+                    awaited_inputs.discard(data_node_id)
+                    if not awaited_inputs:
+                        del cls.__awaited_inputs[job.id]
+                        candidates.append(job)
+            for job in candidates:
                 if not cls._is_blocked(job):
                     cls.__logger.debug(f"Unblocking job: {job.id}.")
                     job.pending()
@@ -262,14 +289,80 @@ class _Orchestrator(_AbstractOrchestrator):
                     cls.__remove_blocked_job(job)
                     cls.__logger.debug(f"Adding job {job.id} to the list of jobs to run.")
                     cls.jobs_to_run.put(job)
+                    cls.__wake_up_dispatcher()
+                else:
+                    # One of its inputs is locked again, by another job or by another user.
+                    cls.__index_blocked_job(job)
+            cls.__stop_watching_unlocked_data_nodes_if_no_blocked_job()
 
     @classmethod
     def __remove_blocked_job(cls, job: Job) -> None:
+        cls.__unindex_blocked_job(job.id)
         try:  # In case the job has been removed from the list of blocked_jobs.
             cls.blocked_jobs.remove(job)
         except Exception:
             cls.__logger.warning(f"{job.id} is not in the blocked list anymore.")
 
+    @classmethod
+    def __index_blocked_job(cls, job: Job) -> None:
+        data_manager = _DataManagerFactory._build_manager()
+        input_data_nodes = data_manager._get_many(job.task.input.values())
+        if awaited_inputs := {dn.id for dn in input_data_nodes if not dn.is_ready_for_reading}:
+            cls.__awaited_inputs[job.id] = awaited_inputs
+            for dn_id in awaited_inputs:
+                cls.__jobs_waiting_for.setdefault(dn_id, {})[job.id] = job
+        # Otherwise, the job is not indexed and is checked again each time a job completes.
+
+    @classmethod
+    def __unindex_blocked_job(cls, job_id: JobId) -> None:
+        for dn_id in cls.__awaited_inputs.pop(job_id, ()):
+            if (waiting_jobs := cls.__jobs_waiting_for.get(dn_id)) is not None:
+                waiting_jobs.pop(job_id, None)
+                if not waiting_jobs:
+                    del cls.__jobs_waiting_for[dn_id]
+
+    @classmethod
+    def __start_watching_unlocked_data_nodes(cls) -> None:
+        if cls.__data_node_updates is not None:
+            # The list of blocked jobs has been reset without going through the orchestrator.
+            Notifier.unregister(cls.__data_node_updates[0])
+        cls.__data_node_updates = Notifier.register(
+            EventEntityType.DATA_NODE, operation=EventOperation.UPDATE, attribute_name="edit_in_progress"
+        )
+
+    @classmethod
+    def __stop_watching_unlocked_data_nodes_if_no_blocked_job(cls) -> None:
+        if not cls.blocked_jobs and cls.__data_node_updates is not None:
+            Notifier.unregister(cls.__data_node_updates[0])
+            cls.__data_node_updates = None
+
+    @classmethod
+    def __pop_unlocked_data_node_ids(cls) -> Set[str]:
+        data_node_ids: Set[str] = set()
+        if cls.__data_node_updates is None:
+            return data_node_ids
+        _, data_node_updates = cls.__data_node_updates
+        while True:
+            try:
+                event = data_node_updates.get_nowait()
+            except Empty:
+                return data_node_ids
+            if not event.attribute_value:
+                data_node_ids.add(event.entity_id)
+
+    @classmethod
+    def __sync_blocked_jobs_index(cls) -> List[Job]:
+        """Reconcile the index with the list of blocked jobs, and return the blocked jobs that are not indexed.
+
+        The list of blocked jobs may be modified without going through the orchestrator (e.g., reset).
+        """
+        blocked_job_ids = {job.id for job in cls.blocked_jobs}
+        if blocked_job_ids == cls.__awaited_inputs.keys():
+            return []
+        for job_id in [job_id for job_id in cls.__awaited_inputs if job_id not in blocked_job_ids]:
+            cls.__unindex_blocked_job(job_id)
+        return [job for job in cls.blocked_jobs if job.id not in cls.__awaited_inputs]
+
     @classmethod
     def cancel_job(cls, job: Job) -> None:
         if job.is_canceled():
@@ -284,6 +377,7 @@ class _Orchestrator(_AbstractOrchestrator):
                 to_cancel_or_abandon_jobs = {job}
                 to_cancel_or_abandon_jobs.update(cls.__find_subsequent_jobs(job.submit_id, set(job.task.output.keys())))
                 cls.__remove_blocked_jobs(to_cancel_or_abandon_jobs)
+                cls.__stop_watching_unlocked_data_nodes_if_no_blocked_job()
                 cls.__remove_jobs_to_run(to_cancel_or_abandon_jobs)
                 cls._cancel_jobs(job.id, to_cancel_or_abandon_jobs)
                 cls._unlock_edit_on_jobs_outputs(to_cancel_or_abandon_jobs)
@@ -329,6 +423,7 @@ class _Orchestrator(_AbstractOrchestrator):
                 job.abandoned()
             to_fail_or_abandon_jobs.update([failed_job])
             cls.__remove_blocked_jobs(to_fail_or_abandon_jobs)
+            cls.__stop_watching_unlocked_data_nodes_if_no_blocked_job()
             cls.__remove_jobs_to_run(to_fail_or_abandon_jobs)
             cls._unlock_edit_on_jobs_outputs(to_fail_or_abandon_jobs)
 
@@ -346,6 +441,13 @@ class _Orchestrator(_AbstractOrchestrator):
             else:
                 job.abandoned()
 
+    @staticmethod
+    def __wake_up_dispatcher() -> None:
+        from ._orchestrator_factory import _OrchestratorFactory
+
+        if dispatcher := _OrchestratorFactory._dispatcher:
+            dispatcher._wake_up()
+
     @staticmethod
     def _check_and_execute_jobs_if_development_mode() -> None:
         from ._orchestrator_factory import _OrchestratorFactory
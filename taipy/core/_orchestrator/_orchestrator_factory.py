@@ -17,7 +17,7 @@ from ..common._check_dependencies import EnterpriseEditionUtils
 from ..common._utils import _load_fct
 from ..exceptions.exceptions import ModeNotAvailable, OrchestratorNotBuilt
 from ._abstract_orchestrator import _AbstractOrchestrator
-from ._dispatcher import _DevelopmentJobDispatcher, _JobDispatcher, _StandaloneJobDispatcher
+from ._dispatcher import _DevelopmentJobDispatcher, _JobDispatcher, _StandaloneJobDispatcher, _ThreadedJobDispatcher
 from ._orchestrator import _Orchestrator
 
 
@@ -58,6 +58,8 @@ class _OrchestratorFactory:
             cls.__build_enterprise_job_dispatcher(force_restart=force_restart)
         elif Config.job_config.is_standalone:
             cls.__build_standalone_job_dispatcher(force_restart=force_restart)
+        elif Config.job_config.is_threaded:
+            cls.__build_standalone_job_dispatcher(_ThreadedJobDispatcher, force_restart=force_restart)
         elif Config.job_config.is_development:
             cls.__build_development_job_dispatcher()
         else:
@@ -73,19 +75,20 @@ class _OrchestratorFactory:
         return cls._dispatcher
 
     @classmethod
-    def __build_standalone_job_dispatcher(cls, force_restart=False):
+    def __build_standalone_job_dispatcher(
+        cls, dispatcher_type: Type[_StandaloneJobDispatcher] = _StandaloneJobDispatcher, force_restart=False
+    ):
         if isinstance(cls._dispatcher, _StandaloneJobDispatcher):
-            if force_restart:
-                cls._dispatcher.stop()
-            else:
+            if type(cls._dispatcher) is dispatcher_type and not force_restart:
                 return
+            cls._dispatcher.stop()
 
         if EnterpriseEditionUtils._using_enterprise():
             cls._dispatcher = _load_fct(
                 cls._TAIPY_ENTERPRISE_CORE_DISPATCHER_MODULE, cls.__TAIPY_ENTERPRISE_BUILD_DISPATCHER_METHOD
             )(cls._orchestrator)
         else:
-            cls._dispatcher = _StandaloneJobDispatcher(typing.cast(_AbstractOrchestrator, cls._orchestrator))
+            cls._dispatcher = dispatcher_type(typing.cast(_AbstractOrchestrator, cls._orchestrator))
         cls._dispatcher.start()  # type: ignore
 
     @classmethod
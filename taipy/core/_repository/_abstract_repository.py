@@ -12,10 +12,13 @@
 import json
 import pathlib
 from abc import abstractmethod
-from typing import Any, Dict, Generic, Iterable, List, Optional, TypeVar, Union
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Generic, Hashable, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
 
-from ..exceptions import FileCannotBeRead
+from ..exceptions import FileCannotBeRead, ModelNotFound
 from ._decoder import _Decoder
+from ._range import _Range
 
 ModelType = TypeVar("ModelType")
 Entity = TypeVar("Entity")
@@ -32,6 +35,16 @@ class _AbstractRepository(Generic[ModelType, Entity]):
         """
         raise NotImplementedError
 
+    def _save_many(self, entities: Iterable[Entity]):
+        """
+        Save several entities in the repository at once.
+
+        Arguments:
+            entities: The entities to save.
+        """
+        for entity in entities:
+            self._save(entity)
+
     @abstractmethod
     def _exists(self, entity_id: str) -> bool:
         """
@@ -56,6 +69,24 @@ class _AbstractRepository(Generic[ModelType, Entity]):
         """
         raise NotImplementedError
 
+    def _load_many(self, entity_ids: Iterable[str]) -> List[Entity]:
+        """
+        Retrieve several entities from the repository at once.
+
+        Arguments:
+            entity_ids: The entity ids, i.e., their primary keys.
+
+        Returns:
+            The list of the entities found, in the order of the ids. The ids that do not exist are ignored.
+        """
+        entities = []
+        for entity_id in entity_ids:
+            try:
+                entities.append(self._load(entity_id))
+            except ModelNotFound:
+                continue
+        return entities
+
     @abstractmethod
     def _load_all(self, filters: Optional[List[Dict]] = None) -> List[Entity]:
         """
@@ -66,6 +97,86 @@ class _AbstractRepository(Generic[ModelType, Entity]):
         """
         raise NotImplementedError
 
+    def _load_latest(self, filters: Optional[List[Dict]] = None) -> Optional[Entity]:
+        """
+        Retrieve the most recently created entity matching the filters.
+
+        Arguments:
+            filters: The filters the entity must match at least one of.
+
+        Returns:
+            The entity with the latest creation date, or None if no entity matches the filters.
+        """
+        entities = self._load_all(filters)
+        return max(entities, key=lambda entity: entity._creation_date) if entities else None  # type: ignore
+
+    def _load_created_since(self, since: datetime, filters: Optional[List[Dict]] = None) -> List[Entity]:
+        """
+        Retrieve the entities created at or after a date and matching the filters.
+
+        Arguments:
+            since: The minimum creation date of the entities.
+            filters: The filters the entities must match at least one of.
+
+        Returns:
+            A list of entities.
+        """
+        return self._load_all([{**_filter, "creation_date": _Range(since)} for _filter in filters or [{}]])
+
+    def _load_page(
+        self,
+        filters: Optional[List[Dict]] = None,
+        order_by: str = "id",
+        descending: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Entity]:
+        """
+        Retrieve a page of the entities matching the filters, sorted by one of their stored attributes.
+
+        Arguments:
+            filters: The filters the entities must match at least one of.
+            order_by: The name of the stored attribute to sort the entities by. The entities with the same
+                value are sorted by id.
+            descending: If True, the entities are sorted in descending order.
+            offset: The number of matching entities to skip.
+            limit: The maximum number of entities to return. None returns all the remaining entities.
+
+        Returns:
+            A list of entities.
+        """
+        end = None if limit is None else offset + limit
+        return list(islice(self._iter_all(filters, order_by, descending), offset, end))
+
+    def _iter_all(
+        self, filters: Optional[List[Dict]] = None, order_by: str = "id", descending: bool = False
+    ) -> Iterator[Entity]:
+        """
+        Iterate over the entities matching the filters, sorted by one of their stored attributes.
+
+        Repositories able to sort the entities without loading them load each entity as the iteration
+        reaches it. By default, all the matching entities are loaded first.
+
+        Arguments:
+            filters: The filters the entities must match at least one of.
+            order_by: The name of the stored attribute to sort the entities by. The entities with the same
+                value are sorted by id.
+            descending: If True, the entities are sorted in descending order.
+
+        Returns:
+            An iterator over the entities.
+        """
+        keys = {}
+        for entity in self._load_all(filters):
+            model_dict = self.converter._entity_to_model(entity).to_dict()  # type: ignore[attr-defined]
+            keys[model_dict["id"]] = (self._order_key(model_dict.get(order_by), model_dict["id"]), entity)
+        return iter([entity for _, entity in sorted(keys.values(), key=lambda item: item[0], reverse=descending)])
+
+    @staticmethod
+    def _order_key(value: Any, entity_id: str) -> Tuple:
+        # The entities without value come first, as they do in SQL.
+        return (value is not None, "" if value is None else value, entity_id)
+
     @abstractmethod
     def _delete(self, entity_id: str):
         """
@@ -127,6 +238,22 @@ class _AbstractRepository(Generic[ModelType, Entity]):
         """
         raise NotImplementedError
 
+    def _get_stamp(self, entity_id: str) -> Optional[Hashable]:
+        """
+        Return a cheap fingerprint of the stored version of an entity.
+
+        The fingerprint changes each time the entity is saved. It is used by the managers to know if an entity they
+        keep in memory is still up to date without loading it. Repositories that cannot provide such a fingerprint
+        return None, which disables the entity cache.
+
+        Arguments:
+            entity_id: The entity id, i.e., its primary key.
+
+        Returns:
+            The fingerprint of the entity, or None if it is unknown or if the entity does not exist.
+        """
+        return None
+
     def _import(self, entity_file_path: pathlib.Path) -> Entity:
         """
         Import an entity from an exported file.
@@ -0,0 +1,416 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import heapq
+import json
+import os
+import pathlib
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ._abstract_repository import _AbstractRepository
+from ._encoder import _Encoder
+from ._range import _Range
+
+
+class _FileSystemIndex:
+    """
+    Catalog of the identity attributes of the entities stored in a folder by a `_FileSystemRepository^`.
+
+    The catalog is kept in memory and persisted as an append-only JSON lines sidecar file located in the
+    entity folder. Each line either sets the indexed attributes of an entity or marks it as deleted. The
+    file is replayed incrementally, so that entities saved by other processes sharing the same storage
+    folder are picked up, and it is compacted once it holds too many obsolete lines.
+
+    The folder content is the source of truth: whenever the folder changes without the sidecar file
+    knowing it (e.g., files copied or removed by hand, or an index written by a former version), the
+    catalog is reconciled with the list of entity files. Only the files missing from the catalog are read.
+    The first line of the sidecar file lists the indexed attributes: a file written for other attributes
+    is rebuilt from the entity files.
+
+    When the creation date is indexed, the most recently created entity of each indexed value is
+    tracked as well, so that the latest entity matching a filter is usually found without any scan.
+
+    Attributes:
+        dir_path (pathlib.Path): The folder holding the entity files.
+        attributes (Tuple[str, ...]): The names of the model attributes to index.
+    """
+
+    _INDEX_FILE_NAME = ".index"
+    _COMPACTION_MIN_OBSOLETE_LINES = 1000
+    _DELETED_KEY = "__deleted__"
+    _ATTRIBUTES_KEY = "__attributes__"
+    _ORDER_ATTRIBUTE = "creation_date"
+
+    def __init__(self, dir_path: pathlib.Path, attributes: Tuple[str, ...]):
+        self.dir_path = dir_path
+        self.attributes = attributes
+        self._lock = threading.RLock()
+        self.__reset()
+
+    @property
+    def _index_path(self) -> pathlib.Path:
+        return self.dir_path / self._INDEX_FILE_NAME
+
+    ###########################
+    # ##   Query methods   ## #
+    ###########################
+
+    def _get(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._sync()
+            return self.__records.get(entity_id)
+
+    def _ids(self) -> List[str]:
+        with self._lock:
+            self._sync()
+            return list(self.__records)
+
+    def _match(self, filters: Optional[List[Dict]] = None) -> Dict[str, Optional[List[Dict]]]:
+        """Return the ids of the entities matching at least one of the filters.
+
+        Each id is associated with the filters that could not be resolved by the index and that must
+        still be checked against the entity file content. `None` means the entity matches for sure.
+        The indexed attributes can be filtered by a `_Range` of values.
+        """
+        with self._lock:
+            self._sync()
+            if not filters:
+                return dict.fromkeys(self.__records)
+
+            res: Dict[str, Optional[List[Dict]]] = {}
+            for _filter in filters:
+                indexed = {k: v for k, v in _filter.items() if k in self.attributes}
+                residual = {k: v for k, v in _filter.items() if k not in self.attributes}
+                for entity_id in self.__lookup(indexed):
+                    if not residual:
+                        res[entity_id] = None
+                    elif entity_id not in res:
+                        res[entity_id] = [residual]
+                    elif (residuals := res[entity_id]) is not None:
+                        residuals.append(residual)
+            return res
+
+    def _sorted(
+        self, entity_ids: Iterable[str], attribute: str, descending: bool = False, count: Optional[int] = None
+    ) -> List[str]:
+        """Sort entity ids by the value of an indexed attribute, or by id, then by id.
+
+        If *count* is provided, only the first *count* ids are returned.
+        """
+        with self._lock:
+            records = self.__records
+            if attribute == "id":
+                key = None
+            else:
+
+                def key(entity_id: str):
+                    return _AbstractRepository._order_key(records[entity_id].get(attribute), entity_id)
+
+            if count is None:
+                return sorted(entity_ids, key=key, reverse=descending)
+            return (heapq.nlargest if descending else heapq.nsmallest)(count, entity_ids, key=key)
+
+    def _latest(self, filters: Optional[List[Dict]] = None) -> Optional[str]:
+        """Return the id of the most recently created entity matching at least one of the filters.
+
+        The filters can only hold indexed attributes.
+        """
+        with self._lock:
+            self._sync()
+            latest_ids = [self.__latest_matching(_filter) for _filter in filters or [{}]]
+            return self.__max_by_order([entity_id for entity_id in latest_ids if entity_id is not None])
+
+    ############################
+    # ##   Update methods   ## #
+    ############################
+
+    def _put(self, entity_id: str, model_dict: Dict[str, Any]):
+        self._put_many([(entity_id, model_dict)])
+
+    def _put_many(self, models: Iterable[Tuple[str, Dict[str, Any]]]):
+        with self._lock:
+            self._sync()
+            self.__put_many(models)
+
+    def _remove_many(self, entity_ids: Iterable[str]):
+        with self._lock:
+            self._sync()
+            self.__remove_many(entity_ids)
+
+    def _clear(self):
+        with self._lock:
+            self.__reset()
+
+    def _track_folder_change(self, before: Optional[Tuple[int, int]]):
+        """Acknowledge a folder change made by the repository itself to avoid a useless reconciliation."""
+        with self._lock:
+            if before is not None and before == self.__dir_stat:
+                self.__dir_stat = self.__stat(self.dir_path)
+
+    def _folder_stat(self) -> Optional[Tuple[int, int]]:
+        return self.__stat(self.dir_path)
+
+    #######################################
+    # ##   Synchronization with disk   ## #
+    #######################################
+
+    def _sync(self):
+        dir_stat = self.__stat(self.dir_path)
+        if dir_stat is None:
+            self.__reset()
+            return
+        self.__replay_index_file()
+        if dir_stat != self.__dir_stat and self.__reconcile():
+            self.__dir_stat = self.__stat(self.dir_path)
+        if self.__rebuild:
+            self.__compact()
+
+    def __replay_index_file(self):
+        try:
+            stat = self._index_path.stat()
+        except FileNotFoundError:
+            if self.__file_id is not None:
+                self.__reset()
+            return
+
+        if self.__file_id != stat.st_ino or stat.st_size < self.__offset:
+            # The index file was compacted or recreated.
+            self.__reset_records()
+            self.__file_id = stat.st_ino
+        if stat.st_size == self.__offset:
+            return
+
+        with self._index_path.open("rb") as f:
+            f.seek(self.__offset)
+            content = f.read()
+        # A line being written by another process is ignored until it is complete.
+        content = content[: content.rfind(b"\n") + 1]
+        lines = content.splitlines()
+        if self.__offset == 0 and lines:
+            if self.__read_attributes(lines[0]) != list(self.attributes):
+                # The file was written for other attributes: the catalog is rebuilt from the entity files.
+                self.__offset = len(content)
+                self.__dir_stat = None
+                self.__rebuild = True
+                return
+            lines = lines[1:]
+        self.__offset += len(content)
+        for line in lines:
+            try:
+                record = json.loads(line)
+                entity_id = record.pop("id")
+            except (ValueError, KeyError):
+                continue
+            self.__lines += 1
+            self.__apply(entity_id, None if record.get(self._DELETED_KEY) else record)
+
+    def __reconcile(self) -> bool:
+        try:
+            on_disk = {f[:-5] for f in os.listdir(self.dir_path) if f.endswith(".json")}
+        except FileNotFoundError:
+            self.__reset()
+            return False
+
+        self.__remove_many([entity_id for entity_id in self.__records if entity_id not in on_disk])
+
+        complete = True
+        added = []
+        for entity_id in on_disk.difference(self.__records):
+            try:
+                with (self.dir_path / f"{entity_id}.json").open("r", encoding="UTF-8") as f:
+                    added.append((entity_id, json.load(f)))
+            except (OSError, ValueError):
+                # The file may be being written. It will be indexed during the next reconciliation.
+                complete = False
+        self.__put_many(added)
+        return complete
+
+    ###############################
+    # ##   Private utilities   ## #
+    ###############################
+
+    def __put_many(self, models: Iterable[Tuple[str, Dict[str, Any]]]):
+        lines = []
+        for entity_id, model_dict in models:
+            record = self.__to_record(model_dict)
+            if self.__records.get(entity_id) != record:
+                self.__apply(entity_id, record)
+                lines.append({"id": entity_id, **record})
+        self.__append(lines)
+
+    def __remove_many(self, entity_ids: Iterable[str]):
+        lines = []
+        for entity_id in entity_ids:
+            if entity_id in self.__records:
+                self.__apply(entity_id, None)
+                lines.append({"id": entity_id, self._DELETED_KEY: True})
+        self.__append(lines)
+
+    def __reset(self):
+        self.__dir_stat: Optional[Tuple[int, int]] = None
+        self.__reset_records()
+
+    def __reset_records(self):
+        self.__records: Dict[str, Dict[str, Any]] = {}
+        self.__values: Dict[str, Dict[Any, Set[str]]] = {attribute: {} for attribute in self.attributes}
+        self.__latest: Dict[Tuple[str, Any], str] = {}
+        self.__file_id: Optional[int] = None
+        self.__offset = 0
+        self.__lines = 0
+        self.__rebuild = False
+
+    def __to_record(self, model_dict: Dict[str, Any]) -> Dict[str, Any]:
+        return {attribute: model_dict[attribute] for attribute in self.attributes if attribute in model_dict}
+
+    def __lookup(self, indexed_filter: Dict[str, Any]) -> Iterable[str]:
+        ranges = {k: _Range(*v._bounds()) for k, v in indexed_filter.items() if isinstance(v, _Range)}
+        if not ranges:
+            return self.__lookup_values(indexed_filter)
+        candidates = self.__lookup_values({k: v for k, v in indexed_filter.items() if k not in ranges})
+        return [
+            entity_id
+            for entity_id in candidates
+            if all(_range._contains(self.__records[entity_id].get(k)) for k, _range in ranges.items())
+        ]
+
+    def __lookup_values(self, indexed_filter: Dict[str, Any]) -> Iterable[str]:
+        if not indexed_filter:
+            return self.__records
+        sets = sorted((self.__values[k].get(v, set()) for k, v in indexed_filter.items()), key=len)
+        if not sets[0]:
+            return ()
+        # Preserve the insertion order of the records.
+        candidates = set.intersection(*sets)
+        return [entity_id for entity_id in self.__records if entity_id in candidates] if len(sets) > 1 else sets[0]
+
+    def __apply(self, entity_id: str, record: Optional[Dict[str, Any]]):
+        if old := self.__records.pop(entity_id, None):
+            for attribute, value in old.items():
+                for v in self.__hashable_values(value):
+                    if (ids := self.__values[attribute].get(v)) is not None:
+                        ids.discard(entity_id)
+                        if not ids:
+                            del self.__values[attribute][v]
+                    if self.__latest.get((attribute, v)) == entity_id:
+                        # Computed again when needed.
+                        del self.__latest[(attribute, v)]
+        if record is None:
+            return
+        self.__records[entity_id] = record
+        order_key = self.__order_key(record)
+        for attribute, value in record.items():
+            if attribute not in self.__values:
+                continue
+            for v in self.__hashable_values(value):
+                ids = self.__values[attribute].setdefault(v, set())
+                ids.add(entity_id)
+                if order_key is None:
+                    continue
+                latest_id = self.__latest.get((attribute, v))
+                if latest_id is None and len(ids) == 1:
+                    self.__latest[(attribute, v)] = entity_id
+                elif latest_id is not None and order_key > self.__order_key(self.__records[latest_id]):
+                    self.__latest[(attribute, v)] = entity_id
+
+    def __latest_matching(self, indexed_filter: Dict[str, Any]) -> Optional[str]:
+        if not indexed_filter:
+            return self.__max_by_order(self.__records)
+        if any(isinstance(value, _Range) for value in indexed_filter.values()):
+            return self.__max_by_order(self.__lookup(indexed_filter))
+        for attribute, value in indexed_filter.items():
+            # The latest entity of one of the values is the answer if it also matches the other values.
+            if (latest_id := self.__latest_of(attribute, value)) is None:
+                return None
+            if all(self.__has_value(latest_id, k, v) for k, v in indexed_filter.items() if k != attribute):
+                return latest_id
+        return self.__max_by_order(self.__lookup(indexed_filter))
+
+    def __latest_of(self, attribute: str, value: Any) -> Optional[str]:
+        if (latest_id := self.__latest.get((attribute, value))) is not None:
+            return latest_id
+        if latest_id := self.__max_by_order(self.__values[attribute].get(value, ())):
+            self.__latest[(attribute, value)] = latest_id
+        return latest_id
+
+    def __has_value(self, entity_id: str, attribute: str, value: Any) -> bool:
+        return entity_id in self.__values[attribute].get(value, ())
+
+    def __max_by_order(self, entity_ids: Iterable[str]) -> Optional[str]:
+        latest_id, latest_key = None, None
+        for entity_id in entity_ids:
+            key = self.__order_key(self.__records[entity_id])
+            if key is not None and (latest_key is None or key > latest_key):
+                latest_id, latest_key = entity_id, key
+        return latest_id
+
+    def __order_key(self, record: Dict[str, Any]) -> Optional[str]:
+        # The creation dates are ISO formatted strings, which sort in chronological order.
+        return record.get(self._ORDER_ATTRIBUTE)
+
+    @staticmethod
+    def __hashable_values(value) -> Iterable:
+        if isinstance(value, (list, tuple, set)):
+            return [v for v in value if not isinstance(v, (dict, list))]
+        if isinstance(value, dict):
+            return ()
+        return (value,)
+
+    def __append(self, lines: List[Dict[str, Any]]):
+        if not lines:
+            return
+        content = "".join(json.dumps(line, ensure_ascii=False, cls=_Encoder) + "\n" for line in lines)
+        before = self.__stat(self.dir_path)
+        try:
+            with self._index_path.open("a", encoding="UTF-8") as f:
+                if f.tell() == 0:
+                    content = self.__attributes_line() + content
+                f.write(content)
+        except FileNotFoundError:
+            return
+        self._track_folder_change(before)
+        # Lines appended by other processes in the meantime are replayed in the order they were written.
+        self.__replay_index_file()
+        if self.__lines > 2 * len(self.__records) + self._COMPACTION_MIN_OBSOLETE_LINES:
+            self.__compact()
+
+    def __compact(self):
+        tmp_path = self.dir_path / f"{self._INDEX_FILE_NAME}.{os.getpid()}.{threading.get_ident()}.tmp"
+        content = self.__attributes_line() + "".join(
+            json.dumps({"id": entity_id, **record}, ensure_ascii=False, cls=_Encoder) + "\n"
+            for entity_id, record in self.__records.items()
+        )
+        before = self.__stat(self.dir_path)
+        tmp_path.write_text(content, encoding="UTF-8")
+        os.replace(tmp_path, self._index_path)
+        self._track_folder_change(before)
+        stat = self._index_path.stat()
+        self.__file_id = stat.st_ino
+        self.__offset = len(content.encode("UTF-8"))
+        self.__lines = len(self.__records)
+        self.__rebuild = False
+
+    def __attributes_line(self) -> str:
+        return json.dumps({self._ATTRIBUTES_KEY: list(self.attributes)}) + "\n"
+
+    def __read_attributes(self, line: bytes) -> Optional[List[str]]:
+        try:
+            return json.loads(line).get(self._ATTRIBUTES_KEY)
+        except (ValueError, AttributeError):
+            return None
+
+    @staticmethod
+    def __stat(path: pathlib.Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
@@ -9,11 +9,12 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-import copy
 import json
+import os
 import pathlib
 import shutil
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
+from itertools import islice
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Type, Union
 
 from pyforge.common.config import Config
 
@@ -23,6 +24,8 @@ from ..exceptions import FileCannotBeRead, FileEmpty, ModelNotFound
 from ._abstract_repository import _AbstractRepository
 from ._decoder import _Decoder
 from ._encoder import _Encoder
+from ._filesystem_index import _FileSystemIndex
+from ._range import _Range
 
 
 class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
@@ -37,14 +40,19 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
         model_type (ModelType): Generic dataclass.
         converter: A class that handles conversion to and from a database backend
         dir_name (str): Folder that will hold the files for this dataclass model.
+
+    The identity attributes listed in `_INDEXED_ATTRIBUTES` are cataloged by a `_FileSystemIndex^`
+    so that searches only read the files of the matching entities instead of scanning the folder.
     """
 
     __EXCEPTIONS_TO_RETRY = (FileCannotBeRead, FileEmpty)
+    _INDEXED_ATTRIBUTES: Tuple[str, ...] = ("config_id", "owner_id", "version", "parent_ids", "creation_date")
 
     def __init__(self, model_type: Type[ModelType], converter: Type[Converter], dir_name: str):
         self.model_type = model_type
         self.converter = converter
         self._dir_name = dir_name
+        self.__index: Optional[_FileSystemIndex] = None
 
     @property
     def dir_path(self):
@@ -54,17 +62,36 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
     def _storage_folder(self) -> pathlib.Path:
         return pathlib.Path(Config.core.pyforge_storage_folder)
 
+    @property
+    def _index(self) -> _FileSystemIndex:
+        dir_path = self.dir_path
+        if self.__index is None or self.__index.dir_path != dir_path:
+            self.__index = _FileSystemIndex(dir_path, self._INDEXED_ATTRIBUTES)
+        return self.__index
+
     ###############################
     # ##   Inherited methods   ## #
     ###############################
 
     def _save(self, entity: Entity):
+        self._save_many([entity])
+
+    def _save_many(self, entities: Iterable[Entity]):
         self.__create_directory_if_not_exists()
-        model = self.converter._entity_to_model(entity)  # type: ignore
-        self.__get_path(model.id).write_text(
-            json.dumps(model.to_dict(), ensure_ascii=False, indent=0, cls=_Encoder, check_circular=False),
-            encoding="UTF-8",
-        )
+        index = self._index
+        dir_path = self.dir_path
+        models = []
+        before = index._folder_stat()
+        for entity in entities:
+            model = self.converter._entity_to_model(entity)  # type: ignore
+            model_dict = model.to_dict()
+            (dir_path / f"{model.id}.json").write_text(
+                json.dumps(model_dict, ensure_ascii=False, indent=0, cls=_Encoder, check_circular=False),
+                encoding="UTF-8",
+            )
+            models.append((model.id, model_dict))
+        index._track_folder_change(before)
+        index._put_many(models)
 
     def _exists(self, entity_id: str) -> bool:
         return self.__get_path(entity_id).exists()
@@ -79,40 +106,78 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
 
         return self.__file_content_to_entity(file_content)
 
+    def _get_stamp(self, entity_id: str) -> Optional[Hashable]:
+        # Called on each entity access: the path is built without pathlib to keep it cheap.
+        path = os.path.join(Config.core.pyforge_storage_folder, self._dir_name, f"{entity_id}.json")
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return path, stat.st_ino, stat.st_mtime_ns, stat.st_size
+
     def _load_all(self, filters: Optional[List[Dict]] = None) -> List[Entity]:
         entities = []
-        try:
-            for f in self.dir_path.iterdir():
-                if data := self.__filter_by(f, filters):
-                    entities.append(self.__file_content_to_entity(data))
-        except FileNotFoundError:
-            pass
+        for entity_id, residual_filters in self._index._match(filters).items():
+            if data := self.__filter_by(self.__get_path(entity_id), residual_filters):
+                entities.append(self.__file_content_to_entity(data))
         return entities
 
+    def _load_latest(self, filters: Optional[List[Dict]] = None) -> Optional[Entity]:
+        if any(key not in self._INDEXED_ATTRIBUTES for _filter in filters or [] for key in _filter):
+            return super()._load_latest(filters)
+        if (entity_id := self._index._latest(filters)) is None:
+            return None
+        return self.__file_content_to_entity(self.__filter_by(self.__get_path(entity_id), None))
+
+    def _load_page(
+        self,
+        filters: Optional[List[Dict]] = None,
+        order_by: str = "id",
+        descending: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Entity]:
+        if order_by != "id" and order_by not in self._INDEXED_ATTRIBUTES:
+            return super()._load_page(filters, order_by, descending, offset, limit)
+        return list(islice(self.__iter_sorted(filters, order_by, descending, offset, limit), limit))
+
+    def _iter_all(
+        self, filters: Optional[List[Dict]] = None, order_by: str = "id", descending: bool = False
+    ) -> Iterator[Entity]:
+        if order_by != "id" and order_by not in self._INDEXED_ATTRIBUTES:
+            return super()._iter_all(filters, order_by, descending)
+        return self.__iter_sorted(filters, order_by, descending)
+
     def _delete(self, entity_id: str):
+        index = self._index
+        before = index._folder_stat()
         try:
             self.__get_path(entity_id).unlink()
         except FileNotFoundError:
             raise ModelNotFound(str(self.dir_path), entity_id) from None
+        index._track_folder_change(before)
+        index._remove_many([entity_id])
 
     def _delete_all(self):
         shutil.rmtree(self.dir_path, ignore_errors=True)
+        self._index._clear()
 
     def _delete_many(self, ids: Iterable[str]):
         for model_id in ids:
             self._delete(model_id)
 
     def _delete_by(self, attribute: str, value: str):
-        filters: List[Dict] = [{}]
-        for fil in filters:
-            fil.update({attribute: value})
-
-        try:
-            for f in self.dir_path.iterdir():
-                if self.__filter_by(f, filters):
-                    f.unlink()
-        except FileNotFoundError:
-            pass
+        filters: List[Dict] = [{attribute: value}]
+        index = self._index
+        deleted = []
+        before = index._folder_stat()
+        for entity_id, residual_filters in index._match(filters).items():
+            path = self.__get_path(entity_id)
+            if residual_filters is None or self.__filter_by(path, residual_filters):
+                path.unlink(missing_ok=True)
+                deleted.append(entity_id)
+        index._track_folder_change(before)
+        index._remove_many(deleted)
 
     def _search(self, attribute: str, value: Any, filters: Optional[List[Dict]] = None) -> List[Entity]:
         return list(self.__search(attribute, value, filters))
@@ -140,71 +205,59 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
         if not filters:
             filters = [{}]
         res = {}
-        configs_and_owner_ids = set(configs_and_owner_ids)
-
-        try:
-            for f in self.dir_path.iterdir():
-                config_id, owner_id, entity = self.__match_file_and_get_entity(
-                    f, configs_and_owner_ids, copy.deepcopy(filters)
-                )
-
-                if entity:
-                    key = config_id, owner_id
-                    res[key] = entity
-                    configs_and_owner_ids.remove(key)
-
-                    if len(configs_and_owner_ids) == 0:
-                        return res
-        except FileNotFoundError:
-            # Folder with data was not created yet.
-            return {}
 
+        for config, owner_id in set(configs_and_owner_ids):
+            if entity := self.__get_first_matching_entity(config.id, owner_id, filters):
+                res[config, owner_id] = entity
         return res
 
     def _get_by_config_and_owner_id(
         self, config_id: str, owner_id: Optional[str], filters: Optional[List[Dict]] = None
     ) -> Optional[Entity]:
-        filters = [{}] if not filters else copy.deepcopy(filters)
-
-        if owner_id is not None:
-            for fil in filters:
-                fil.update({"owner_id": owner_id})
-        return self.__filter_files_by_config_and_owner_id(config_id, owner_id, filters)
+        return self.__get_first_matching_entity(config_id, owner_id, filters or [{}])
 
     #############################
     # ##   Private methods   ## #
     #############################
 
-    def __filter_files_by_config_and_owner_id(
-        self, config_id: str, owner_id: Optional[str], filters: Optional[List[Dict]] = None
-    ):
-        try:
-            files = filter(lambda f: config_id in f.name, self.dir_path.iterdir())
-            entities = (self.__file_content_to_entity(self.__filter_by(f, filters)) for f in files)
-            corresponding_entities = filter(
-                lambda e: e is not None and e.config_id == config_id and e.owner_id == owner_id,  # type: ignore
-                entities,
-            )
-            return next(corresponding_entities, None)  # type: ignore
-        except FileNotFoundError:
-            pass
+    def __get_first_matching_entity(self, config_id: str, owner_id: Optional[str], filters: List[Dict]):
+        filters = [{**fil, "config_id": config_id, "owner_id": owner_id} for fil in filters]
+        for entity_id, residual_filters in self._index._match(filters).items():
+            if data := self.__filter_by(self.__get_path(entity_id), residual_filters):
+                return self.__file_content_to_entity(data)
         return None
 
-    def __match_file_and_get_entity(self, filepath, config_and_owner_ids, filters):
-        if match := [(c, p) for c, p in config_and_owner_ids if c.id in filepath.name]:
-            for config, owner_id in match:
-                for fil in filters:
-                    fil.update({"config_id": config.id, "owner_id": owner_id})
-
-                if data := self.__filter_by(filepath, filters):
-                    return config, owner_id, self.__file_content_to_entity(data)
-
-        return None, None, None
+    def __iter_sorted(
+        self,
+        filters: Optional[List[Dict]],
+        order_by: str,
+        descending: bool,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Iterator[Entity]:
+        index = self._index
+        matching = index._match(filters)
+        count = None
+        if limit is not None and all(residual_filters is None for residual_filters in matching.values()):
+            # Every matching entity is part of the result: only the ids of the page need to be sorted.
+            count = offset + limit
+        for entity_id in index._sorted(matching, order_by, descending, count):
+            residual_filters = matching[entity_id]
+            if offset and residual_filters is None:
+                offset -= 1
+                continue
+            if data := self.__filter_by(self.__get_path(entity_id), residual_filters):
+                if offset:
+                    offset -= 1
+                    continue
+                yield self.__file_content_to_entity(data)
 
     def __create_directory_if_not_exists(self):
         self.dir_path.mkdir(parents=True, exist_ok=True)
 
     def __search(self, attribute: str, value: str, filters: Optional[List[Dict]] = None) -> Iterator[Entity]:
+        if attribute in self._INDEXED_ATTRIBUTES and isinstance(value, str):
+            filters = [{**fil, attribute: value} for fil in filters or [{}]]
         return filter(lambda e: getattr(e, attribute, None) == value, self._load_all(filters))
 
     def __get_path(self, model_id) -> pathlib.Path:
@@ -219,21 +272,28 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
         return self.converter._model_to_entity(model)
 
     def __filter_by(self, filepath: pathlib.Path, filters: Optional[List[Dict]]) -> Optional[Json]:
-        if not filters:
-            filters = [{}]
-
         try:
             file_content = self.__read_file(filepath)
         except (FileNotFoundError, FileCannotBeRead, FileEmpty):
             return None
 
-        for _filter in filters:
-            conditions = [
-                f'"{key}": "{value}"' if value is not None else f'"{key}": null' for key, value in _filter.items()
-            ]
-            if all(condition in file_content for condition in conditions):
-                return json.loads(file_content, cls=_Decoder)
-        return None
+        if filters:
+            # The filters are compared with the stored JSON values, as the SQL repository does.
+            model_dict = json.loads(file_content)
+            if not any(self.__match(model_dict, _filter) for _filter in filters):
+                return None
+        return json.loads(file_content, cls=_Decoder)
+
+    @staticmethod
+    def __match(model_dict: Dict[str, Any], _filter: Dict[str, Any]) -> bool:
+        for key, value in _filter.items():
+            stored_value = model_dict.get(key)
+            if isinstance(value, _Range):
+                if not value._contains(stored_value):
+                    return False
+            elif stored_value != (list(value) if isinstance(value, tuple) else value):
+                return False
+        return True
 
     @_retry_repository_operation(__EXCEPTIONS_TO_RETRY)
     def __read_file(self, filepath: pathlib.Path) -> str:
@@ -0,0 +1,56 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+
+class _Range:
+    """
+    Filter value matching the stored values located between two bounds.
+
+    A `_Range` can replace the value of an indexed attribute in the filters passed to a repository,
+    for instance to select the entities created during a period. The values are compared in their
+    stored form: the dates are compared as ISO formatted strings.
+
+    Attributes:
+        start (Optional[Any]): The inclusive lower bound, or None for no lower bound.
+        end (Optional[Any]): The exclusive upper bound, or None for no upper bound.
+    """
+
+    __slots__ = ("start", "end")
+
+    def __init__(self, start: Optional[Any] = None, end: Optional[Any] = None):
+        self.start = start
+        self.end = end
+
+    def __repr__(self) -> str:
+        return f"_Range({self.start!r}, {self.end!r})"
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _Range) and (self.start, self.end) == (other.start, other.end)
+
+    def __hash__(self) -> int:
+        return hash((self.start, self.end))
+
+    def _bounds(self) -> Tuple[Optional[Any], Optional[Any]]:
+        return self.__to_stored_value(self.start), self.__to_stored_value(self.end)
+
+    def _contains(self, value: Any) -> bool:
+        if value is None:
+            return False
+        start, end = self._bounds()
+        return (start is None or start <= value) and (end is None or value < end)
+
+    @staticmethod
+    def __to_stored_value(bound: Optional[Any]) -> Optional[Any]:
+        return bound.isoformat() if isinstance(bound, datetime) else bound
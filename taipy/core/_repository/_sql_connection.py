@@ -0,0 +1,78 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import pathlib
+import sqlite3
+import threading
+from typing import Callable, Dict, Set, Tuple
+
+from pyforge.common.config import Config
+
+
+class _SQLConnection:
+    """Process-wide registry of the SQLite connections used by the SQL repositories.
+
+    One connection is opened per database file and shared by all the threads of the process. Statements are
+    serialized through a lock since SQLite serializes writes anyway.
+    """
+
+    _DB_LOCATION_KEY = "db_location"
+    _DEFAULT_DB_FILE_NAME = "pyforge.sqlite3"
+    _TIMEOUT = 30
+
+    _connections: Dict[str, sqlite3.Connection] = {}
+    _initialized_tables: Set[Tuple[str, str]] = set()
+    _lock = threading.RLock()
+
+    @classmethod
+    def _db_location(cls) -> str:
+        if db_location := Config.core.repository_properties.get(cls._DB_LOCATION_KEY):
+            return str(db_location)
+        return str(pathlib.Path(Config.core.pyforge_storage_folder) / cls._DEFAULT_DB_FILE_NAME)
+
+    @classmethod
+    def _get(cls, table_name: str, init_table: Callable[[sqlite3.Connection], None]) -> sqlite3.Connection:
+        db_location = cls._db_location()
+        with cls._lock:
+            connection = cls._connections.get(db_location)
+            if connection is not None and not os.path.exists(db_location):
+                # The database file was removed: its tables must be created again in a new file.
+                cls.__close(db_location)
+                connection = None
+            if connection is None:
+                connection = cls.__connect(db_location)
+            if (db_location, table_name) not in cls._initialized_tables:
+                with connection:
+                    init_table(connection)
+                cls._initialized_tables.add((db_location, table_name))
+            return connection
+
+    @classmethod
+    def _close_all(cls):
+        with cls._lock:
+            for db_location in list(cls._connections):
+                cls.__close(db_location)
+
+    @classmethod
+    def __connect(cls, db_location: str) -> sqlite3.Connection:
+        pathlib.Path(db_location).parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(db_location, timeout=cls._TIMEOUT, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        cls._connections[db_location] = connection
+        return connection
+
+    @classmethod
+    def __close(cls, db_location: str):
+        if connection := cls._connections.pop(db_location, None):
+            connection.close()
+        cls._initialized_tables = {(db, table) for db, table in cls._initialized_tables if db != db_location}
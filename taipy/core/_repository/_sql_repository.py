@@ -0,0 +1,310 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+import pathlib
+import sqlite3
+import uuid
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from ..common.typing import Converter, Entity, ModelType
+from ..exceptions import ModelNotFound
+from ._abstract_repository import _AbstractRepository
+from ._decoder import _Decoder
+from ._encoder import _Encoder
+from ._range import _Range
+from ._sql_connection import _SQLConnection
+
+
+class _SQLRepository(_AbstractRepository[ModelType, Entity]):
+    """
+    Holds common methods to be used and extended when the need for saving
+    dataclasses in a SQLite database emerges.
+
+    Each model is stored in its own table as a JSON document, along with a column for each
+    attribute listed in `_INDEXED_ATTRIBUTES`. These columns are indexed so that filters on
+    them are resolved by the database. A random stamp, renewed on each save, lets the managers
+    know if the entities they cached are still up to date.
+
+    Attributes:
+        model_type (ModelType): Generic dataclass.
+        converter: A class that handles conversion to and from a database backend
+        table_name (str): Table that will hold the rows for this dataclass model.
+    """
+
+    _INDEXED_ATTRIBUTES: Tuple[str, ...] = ("config_id", "owner_id", "version", "parent_ids", "creation_date")
+    _MAX_VARIABLES = 500
+    _ITERATION_PAGE_SIZE = 1000
+
+    def __init__(self, model_type: Type[ModelType], converter: Type[Converter], table_name: str):
+        self.model_type = model_type
+        self.converter = converter
+        self.table_name = table_name
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        return _SQLConnection._get(self.table_name, self._create_table)
+
+    ###############################
+    # ##   Inherited methods   ## #
+    ###############################
+
+    def _save(self, entity: Entity):
+        self.__upsert([self.__entity_to_row(entity)])
+
+    def _save_many(self, entities: Iterable[Entity]):
+        self.__upsert([self.__entity_to_row(entity) for entity in entities])
+
+    def _exists(self, entity_id: str) -> bool:
+        return self.__fetchone(f"SELECT 1 FROM {self.table_name} WHERE id = ?", (entity_id,)) is not None
+
+    def _load(self, entity_id: str) -> Entity:
+        row = self.__fetchone(f"SELECT model FROM {self.table_name} WHERE id = ?", (entity_id,))
+        if row is None:
+            raise ModelNotFound(self.table_name, entity_id)
+        return self.__row_to_entity(row[0])
+
+    def _get_stamp(self, entity_id: str) -> Optional[Hashable]:
+        row = self.__fetchone(f"SELECT stamp FROM {self.table_name} WHERE id = ?", (entity_id,))
+        return (_SQLConnection._db_location(), row[0]) if row else None
+
+    def _load_many(self, entity_ids: Iterable[str]) -> List[Entity]:
+        entity_ids = list(entity_ids)
+        models = {}
+        for i in range(0, len(entity_ids), self._MAX_VARIABLES):
+            chunk = entity_ids[i : i + self._MAX_VARIABLES]
+            placeholders = ", ".join("?" * len(chunk))
+            query = f"SELECT id, model FROM {self.table_name} WHERE id IN ({placeholders})"
+            models.update(self.__fetchall(query, chunk))
+        return [self.__row_to_entity(models[entity_id]) for entity_id in entity_ids if entity_id in models]
+
+    def _load_all(self, filters: Optional[List[Dict]] = None) -> List[Entity]:
+        where, params = self.__build_where_clause(filters)
+        rows = self.__fetchall(f"SELECT model FROM {self.table_name}{where} ORDER BY rowid", params)
+        return [self.__row_to_entity(row[0]) for row in rows]
+
+    def _load_latest(self, filters: Optional[List[Dict]] = None) -> Optional[Entity]:
+        where, params = self.__build_where_clause(filters)
+        query = f"SELECT model FROM {self.table_name}{where} ORDER BY creation_date DESC, rowid LIMIT 1"
+        row = self.__fetchone(query, params)
+        return self.__row_to_entity(row[0]) if row else None
+
+    def _load_page(
+        self,
+        filters: Optional[List[Dict]] = None,
+        order_by: str = "id",
+        descending: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Entity]:
+        where, params = self.__build_where_clause(filters)
+        order, order_params = self.__build_order_clause(order_by, descending)
+        query = f"SELECT model FROM {self.table_name}{where}{order} LIMIT ? OFFSET ?"
+        rows = self.__fetchall(query, [*params, *order_params, -1 if limit is None else limit, offset])
+        return [self.__row_to_entity(row[0]) for row in rows]
+
+    def _iter_all(
+        self, filters: Optional[List[Dict]] = None, order_by: str = "id", descending: bool = False
+    ) -> Iterator[Entity]:
+        # The entities are read page by page. Each page starts after the last row of the previous one, so
+        # that the pages stay consistent if entities are saved or deleted during the iteration.
+        expression, expression_params = self.__column_expression(order_by)
+        order, order_params = self.__build_order_clause(order_by, descending)
+        where, params = self.__build_where_clause(filters)
+        page_where, page_params = where, params
+        while True:
+            query = f"SELECT model, {expression}, id FROM {self.table_name}{page_where}{order} LIMIT ?"
+            rows = self.__fetchall(query, [*expression_params, *page_params, *order_params, self._ITERATION_PAGE_SIZE])
+            for row in rows:
+                yield self.__row_to_entity(row[0])
+            if len(rows) < self._ITERATION_PAGE_SIZE:
+                return
+            after, after_params = self.__build_after_condition(order_by, descending, rows[-1][1], rows[-1][2])
+            page_where = f" WHERE ({where[len(' WHERE ') :]}) AND ({after})" if where else f" WHERE {after}"
+            page_params = [*params, *after_params]
+
+    def _delete(self, entity_id: str):
+        if self.__execute_write(f"DELETE FROM {self.table_name} WHERE id = ?", [(entity_id,)]) == 0:
+            raise ModelNotFound(self.table_name, entity_id)
+
+    def _delete_all(self):
+        self.__execute_write(f"DELETE FROM {self.table_name}", [()])
+
+    def _delete_many(self, ids: Iterable[str]):
+        ids = list(ids)
+        existing = set()
+        for i in range(0, len(ids), self._MAX_VARIABLES):
+            chunk = ids[i : i + self._MAX_VARIABLES]
+            placeholders = ", ".join("?" * len(chunk))
+            query = f"SELECT id FROM {self.table_name} WHERE id IN ({placeholders})"
+            existing.update(row[0] for row in self.__fetchall(query, chunk))
+        if missing := next((model_id for model_id in ids if model_id not in existing), None):
+            raise ModelNotFound(self.table_name, missing)
+        self.__execute_write(f"DELETE FROM {self.table_name} WHERE id = ?", [(model_id,) for model_id in ids])
+
+    def _delete_by(self, attribute: str, value: str):
+        where, params = self.__build_where_clause([{attribute: value}])
+        self.__execute_write(f"DELETE FROM {self.table_name}{where}", [params])
+
+    def _search(self, attribute: str, value: Any, filters: Optional[List[Dict]] = None) -> List[Entity]:
+        if isinstance(value, str):
+            filters = [{**fil, attribute: value} for fil in filters or [{}]]
+        return [e for e in self._load_all(filters) if getattr(e, attribute, None) == value]
+
+    def _export(self, entity_id: str, folder_path: Union[str, pathlib.Path]) -> None:
+        if isinstance(folder_path, str):
+            folder: pathlib.Path = pathlib.Path(folder_path)
+        else:
+            folder = folder_path
+
+        export_dir = folder / self.table_name
+        if not export_dir.exists():
+            export_dir.mkdir(parents=True)
+
+        row = self.__fetchone(f"SELECT model FROM {self.table_name} WHERE id = ?", (entity_id,))
+        if row is None:
+            raise ModelNotFound(self.table_name, entity_id)
+        model_dict = json.loads(row[0], cls=_Decoder)
+        (export_dir / f"{entity_id}.json").write_text(
+            json.dumps(model_dict, ensure_ascii=False, indent=0, cls=_Encoder, check_circular=False),
+            encoding="UTF-8",
+        )
+
+    ###########################################
+    # ##   Specific or optimized methods   ## #
+    ###########################################
+    def _get_by_configs_and_owner_ids(self, configs_and_owner_ids, filters: Optional[List[Dict]] = None):
+        res = {}
+        for config, owner_id in set(configs_and_owner_ids):
+            if entity := self._get_by_config_and_owner_id(config.id, owner_id, filters):
+                res[config, owner_id] = entity
+        return res
+
+    def _get_by_config_and_owner_id(
+        self, config_id: str, owner_id: Optional[str], filters: Optional[List[Dict]] = None
+    ) -> Optional[Entity]:
+        filters = [{**fil, "config_id": config_id, "owner_id": owner_id} for fil in filters or [{}]]
+        where, params = self.__build_where_clause(filters)
+        row = self.__fetchone(f"SELECT model FROM {self.table_name}{where} ORDER BY rowid LIMIT 1", params)
+        return self.__row_to_entity(row[0]) if row else None
+
+    def _create_table(self, connection: sqlite3.Connection):
+        columns = "".join(f", {attribute}" for attribute in self._INDEXED_ATTRIBUTES)
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table_name} (id TEXT PRIMARY KEY{columns}, model TEXT, stamp TEXT)"
+        )
+        # The columns of the attributes indexed since the table was created are filled from the stored models.
+        existing_columns = {row[1] for row in connection.execute(f"PRAGMA table_info({self.table_name})")}
+        for attribute in self._INDEXED_ATTRIBUTES:
+            if attribute not in existing_columns:
+                connection.execute(f"ALTER TABLE {self.table_name} ADD COLUMN {attribute}")
+                connection.execute(
+                    f"UPDATE {self.table_name} SET {attribute} = json_extract(model, ?)", (f'$."{attribute}"',)
+                )
+        for attribute in self._INDEXED_ATTRIBUTES:
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{self.table_name}_{attribute} ON {self.table_name} ({attribute})"
+            )
+
+    #############################
+    # ##   Private methods   ## #
+    #############################
+
+    def __fetchall(self, query: str, params: Iterable = ()) -> List[Tuple]:
+        connection = self._connection
+        with _SQLConnection._lock:
+            return connection.execute(query, tuple(params)).fetchall()
+
+    def __fetchone(self, query: str, params: Iterable = ()) -> Optional[Tuple]:
+        connection = self._connection
+        with _SQLConnection._lock:
+            return connection.execute(query, tuple(params)).fetchone()
+
+    def __execute_write(self, query: str, params: Iterable[Iterable]) -> int:
+        connection = self._connection
+        with _SQLConnection._lock, connection:
+            return connection.executemany(query, params).rowcount
+
+    def __upsert(self, rows: List[Tuple]):
+        columns = ("id", *self._INDEXED_ATTRIBUTES, "model", "stamp")
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns[1:])
+        query = (
+            f"INSERT INTO {self.table_name} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+            f" ON CONFLICT(id) DO UPDATE SET {updates}"
+        )
+        self.__execute_write(query, rows)
+
+    def __entity_to_row(self, entity: Entity) -> Tuple:
+        model_dict = self.converter._entity_to_model(entity).to_dict()  # type: ignore
+        indexed_values = (self.__to_column_value(model_dict.get(attribute)) for attribute in self._INDEXED_ATTRIBUTES)
+        model = json.dumps(model_dict, ensure_ascii=False, cls=_Encoder, check_circular=False)
+        return (model_dict["id"], *indexed_values, model, uuid.uuid4().hex)
+
+    def __row_to_entity(self, model: str) -> Entity:
+        return self.converter._model_to_entity(self.model_type.from_dict(json.loads(model, cls=_Decoder)))  # type: ignore
+
+    def __build_where_clause(self, filters: Optional[List[Dict]]) -> Tuple[str, List]:
+        if not filters or not any(filters):
+            return "", []
+        clauses = []
+        params: List = []
+        for _filter in filters:
+            conditions = []
+            for key, value in _filter.items():
+                column, column_params = self.__column_expression(key)
+                if value is None:
+                    conditions.append(f"{column} IS NULL")
+                    params.extend(column_params)
+                elif isinstance(value, _Range):
+                    start, end = value._bounds()
+                    conditions.append(f"{column} IS NOT NULL")
+                    params.extend(column_params)
+                    if start is not None:
+                        conditions.append(f"{column} >= ?")
+                        params.extend([*column_params, start])
+                    if end is not None:
+                        conditions.append(f"{column} < ?")
+                        params.extend([*column_params, end])
+                else:
+                    conditions.append(f"{column} = ?")
+                    params.extend([*column_params, self.__to_column_value(value)])
+            clauses.append(" AND ".join(conditions) or "1")
+        return " WHERE " + " OR ".join(f"({clause})" for clause in clauses), params
+
+    def __build_order_clause(self, order_by: str, descending: bool) -> Tuple[str, List]:
+        expression, params = self.__column_expression(order_by)
+        direction = "DESC" if descending else "ASC"
+        return f" ORDER BY {expression} {direction}, id {direction}", params
+
+    def __build_after_condition(self, order_by: str, descending: bool, value: Any, entity_id: str) -> Tuple[str, List]:
+        # The rows without value come first in ascending order and last in descending order.
+        expression, params = self.__column_expression(order_by)
+        operator = "<" if descending else ">"
+        if value is None:
+            if descending:
+                return f"{expression} IS NULL AND id < ?", [*params, entity_id]
+            return f"({expression} IS NULL AND id > ?) OR {expression} IS NOT NULL", [*params, entity_id, *params]
+        condition = f"{expression} {operator} ? OR ({expression} = ? AND id {operator} ?)"
+        condition_params = [*params, value, *params, value, entity_id]
+        if descending:
+            return f"{condition} OR {expression} IS NULL", [*condition_params, *params]
+        return condition, condition_params
+
+    def __column_expression(self, attribute: str) -> Tuple[str, List]:
+        if attribute == "id" or attribute in self._INDEXED_ATTRIBUTES:
+            return attribute, []
+        return "json_extract(model, ?)", [f'$."{attribute}"']
+
+    @staticmethod
+    def __to_column_value(value):
+        if isinstance(value, (list, tuple, set, dict)):
+            return json.dumps(value, ensure_ascii=False, cls=_Encoder)
+        return value
@@ -9,7 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
 from .._version._version_manager_factory import _VersionManagerFactory
 
@@ -31,6 +31,12 @@ class _VersionMixin:
             else []
         )
 
+    @classmethod
+    def _build_filters_with_attributes(cls, attributes: Optional[Dict[str, Any]], version_number=None) -> List[Dict]:
+        return [
+            {**_filter, **(attributes or {})} for _filter in cls._build_filters_with_version(version_number) or [{}]
+        ]
+
     @classmethod
     def _get_latest_version(cls):
         return _VersionManagerFactory._build_manager()._get_latest_version()
@@ -0,0 +1,72 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import sqlite3
+
+from .._repository._sql_connection import _SQLConnection
+from .._repository._sql_repository import _SQLRepository
+from ..exceptions import ModelNotFound
+from ._version_converter import _VersionConverter
+from ._version_model import _VersionModel
+
+
+class _VersionSQLRepository(_SQLRepository):
+    _LATEST_VERSION_KEY = "latest_version"
+    _DEVELOPMENT_VERSION_KEY = "development_version"
+    _SETTINGS_TABLE_NAME = "version_settings"
+
+    def __init__(self) -> None:
+        super().__init__(model_type=_VersionModel, converter=_VersionConverter, table_name="version")
+
+    def _create_table(self, connection: sqlite3.Connection):
+        super()._create_table(connection)
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._SETTINGS_TABLE_NAME} (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+
+    def _delete_all(self):
+        super()._delete_all()
+
+        with _SQLConnection._lock, self._connection as connection:
+            connection.execute(f"DELETE FROM {self._SETTINGS_TABLE_NAME}")
+
+    def _set_latest_version(self, version_number):
+        with _SQLConnection._lock, self._connection as connection:
+            connection.execute(
+                f"INSERT OR IGNORE INTO {self._SETTINGS_TABLE_NAME} (key, value) VALUES (?, '')",
+                (self._DEVELOPMENT_VERSION_KEY,),
+            )
+        self.__set_settings({self._LATEST_VERSION_KEY: version_number})
+
+    def _get_latest_version(self) -> str:
+        return self.__get_setting(self._LATEST_VERSION_KEY)
+
+    def _set_development_version(self, version_number):
+        self.__set_settings({self._DEVELOPMENT_VERSION_KEY: version_number, self._LATEST_VERSION_KEY: version_number})
+
+    def _get_development_version(self) -> str:
+        return self.__get_setting(self._DEVELOPMENT_VERSION_KEY)
+
+    def __set_settings(self, settings):
+        with _SQLConnection._lock, self._connection as connection:
+            connection.executemany(
+                f"INSERT INTO {self._SETTINGS_TABLE_NAME} (key, value) VALUES (?, ?)"
+                " ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                list(settings.items()),
+            )
+
+    def __get_setting(self, key: str) -> str:
+        with _SQLConnection._lock:
+            query = f"SELECT value FROM {self._SETTINGS_TABLE_NAME} WHERE key = ?"
+            row = self._connection.execute(query, (key,)).fetchone()
+        if row is None:
+            raise ModelNotFound(self._SETTINGS_TABLE_NAME, key)
+        return row[0]
@@ -17,6 +17,7 @@ from pyforge.common.config.checker.issue_collector import IssueCollector
 
 from ..data_node_config import DataNodeConfig
 from ..job_config import JobConfig
+from ..task_config import TaskConfig
 
 
 class _JobConfigChecker(_ConfigChecker):
@@ -26,23 +27,69 @@ class _JobConfigChecker(_ConfigChecker):
     def _check(self) -> IssueCollector:
         if job_config := self._config._unique_sections.get(JobConfig.name):
             data_node_configs = self._config._sections[DataNodeConfig.name]
+            task_configs = self._config._sections.get(TaskConfig.name, {})
             self._check_multiprocess_mode(
                 cast(JobConfig, job_config),
                 cast(Dict[str, DataNodeConfig], data_node_configs),
+                cast(Dict[str, TaskConfig], task_configs),
+            )
+            self._check_threaded_mode(
+                cast(JobConfig, job_config),
+                cast(Dict[str, TaskConfig], task_configs),
             )
             self._check_job_execution_mode(cast(JobConfig, job_config))
         return self._collector
 
-    def _check_multiprocess_mode(self, job_config: JobConfig, data_node_configs: Dict[str, DataNodeConfig]):
+    def _check_multiprocess_mode(
+        self,
+        job_config: JobConfig,
+        data_node_configs: Dict[str, DataNodeConfig],
+        task_configs: Dict[str, TaskConfig],
+    ):
         if job_config.is_standalone:
+            # The tasks executed in the thread or async execution mode run in the main process, like in
+            # development mode: the in-memory data nodes that are only used by such tasks are accepted.
+            main_process_dn_ids = set()
+            worker_process_dn_ids = set()
+            for task_config in task_configs.values():
+                dn_ids = {
+                    dn_config.id
+                    for dn_config in task_config.input_configs + task_config.output_configs
+                    if isinstance(dn_config, DataNodeConfig)
+                }
+                if task_config.execution_mode in (None, TaskConfig._PROCESS_EXECUTION_MODE):
+                    worker_process_dn_ids.update(dn_ids)
+                else:
+                    main_process_dn_ids.update(dn_ids)
             for cfg_id, data_node_config in data_node_configs.items():
-                if data_node_config.storage_type == DataNodeConfig._STORAGE_TYPE_VALUE_IN_MEMORY:
-                    self._error(
-                        DataNodeConfig._STORAGE_TYPE_KEY,
-                        data_node_config.storage_type,
-                        f"DataNode `{cfg_id}`: In-memory storage type can ONLY be used in "
-                        f"{JobConfig._DEVELOPMENT_MODE} mode.",
-                    )
+                if data_node_config.storage_type != DataNodeConfig._STORAGE_TYPE_VALUE_IN_MEMORY:
+                    continue
+                if cfg_id in main_process_dn_ids and cfg_id not in worker_process_dn_ids:
+                    continue
+                self._error(
+                    DataNodeConfig._STORAGE_TYPE_KEY,
+                    data_node_config.storage_type,
+                    f"DataNode `{cfg_id}`: In-memory storage type can ONLY be used in "
+                    f"{JobConfig._DEVELOPMENT_MODE} mode, or by tasks executed in the "
+                    f"{TaskConfig._THREAD_EXECUTION_MODE} or {TaskConfig._ASYNC_EXECUTION_MODE} execution mode.",
+                )
+
+    def _check_threaded_mode(self, job_config: JobConfig, task_configs: Dict[str, TaskConfig]):
+        if job_config.is_threaded:
+            for task_config_id, task_config in task_configs.items():
+                if task_config.execution_mode != TaskConfig._PROCESS_EXECUTION_MODE:
+                    continue
+                for data_node_config in task_config.input_configs + task_config.output_configs:
+                    if (
+                        isinstance(data_node_config, DataNodeConfig)
+                        and data_node_config.storage_type == DataNodeConfig._STORAGE_TYPE_VALUE_IN_MEMORY
+                    ):
+                        self._error(
+                            DataNodeConfig._STORAGE_TYPE_KEY,
+                            data_node_config.storage_type,
+                            f"DataNode `{data_node_config.id}`: In-memory storage type cannot be used by TaskConfig "
+                            f"`{task_config_id}` executed in worker processes.",
+                        )
 
     def _check_job_execution_mode(self, job_config: JobConfig):
         if job_config.mode not in JobConfig._MODES:
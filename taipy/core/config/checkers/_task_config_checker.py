@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import inspect
 from typing import Dict, List, cast
 
 from pyforge.common.config._config import _Config
@@ -42,6 +43,7 @@ class _TaskConfigChecker(_ConfigChecker):
                 self._check_outputs(task_config_id, task_config)
                 self._check_if_children_config_id_is_overlapping_with_properties(task_config_id, task_config)
                 self._check_required_properties(task_config_id, task_config)
+                self._check_execution_mode(task_config_id, task_config)
         return self._collector
 
     def _check_if_children_config_id_is_overlapping_with_properties(self, task_config_id: str, task_config: TaskConfig):
@@ -102,3 +104,24 @@ class _TaskConfigChecker(_ConfigChecker):
                             f"TaskConfig `{task_config_id}` is either missing the required property "
                             f"`{required_key}` or the value is set to None.",
                         )
+
+    def _check_execution_mode(self, task_config_id: str, task_config: TaskConfig):
+        execution_mode = task_config.execution_mode
+        if execution_mode is None:
+            return
+        if execution_mode not in TaskConfig._EXECUTION_MODES:
+            self._error(
+                TaskConfig._EXECUTION_MODE_KEY,
+                execution_mode,
+                f"The execution mode of TaskConfig `{task_config_id}` must be either "
+                f"{', '.join(TaskConfig._EXECUTION_MODES)}.",
+            )
+        elif execution_mode == TaskConfig._ASYNC_EXECUTION_MODE and not inspect.iscoroutinefunction(
+            task_config.function
+        ):
+            self._error(
+                TaskConfig._EXECUTION_MODE_KEY,
+                execution_mode,
+                f"TaskConfig `{task_config_id}` can only use the {TaskConfig._ASYNC_EXECUTION_MODE} execution mode"
+                f" with a coroutine function.",
+            )
@@ -52,6 +52,12 @@ class CoreSection(UniqueSection):
     _READ_ENTITY_RETRY_KEY = "read_entity_retry"
     _DEFAULT_READ_ENTITY_RETRY = 1
 
+    _ENTITY_CACHE_SIZE_KEY = "entity_cache_size"
+    _DEFAULT_ENTITY_CACHE_SIZE = 1000
+
+    _NOTIFICATION_QUEUE_SIZE_KEY = "notification_queue_size"
+    _DEFAULT_NOTIFICATION_QUEUE_SIZE = 0
+
     _MODE_KEY = "mode"
     _DEFAULT_MODE = "development"
 
@@ -76,6 +82,8 @@ class CoreSection(UniqueSection):
         version_number: Optional[str] = None,
         force: Optional[bool] = None,
         core_version: Optional[str] = None,
+        entity_cache_size: Optional[int] = None,
+        notification_queue_size: Optional[int] = None,
         **properties,
     ):
         self._root_folder = root_folder
@@ -84,6 +92,8 @@ class CoreSection(UniqueSection):
         self._repository_type = repository_type
         self._repository_properties = repository_properties
         self._read_entity_retry = read_entity_retry
+        self._entity_cache_size = entity_cache_size
+        self._notification_queue_size = notification_queue_size
         self._mode = mode
         self._version_number = version_number
         self._force = force
@@ -105,6 +115,8 @@ class CoreSection(UniqueSection):
             self.version_number,
             self.force,
             self._core_version,
+            self.entity_cache_size,
+            self.notification_queue_size,
             **copy(self._properties),
         )
 
@@ -191,6 +203,35 @@ class CoreSection(UniqueSection):
     def read_entity_retry(self, val) -> None:
         self._read_entity_retry = val
 
+    @property
+    def entity_cache_size(self) -> int:
+        """Maximum number of entities kept in memory by each entity manager.
+
+        Entities read from the repository are cached and served again as long as they were
+        not modified. The value 0 disables the cache. The default value is 1000.
+        """
+        return _tpl._replace_templates(self._entity_cache_size)
+
+    @entity_cache_size.setter  # type: ignore
+    @_ConfigBlocker._check()
+    def entity_cache_size(self, val) -> None:
+        self._entity_cache_size = val
+
+    @property
+    def notification_queue_size(self) -> int:
+        """Maximum number of events waiting to be delivered to the registered listeners.
+
+        If positive, the events are delivered by a background thread while the Orchestrator service
+        runs, so that publishing an event does not slow down the publisher. The value 0 delivers the
+        events synchronously. The default value is 0.
+        """
+        return _tpl._replace_templates(self._notification_queue_size)
+
+    @notification_queue_size.setter  # type: ignore
+    @_ConfigBlocker._check()
+    def notification_queue_size(self, val) -> None:
+        self._notification_queue_size = val
+
     @property
     def mode(self) -> str:
         """The operating mode of PyForge.
@@ -265,6 +306,8 @@ class CoreSection(UniqueSection):
             cls._DEFAULT_VERSION_NUMBER,
             cls._DEFAULT_FORCE,
             cls._CURRENT_CORE_VERSION,
+            cls._DEFAULT_ENTITY_CACHE_SIZE,
+            cls._DEFAULT_NOTIFICATION_QUEUE_SIZE,
         )
 
     def _clean(self):
@@ -274,6 +317,8 @@ class CoreSection(UniqueSection):
         self._repository_type = self._DEFAULT_REPOSITORY_TYPE
         self._repository_properties = self._DEFAULT_REPOSITORY_PROPERTIES.copy()
         self._read_entity_retry = self._DEFAULT_READ_ENTITY_RETRY
+        self._entity_cache_size = self._DEFAULT_ENTITY_CACHE_SIZE
+        self._notification_queue_size = self._DEFAULT_NOTIFICATION_QUEUE_SIZE
         self.mode = self._DEFAULT_MODE
         self.version_number = self._DEFAULT_VERSION_NUMBER
         self.force = self._DEFAULT_FORCE
@@ -294,6 +339,10 @@ class CoreSection(UniqueSection):
             as_dict[self._REPOSITORY_PROPERTIES_KEY] = self._repository_properties
         if self._read_entity_retry is not None:
             as_dict[self._READ_ENTITY_RETRY_KEY] = self._read_entity_retry
+        if self._entity_cache_size is not None:
+            as_dict[self._ENTITY_CACHE_SIZE_KEY] = self._entity_cache_size
+        if self._notification_queue_size is not None:
+            as_dict[self._NOTIFICATION_QUEUE_SIZE_KEY] = self._notification_queue_size
         if self.mode is not None:
             as_dict[self._MODE_KEY] = self.mode
         if self.version_number is not None:
@@ -313,6 +362,8 @@ class CoreSection(UniqueSection):
         repository_type = as_dict.pop(cls._REPOSITORY_TYPE_KEY, None)
         repository_properties = as_dict.pop(cls._REPOSITORY_PROPERTIES_KEY, None)
         read_entity_retry = as_dict.pop(cls._READ_ENTITY_RETRY_KEY, None)
+        entity_cache_size = as_dict.pop(cls._ENTITY_CACHE_SIZE_KEY, None)
+        notification_queue_size = as_dict.pop(cls._NOTIFICATION_QUEUE_SIZE_KEY, None)
         mode = as_dict.pop(cls._MODE_KEY, None)
         version_nb = as_dict.pop(cls._VERSION_NUMBER_KEY, None)
         force = as_dict.pop(cls._FORCE_KEY, None)
@@ -328,6 +379,8 @@ class CoreSection(UniqueSection):
             version_nb,
             force,
             core_version,
+            entity_cache_size,
+            notification_queue_size,
             **as_dict,
         )
 
@@ -345,6 +398,8 @@ class CoreSection(UniqueSection):
                 as_dict.pop(self._REPOSITORY_PROPERTIES_KEY, self._repository_properties)
             )
         self._read_entity_retry = as_dict.pop(self._READ_ENTITY_RETRY_KEY, self._read_entity_retry)
+        self._entity_cache_size = as_dict.pop(self._ENTITY_CACHE_SIZE_KEY, self._entity_cache_size)
+        self._notification_queue_size = as_dict.pop(self._NOTIFICATION_QUEUE_SIZE_KEY, self._notification_queue_size)
         self._mode = as_dict.pop(self._MODE_KEY, self.mode)
         self._version_number = as_dict.pop(self._VERSION_NUMBER_KEY, self.version_number)
         self._force = as_dict.pop(self._FORCE_KEY, self.force)
@@ -386,6 +441,8 @@ class CoreSection(UniqueSection):
         mode: Optional[str] = None,
         version_number: Optional[str] = None,
         force: Optional[bool] = None,
+        entity_cache_size: Optional[int] = None,
+        notification_queue_size: Optional[int] = None,
         **properties,
     ) -> "CoreSection":
         """Configure the Orchestrator service.
@@ -400,9 +457,11 @@ class CoreSection(UniqueSection):
                 used in conjunction with the *root_folder* attribute. That means the storage path is
                 <root_folder><storage_folder> (The default path is "./pyforge/.pyforge/").
             repository_type (Optional[str]): The type of the repository to be used to store PyForge data.
-                The default value is "filesystem".
+                Possible values are *"filesystem"* or *"sql"* (a SQLite database). The default value is "filesystem".
             repository_properties (Optional[Dict[str, Union[str, int]]]): A dictionary of additional properties
-                to be used by the repository.
+                to be used by the repository. With the *"sql"* repository type, the *db_location* property
+                sets the path of the SQLite database file. The default value is
+                "<pyforge_storage_folder>/pyforge.sqlite3".
             read_entity_retry (Optional[int]): Number of retries to read an entity from the repository
                 before return failure. The default value is 3.
             mode (Optional[str]): Indicates the mode of the version management system.
@@ -414,6 +473,12 @@ class CoreSection(UniqueSection):
                  In development mode, the version number is ignored.
             force (Optional[bool]): If True, PyForge will override a version even if the configuration
                 has changed and run the application.
+            entity_cache_size (Optional[int]): Maximum number of entities kept in memory by each entity
+                manager to avoid reading them again from the repository. The value 0 disables the cache.
+                The default value is 1000.
+            notification_queue_size (Optional[int]): Maximum number of events waiting to be delivered to
+                the registered listeners by a background thread while the Orchestrator service runs. The
+                value 0 delivers the events synchronously when they are published. The default value is 0.
             **properties (Dict[str, Any]): A keyworded variable length list of additional arguments configure the
                 behavior of the `Orchestrator^` service.
 
@@ -431,6 +496,8 @@ class CoreSection(UniqueSection):
             version_number=version_number,
             force=force,
             core_version=_read_version(),
+            entity_cache_size=entity_cache_size,
+            notification_queue_size=notification_queue_size,
             **properties,
         )
         Config._register(section)
@@ -450,3 +517,11 @@ class CoreSection(UniqueSection):
         _DataManagerFactory._build_manager.cache_clear()
         _SubmissionManagerFactory._build_manager.cache_clear()
         _VersionManagerFactory._build_manager.cache_clear()
+
+        _CycleManagerFactory._build_repository.cache_clear()
+        _ScenarioManagerFactory._build_repository.cache_clear()
+        _TaskManagerFactory._build_repository.cache_clear()
+        _JobManagerFactory._build_repository.cache_clear()
+        _DataManagerFactory._build_repository.cache_clear()
+        _SubmissionManagerFactory._build_repository.cache_clear()
+        _VersionManagerFactory._build_repository.cache_clear()
@@ -116,9 +116,15 @@ class DataNodeConfig(Section):
     _OPTIONAL_HOST_SQL_PROPERTY = "db_host"
     _OPTIONAL_DRIVER_SQL_PROPERTY = "db_driver"
     _OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY = "db_extra_args"
+    _OPTIONAL_DB_POOL_SIZE_SQL_PROPERTY = "db_pool_size"
+    _OPTIONAL_DB_MAX_OVERFLOW_SQL_PROPERTY = "db_max_overflow"
+    _OPTIONAL_DB_POOL_RECYCLE_SQL_PROPERTY = "db_pool_recycle"
+    _OPTIONAL_DB_POOL_PRE_PING_SQL_PROPERTY = "db_pool_pre_ping"
     _OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY = "exposed_type"
     # SQL_TABLE
     _REQUIRED_TABLE_NAME_SQL_TABLE_PROPERTY = "table_name"
+    _OPTIONAL_INSERT_STRATEGY_SQL_TABLE_PROPERTY = "insert_strategy"
+    _OPTIONAL_INSERT_CHUNKSIZE_SQL_TABLE_PROPERTY = "insert_chunksize"
     # SQL
     _REQUIRED_READ_QUERY_SQL_PROPERTY = "read_query"
     _REQUIRED_WRITE_QUERY_BUILDER_SQL_PROPERTY = "write_query_builder"
@@ -178,6 +184,10 @@ class DataNodeConfig(Section):
             _OPTIONAL_FOLDER_PATH_SQLITE_PROPERTY: str,
             _OPTIONAL_FILE_EXTENSION_SQLITE_PROPERTY: str,
             _OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY: dict,
+            _OPTIONAL_DB_POOL_SIZE_SQL_PROPERTY: int,
+            _OPTIONAL_DB_MAX_OVERFLOW_SQL_PROPERTY: int,
+            _OPTIONAL_DB_POOL_RECYCLE_SQL_PROPERTY: int,
+            _OPTIONAL_DB_POOL_PRE_PING_SQL_PROPERTY: bool,
             _OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY: (str, Callable),
         },
         _STORAGE_TYPE_VALUE_SQL_TABLE: {
@@ -192,7 +202,13 @@ class DataNodeConfig(Section):
             _OPTIONAL_FOLDER_PATH_SQLITE_PROPERTY: str,
             _OPTIONAL_FILE_EXTENSION_SQLITE_PROPERTY: str,
             _OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY: dict,
+            _OPTIONAL_DB_POOL_SIZE_SQL_PROPERTY: int,
+            _OPTIONAL_DB_MAX_OVERFLOW_SQL_PROPERTY: int,
+            _OPTIONAL_DB_POOL_RECYCLE_SQL_PROPERTY: int,
+            _OPTIONAL_DB_POOL_PRE_PING_SQL_PROPERTY: bool,
             _OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY: (str, Callable),
+            _OPTIONAL_INSERT_STRATEGY_SQL_TABLE_PROPERTY: str,
+            _OPTIONAL_INSERT_CHUNKSIZE_SQL_TABLE_PROPERTY: int,
         },
         _STORAGE_TYPE_VALUE_CSV: {
             _OPTIONAL_DEFAULT_PATH_CSV_PROPERTY: str,
@@ -986,7 +1002,13 @@ class DataNodeConfig(Section):
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
-            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.<br/>
+                The connection pool, shared by all the SQL data nodes that use the same database, can be
+                set with the *db_pool_size*, *db_max_overflow*, *db_pool_recycle* (in seconds) and
+                *db_pool_pre_ping* properties.<br/>
+                The rows are written with the *insert_strategy* property: *"executemany"* (the default),
+                *"copy"* (*"postgresql"* engine only), or *"multi"*. The *insert_chunksize* property sets
+                the number of rows inserted at once.
 
         Returns:
             The new SQL data node configuration.
@@ -1079,7 +1101,10 @@ class DataNodeConfig(Section):
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
-            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.<br/>
+                The connection pool, shared by all the SQL data nodes that use the same database, can be
+                set with the *db_pool_size*, *db_max_overflow*, *db_pool_recycle* (in seconds) and
+                *db_pool_pre_ping* properties.
 
         Returns:
             The new SQL data node configuration.
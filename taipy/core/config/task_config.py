@@ -37,6 +37,9 @@ class TaskConfig(Section):
     #         exposed types (*exposed_type* field) of the input data nodes and returning results
     #         compatible with the exposed types (*exposed_type* field) of the outputs list.<br/>
     #         The default value is None.
+    #     execution_mode (str): How the jobs of the task are executed in *"standalone"* and
+    #         *"threaded"* job execution modes: *"process"*, *"thread"*, or *"async"*.<br/>
+    #         The default value is None, in which case the job execution mode decides.
 
     name = "TASK"
 
@@ -44,6 +47,12 @@ class TaskConfig(Section):
     _FUNCTION = "function"
     _OUTPUT_KEY = "outputs"
     _IS_SKIPPABLE_KEY = "skippable"
+    _EXECUTION_MODE_KEY = "execution_mode"
+
+    _PROCESS_EXECUTION_MODE = "process"
+    _THREAD_EXECUTION_MODE = "thread"
+    _ASYNC_EXECUTION_MODE = "async"
+    _EXECUTION_MODES = [_PROCESS_EXECUTION_MODE, _THREAD_EXECUTION_MODE, _ASYNC_EXECUTION_MODE]
 
     function: Optional[Callable]
     """User function taking as inputs some parameters compatible with the data type
@@ -107,6 +116,16 @@ class TaskConfig(Section):
         """Indicates if the task can be skipped if no change has been made on inputs."""
         return _tpl._replace_templates(self._skippable)
 
+    @property
+    def execution_mode(self) -> Optional[str]:
+        """How the jobs of the task are executed: in a worker process, in a worker thread, or as a
+        coroutine on an event loop.
+
+        Possible values are *"process"*, *"thread"*, and *"async"*. If not set, the jobs are executed
+        in worker processes in *"standalone"* job execution mode and in worker threads in *"threaded"*
+        job execution mode. This is ignored in *"development"* job execution mode."""
+        return _tpl._replace_templates(self._properties.get(self._EXECUTION_MODE_KEY))
+
     @classmethod
     def default_config(cls) -> "TaskConfig":
         """Get the default task configuration.
@@ -188,6 +207,9 @@ class TaskConfig(Section):
                 been made on inputs.<br/>
                 The default value is False.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+                The *execution_mode* property selects how the jobs of the task are executed in
+                *"standalone"* and *"threaded"* job execution modes: *"process"*, *"thread"*, or
+                *"async"* for a coroutine function run on an event loop.
 
         Returns:
             The new task configuration.
@@ -14,16 +14,17 @@ import re
 import urllib.parse
 from abc import abstractmethod
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import and_, column, func, literal_column, or_, select, text
 
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..common.scope import Scope
 from ..data.operator import JoinOperator, Operator
 from ..exceptions.exceptions import MissingRequiredProperty, UnknownDatabaseEngine
+from ._sql_engine_registry import _SQLEngineRegistry
 from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
@@ -43,6 +44,18 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
     __DB_EXTRA_ARGS_KEY = "db_extra_args"
     __SQLITE_FOLDER_PATH = "sqlite_folder_path"
     __SQLITE_FILE_EXTENSION = "sqlite_file_extension"
+    __DB_POOL_SIZE_KEY = "db_pool_size"
+    __DB_MAX_OVERFLOW_KEY = "db_max_overflow"
+    __DB_POOL_RECYCLE_KEY = "db_pool_recycle"
+    __DB_POOL_PRE_PING_KEY = "db_pool_pre_ping"
+
+    # Data node property: SQLAlchemy create_engine() argument
+    __POOL_OPTIONS: Dict[str, str] = {
+        __DB_POOL_SIZE_KEY: "pool_size",
+        __DB_MAX_OVERFLOW_KEY: "max_overflow",
+        __DB_POOL_RECYCLE_KEY: "pool_recycle",
+        __DB_POOL_PRE_PING_KEY: "pool_pre_ping",
+    }
 
     __ENGINE_PROPERTIES: List[str] = [
         __DB_NAME_KEY,
@@ -54,6 +67,7 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
         __DB_EXTRA_ARGS_KEY,
         __SQLITE_FOLDER_PATH,
         __SQLITE_FILE_EXTENSION,
+        *__POOL_OPTIONS,
     ]
 
     __DB_HOST_DEFAULT = "localhost"
@@ -130,6 +144,7 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
                 self.__DB_EXTRA_ARGS_KEY,
                 self.__SQLITE_FOLDER_PATH,
                 self.__SQLITE_FILE_EXTENSION,
+                *self.__POOL_OPTIONS,
                 self._EXPOSED_TYPE_PROPERTY,
             }
         )
@@ -139,13 +154,41 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
             self._engine = None
         return super().__setattr__(key, value)
 
-    def filter(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND):
+    def filter(
+        self,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+        columns: Optional[List[str]] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+    ):
+        """Read and filter the data referenced by this data node.
+
+        The filters are compiled into the WHERE clause of the read query, with the values sent to the
+        database as bound parameters, so that the database can use its indexes to select the rows.
+        See `DataNode.filter()^` for the description of the *operators* and *join_operator* arguments.
+
+        Arguments:
+            operators (Optional[Union[List[Tuple], Tuple]]): An optional 3-element tuple or list of
+                3-element tuples (key, value, `Operator^`) used to filter the rows.
+            join_operator (JoinOperator^): The operator used to join the multiple filter 3-tuples.
+            columns (Optional[List[str]]): The names of the columns to read. All the columns are read
+                if not set.
+            order_by (Optional[str]): The name of the column the rows are sorted by.
+            descending (bool): If True, the rows are sorted in descending order.
+            limit (Optional[int]): The maximum number of rows to read.
+
+        Returns:
+            The filtered data, of the exposed type of the data node.
+        """
+        pushdown = {"columns": columns, "order_by": order_by, "descending": descending, "limit": limit}
         properties = self.properties
         if properties[self._EXPOSED_TYPE_PROPERTY] == self._EXPOSED_TYPE_PANDAS:
-            return self._read_as_pandas_dataframe(operators=operators, join_operator=join_operator)
+            return self._read_as_pandas_dataframe(operators=operators, join_operator=join_operator, **pushdown)
         if properties[self._EXPOSED_TYPE_PROPERTY] == self._EXPOSED_TYPE_NUMPY:
-            return self._read_as_numpy(operators=operators, join_operator=join_operator)
-        return self._read_as(operators=operators, join_operator=join_operator)
+            return self._read_as_numpy(operators=operators, join_operator=join_operator, **pushdown)
+        return self._read_as(operators=operators, join_operator=join_operator, **pushdown)
 
     def _check_required_properties(self, properties: Dict):
         db_engine = properties.get(self.__DB_ENGINE_KEY)
@@ -162,9 +205,15 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
 
     def _get_engine(self):
         if self._engine is None:
-            self._engine = create_engine(self._conn_string())
+            self._engine = _SQLEngineRegistry._get(self._conn_string(), self._pool_options())
         return self._engine
 
+    def _pool_options(self) -> Dict:
+        properties = self.properties
+        return {
+            option: properties[key] for key, option in self.__POOL_OPTIONS.items() if properties.get(key) is not None
+        }
+
     def _conn_string(self) -> str:
         properties = self.properties
         engine = properties.get(self.__DB_ENGINE_KEY)
@@ -212,66 +261,185 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
             return self._read_as_numpy()
         return self._read_as()
 
-    def _read_as(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND):
+    def read_chunks(
+        self,
+        chunksize: int = 10_000,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+    ) -> Iterator[Any]:
+        """Read the data referenced by this data node by chunks of rows.
+
+        The rows are streamed from the database through a server-side cursor when the database driver
+        supports it, so that the whole result is never held in memory.
+
+        Arguments:
+            chunksize (int): The maximum number of rows in each chunk.
+            operators (Optional[Union[List[Tuple], Tuple]]): An optional 3-element tuple or list of
+                3-element tuples (key, value, `Operator^`) used to filter the rows, as in `filter()`.
+            join_operator (JoinOperator^): The operator used to join the multiple filter 3-tuples.
+
+        Returns:
+            An iterator over the chunks. Each chunk is of the exposed type of the data node: a pandas
+            DataFrame, a numpy array, or a list of objects of the custom exposed type.
+        """
+        if chunksize < 1:
+            raise ValueError(f"The chunk size must be a positive integer, not {chunksize}.")
+        return self.__read_chunks(chunksize, self._get_read_query(operators, join_operator))
+
+    def __read_chunks(self, chunksize: int, query) -> Iterator[Any]:
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        with self._get_engine().connect() as connection:
+            result = connection.execution_options(stream_results=True, max_row_buffer=chunksize).execute(query)
+            keys = list(result.keys())
+            for rows in result.partitions(chunksize):
+                if exposed_type == self._EXPOSED_TYPE_PANDAS:
+                    yield pd.DataFrame(rows, columns=keys)
+                elif exposed_type == self._EXPOSED_TYPE_NUMPY:
+                    yield pd.DataFrame(rows, columns=keys).to_numpy()
+                else:
+                    yield [exposed_type(**row._mapping) for row in rows]
+
+    def _read_as(
+        self,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+        **pushdown,
+    ):
         custom_class = self.properties[self._EXPOSED_TYPE_PROPERTY]
         with self._get_engine().connect() as connection:
-            query_result = connection.execute(text(self._get_read_query(operators, join_operator)))
-        return [custom_class(**row) for row in query_result]
+            query_result = connection.execute(self._get_read_query(operators, join_operator, **pushdown))
+            return [custom_class(**row) for row in query_result.mappings()]
 
     def _read_as_numpy(
-        self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND
+        self,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+        **pushdown,
     ) -> np.ndarray:
-        return self._read_as_pandas_dataframe(operators=operators, join_operator=join_operator).to_numpy()
+        return self._read_as_pandas_dataframe(operators=operators, join_operator=join_operator, **pushdown).to_numpy()
 
     def _read_as_pandas_dataframe(
         self,
         columns: Optional[List[str]] = None,
         operators: Optional[Union[List, Tuple]] = None,
         join_operator=JoinOperator.AND,
+        **pushdown,
     ):
         with self._get_engine().connect() as conn:
-            result = conn.execute(text(self._get_read_query(operators, join_operator)))
+            result = conn.execute(self._get_read_query(operators, join_operator, columns=columns, **pushdown))
 
             # On pandas 1.3.5 there's a bug that makes that the dataframe from sqlalchemy query is
             # created without headers
             keys = list(result.keys())
-            if columns:
-                return pd.DataFrame(result, columns=keys)[columns]
             return pd.DataFrame(result, columns=keys)
 
-    @abstractmethod
-    def _get_read_query(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND):
-        query = self._get_base_read_query()
+    def _read_window(
+        self,
+        start: int,
+        end: int,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        operators: Optional[List[Tuple]] = None,
+    ) -> Optional[Tuple[pd.DataFrame, int]]:
+        if self.properties[self._EXPOSED_TYPE_PROPERTY] != self._EXPOSED_TYPE_PANDAS:
+            return None
+        # The database sorts the rows and only returns the window. The dialect of the engine renders the
+        # LIMIT and OFFSET clauses.
+        window_query = self._get_read_query(
+            operators,
+            order_by=order_by,
+            descending=descending,
+            limit=max(end - start, 0),
+            offset=start,
+        )
+        with self._get_engine().connect() as connection:
+            row_count = connection.execute(self._get_row_count_query(operators)).scalar_one()
+            result = connection.execute(window_query)
+            window = pd.DataFrame(result, columns=list(result.keys()))
+        window.index = pd.RangeIndex(start, start + len(window))
+        return window, row_count
+
+    def _get_read_query(
+        self,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+        columns: Optional[List[str]] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ):
+        """Build the executable query that reads the rows of this data node.
+
+        The filters, the column projection, the sort order and the window are all rendered by the dialect
+        of the engine. The column names are rendered as identifiers, quoted when needed, and the filter values
+        are bound parameters, typed from their Python values.
+        """
+        if not operators and not columns and order_by is None and limit is None and not offset:
+            return text(self._get_base_read_query())
+
+        projection = [column(c) for c in columns] if columns else [literal_column("*")]
+        query = select(*projection).select_from(self._get_read_source())
+        if operators:
+            query = query.where(self.__build_where_clause(operators, join_operator))
+        if order_by is not None:
+            query = query.order_by(column(order_by).desc() if descending else column(order_by))
+        if limit is not None:
+            query = query.limit(limit)
+        if offset:
+            query = query.offset(offset)
+        return query
+
+    def _get_row_count_query(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND):
+        query = select(func.count()).select_from(self._get_read_source())
+        if operators:
+            query = query.where(self.__build_where_clause(operators, join_operator))
+        return query
 
-        if not operators:
-            return query
+    def _get_read_source(self):
+        """The FROM clause the read queries select from: the base read query wrapped as a subquery."""
+        return text(self._get_base_read_query().strip().rstrip(";")).columns().subquery("pyforge_read")
 
+    @classmethod
+    def __build_where_clause(cls, operators: Union[List, Tuple], join_operator):
         if not isinstance(operators, List):
             operators = [operators]
-
-        conditions = []
-        for key, value, operator in operators:
-            if operator == Operator.EQUAL:
-                conditions.append(f"{key} = '{value}'")
-            elif operator == Operator.NOT_EQUAL:
-                conditions.append(f"{key} <> '{value}'")
-            elif operator == Operator.GREATER_THAN:
-                conditions.append(f"{key} > '{value}'")
-            elif operator == Operator.GREATER_OR_EQUAL:
-                conditions.append(f"{key} >= '{value}'")
-            elif operator == Operator.LESS_THAN:
-                conditions.append(f"{key} < '{value}'")
-            elif operator == Operator.LESS_OR_EQUAL:
-                conditions.append(f"{key} <= '{value}'")
-
+        conditions = [cls.__build_condition(key, value, operator) for key, value, operator in operators]
         if join_operator == JoinOperator.AND:
-            query += f" WHERE {' AND '.join(conditions)}"
-        elif join_operator == JoinOperator.OR:
-            query += f" WHERE {' OR '.join(conditions)}"
-        else:
-            raise NotImplementedError(f"Join operator {join_operator} not implemented.")
-
-        return query
+            return and_(*conditions)
+        if join_operator == JoinOperator.OR:
+            return or_(*conditions)
+        raise NotImplementedError(f"Join operator {join_operator} not implemented.")
+
+    @classmethod
+    def __build_condition(cls, key: str, value: Any, operator: Operator):
+        col = column(key)
+        if operator == Operator.EQUAL:
+            return col == cls.__to_bind_value(value)
+        if operator == Operator.NOT_EQUAL:
+            return col != cls.__to_bind_value(value)
+        if operator == Operator.GREATER_THAN:
+            return col > cls.__to_bind_value(value)
+        if operator == Operator.GREATER_OR_EQUAL:
+            return col >= cls.__to_bind_value(value)
+        if operator == Operator.LESS_THAN:
+            return col < cls.__to_bind_value(value)
+        if operator == Operator.LESS_OR_EQUAL:
+            return col <= cls.__to_bind_value(value)
+        if operator == Operator.IN:
+            return col.in_([cls.__to_bind_value(v) for v in value])
+        if operator == Operator.NOT_IN:
+            return col.not_in([cls.__to_bind_value(v) for v in value])
+        if operator == Operator.BETWEEN:
+            return col.between(cls.__to_bind_value(value[0]), cls.__to_bind_value(value[1]))
+        if operator == Operator.IS_NULL:
+            return col.is_(None)
+        raise NotImplementedError(f"Operator {operator} not implemented.")
+
+    @staticmethod
+    def __to_bind_value(value: Any) -> Any:
+        # Database drivers do not accept numpy scalars as parameters.
+        return value.item() if isinstance(value, np.generic) else value
 
     @abstractmethod
     def _get_base_read_query(self) -> str:
@@ -309,4 +477,3 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
     @abstractmethod
     def _do_write(self, data, engine, connection) -> None:
         raise NotImplementedError
-
@@ -26,6 +26,7 @@ from ..reason import NotGlobalScope, ReasonCollection, WrongConfigType
 from ..scenario.scenario_id import ScenarioId
 from ..sequence.sequence_id import SequenceId
 from ._data_fs_repository import _DataFSRepository
+from ._edit_log import _EditLog
 from ._file_datanode_mixin import _FileDataNodeMixin
 from .data_node import DataNode
 from .data_node_id import DataNodeId
@@ -61,10 +62,16 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
             dn_configs_and_owner_id, cls._build_filters_with_version(None)
         )
 
-        return {
-            dn_config: data_nodes.get((dn_config, owner_id)) or cls._create_and_set(dn_config, owner_id, None)
-            for dn_config, owner_id in dn_configs_and_owner_id
-        }
+        new_data_nodes = []
+        for dn_config, owner_id in dn_configs_and_owner_id:
+            if (dn_config, owner_id) not in data_nodes:
+                data_nodes[dn_config, owner_id] = data_node = cls.__create(dn_config, owner_id, None)
+                new_data_nodes.append(data_node)
+        cls._set_many(new_data_nodes)
+        for data_node in new_data_nodes:
+            Notifier.publish(_make_event(data_node, EventOperation.CREATION))
+
+        return {dn_config: data_nodes[dn_config, owner_id] for dn_config, owner_id in dn_configs_and_owner_id}
 
     @classmethod
     def _can_create(cls, config: Optional[DataNodeConfig] = None) -> ReasonCollection:
@@ -133,10 +140,16 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
         for data_node in data_nodes:
             cls._clean_generated_file(data_node)
 
+    @classmethod
+    def _clean_edit_logs(cls, data_nodes: Iterable[DataNode]) -> None:
+        for data_node in data_nodes:
+            _EditLog._delete(data_node.id)
+
     @classmethod
     def _delete(cls, data_node_id: DataNodeId) -> None:
         if data_node := cls._get(data_node_id, None):
             cls._clean_generated_file(data_node)
+            cls._clean_edit_logs([data_node])
         super()._delete(data_node_id)
 
     @classmethod
@@ -146,19 +159,23 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
             if data_node := cls._get(data_node_id):
                 data_nodes.append(data_node)
         cls._clean_generated_files(data_nodes)
+        cls._clean_edit_logs(data_nodes)
         super()._delete_many(data_node_ids)
 
     @classmethod
     def _delete_all(cls) -> None:
         data_nodes = cls._get_all()
         cls._clean_generated_files(data_nodes)
+        cls._clean_edit_logs(data_nodes)
         super()._delete_all()
 
     @classmethod
     def _delete_by_version(cls, version_number: str) -> None:
         data_nodes = cls._get_all(version_number)
         cls._clean_generated_files(data_nodes)
+        cls._clean_edit_logs(data_nodes)
         cls._repository._delete_by(attribute="version", value=version_number)
+        cls._entity_cache()._clear()
         Notifier.publish(
             Event(EventEntityType.DATA_NODE, EventOperation.DELETION, metadata={"delete_by_version": version_number})
         )
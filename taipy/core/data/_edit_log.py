@@ -0,0 +1,164 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+
+import json
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pyforge.common.config import Config
+
+from .._repository._decoder import _Decoder
+from .._repository._encoder import _Encoder
+from .data_node_id import Edit
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+
+class _EditLog:
+    """Append-only log of the edits of the data nodes.
+
+    The edits of each data node are stored as JSON lines, in a file of the "data_node_edits" folder of the
+    PyForge storage folder. Appending an edit only writes that edit, whatever the length of the history.
+
+    The appends and the rewrites of a log are serialized across threads and processes by an exclusive lock
+    on a sidecar ".lock" file, so that no edit appended by a worker is lost when the log is compacted.
+    """
+
+    _DIR_NAME = "data_node_edits"
+    _LOCK_SUFFIX = ".lock"
+
+    # The inode, the size and the number of lines of the logs, as last counted by this process.
+    _line_counts: Dict[str, Tuple[int, int, int]] = {}
+
+    @classmethod
+    def _path(cls, data_node_id: str) -> str:
+        return os.path.join(Config.core.pyforge_storage_folder, cls._DIR_NAME, f"{data_node_id}.jsonl")
+
+    @classmethod
+    def _exists(cls, data_node_id: str) -> bool:
+        return os.path.isfile(cls._path(data_node_id))
+
+    @classmethod
+    def _append(cls, data_node_id: str, edits: Iterable[Edit], max_edits: Optional[int] = None) -> None:
+        """Append edits to the log of a data node.
+
+        If *max_edits* is set, the log is compacted to its *max_edits* last edits once it holds twice
+        as many edits, so that the cost of the compaction is spread over the appends.
+        """
+        path = cls._path(data_node_id)
+        lines = "".join(f"{json.dumps(edit, ensure_ascii=False, cls=_Encoder)}\n" for edit in edits)
+        with cls.__lock(path):
+            with open(path, "a", encoding="utf-8") as file:
+                file.write(lines)
+            if max_edits is not None and max_edits >= 0 and cls.__count(path) > 2 * max_edits:
+                cls.__compact(path, max_edits)
+
+    @classmethod
+    def _read(cls, data_node_id: str) -> List[Edit]:
+        return cls.__read(cls._path(data_node_id))
+
+    @classmethod
+    def _write(cls, data_node_id: str, edits: Iterable[Edit]) -> None:
+        """Replace the log of a data node."""
+        path = cls._path(data_node_id)
+        with cls.__lock(path):
+            cls.__replace(path, edits)
+
+    @classmethod
+    def _compact(cls, data_node_id: str, max_edits: int) -> None:
+        """Only keep the *max_edits* last edits of a data node."""
+        path = cls._path(data_node_id)
+        with cls.__lock(path):
+            cls.__compact(path, max_edits)
+
+    @classmethod
+    def _delete(cls, data_node_id: str) -> None:
+        path = cls._path(data_node_id)
+        if not os.path.isfile(path):
+            return
+        with cls.__lock(path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        cls._line_counts.pop(path, None)
+        try:
+            os.remove(f"{path}{cls._LOCK_SUFFIX}")
+        except OSError:
+            pass
+
+    @staticmethod
+    def __read(path: str) -> List[Edit]:
+        try:
+            with open(path, encoding="utf-8") as file:
+                # A line being appended by another process is ignored until it is complete.
+                return [json.loads(line, cls=_Decoder) for line in file if line.endswith("\n") and line.strip()]
+        except FileNotFoundError:
+            return []
+
+    @classmethod
+    def __compact(cls, path: str, max_edits: int) -> None:
+        edits = cls.__read(path)
+        cls.__replace(path, edits[-max_edits:] if max_edits else [])
+
+    @classmethod
+    def __replace(cls, path: str, edits: Iterable[Edit]) -> None:
+        # The temporary file name is unique, so that concurrent rewrites never share it.
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=os.path.dirname(path), suffix=".tmp", delete=False
+        ) as file:
+            file.writelines(f"{json.dumps(edit, ensure_ascii=False, cls=_Encoder)}\n" for edit in edits)
+        os.replace(file.name, path)
+        cls._line_counts.pop(path, None)
+
+    @classmethod
+    def __count(cls, path: str) -> int:
+        # Only the lines appended since the last count are counted, unless the log was replaced meanwhile.
+        inode, size, count = cls._line_counts.get(path, (-1, 0, 0))
+        with open(path, "rb") as file:
+            stat = os.fstat(file.fileno())
+            if stat.st_ino != inode or stat.st_size < size:
+                size, count = 0, 0
+            file.seek(size)
+            count += sum(chunk.count(b"\n") for chunk in iter(lambda: file.read(1 << 20), b""))
+            cls._line_counts[path] = (stat.st_ino, file.tell(), count)
+        return count
+
+    @classmethod
+    @contextmanager
+    def __lock(cls, path: str) -> Iterator[None]:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}{cls._LOCK_SUFFIX}", "a+b") as lock_file:
+            if sys.platform == "win32":
+                lock_file.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        # LK_LOCK gives up after 10 seconds.
+                        continue
+                try:
+                    yield
+                finally:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                # The lock is released when the lock file is closed.
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                yield
@@ -10,9 +10,6 @@
 # specific language governing permissions and limitations under the License.
 
 from collections.abc import Hashable
-from functools import reduce
-from itertools import chain
-from operator import and_, or_
 from typing import Dict, Iterable, List, Tuple, Union
 
 import numpy as np
@@ -112,137 +109,85 @@ class _FilterDataNode:
             return {k: _FilterDataNode._filter(v, operators, join_operator) for k, v in data.items()}
 
         if not isinstance(operators[0], (list, tuple)):
-            if isinstance(data, pd.DataFrame):
-                return _FilterDataNode.__filter_dataframe_per_key_value(data, operators[0], operators[1], operators[2])
-            if isinstance(data, np.ndarray):
-                list_operators = [operators]
-                return _FilterDataNode.__filter_numpy_array(data, list_operators)
-            if isinstance(data, List):
-                return _FilterDataNode.__filter_list_per_key_value(data, operators[0], operators[1], operators[2])
-        else:
-            if isinstance(data, pd.DataFrame):
-                return _FilterDataNode.__filter_dataframe(data, operators, join_operator=join_operator)
-            if isinstance(data, np.ndarray):
-                return _FilterDataNode.__filter_numpy_array(data, operators, join_operator=join_operator)
-            if isinstance(data, List):
-                return _FilterDataNode.__filter_list(data, operators, join_operator=join_operator)
+            operators = [operators]
+        if isinstance(data, pd.DataFrame):
+            return _FilterDataNode.__filter_dataframe(data, operators, join_operator=join_operator)
+        if isinstance(data, np.ndarray):
+            return _FilterDataNode.__filter_numpy_array(data, operators, join_operator=join_operator)
+        if isinstance(data, List):
+            return _FilterDataNode.__filter_list(data, operators, join_operator=join_operator)
         raise NotImplementedError
 
     @staticmethod
     def __filter_dataframe(df_data: pd.DataFrame, operators: Union[List, Tuple], join_operator=JoinOperator.AND):
-        if join_operator == JoinOperator.AND:
-            how = "inner"
-        elif join_operator == JoinOperator.OR:
-            how = "outer"
-        else:
-            raise NotImplementedError
-
-        filtered_df_data = [
-            _FilterDataNode.__filter_dataframe_per_key_value(df_data, key, value, operator)
-            for key, value, operator in operators
-        ]
-
-        return _FilterDataNode.__dataframe_merge(filtered_df_data, how) if filtered_df_data else pd.DataFrame()
-
-    @staticmethod
-    def __filter_dataframe_per_key_value(df_data: pd.DataFrame, key: str, value, operator: Operator):
-        df_by_col = df_data[key]
-        if operator == Operator.EQUAL:
-            df_by_col = df_by_col == value
-        if operator == Operator.NOT_EQUAL:
-            df_by_col = df_by_col != value
-        if operator == Operator.LESS_THAN:
-            df_by_col = df_by_col < value
-        if operator == Operator.LESS_OR_EQUAL:
-            df_by_col = df_by_col <= value
-        if operator == Operator.GREATER_THAN:
-            df_by_col = df_by_col > value
-        if operator == Operator.GREATER_OR_EQUAL:
-            df_by_col = df_by_col >= value
-        return df_data[df_by_col]
-
-    @staticmethod
-    def __dataframe_merge(df_list: List, how="inner"):
-        return reduce(lambda df1, df2: pd.merge(df1, df2, how=how), df_list)
+        masks = [_FilterDataNode.__get_mask(df_data[key], value, operator) for key, value, operator in operators]
+        return df_data[_FilterDataNode.__join_masks(masks, join_operator)]
 
     @staticmethod
     def __filter_numpy_array(data: np.ndarray, operators: Union[List, Tuple], join_operator=JoinOperator.AND):
-        conditions = [
-            _FilterDataNode.__get_filter_condition_per_key_value(data, key, value, operator)
-            for key, value, operator in operators
-        ]
-
-        if join_operator == JoinOperator.AND:
-            join_conditions = reduce(and_, conditions)
-        elif join_operator == JoinOperator.OR:
-            join_conditions = reduce(or_, conditions)
-        else:
-            raise NotImplementedError
-
-        return data[join_conditions]
+        masks = [_FilterDataNode.__get_mask(data[:, int(key)], value, operator) for key, value, operator in operators]
+        return data[_FilterDataNode.__join_masks(masks, join_operator)]
 
     @staticmethod
-    def __get_filter_condition_per_key_value(array_data: np.ndarray, key, value, operator: Operator):
-        if not isinstance(key, int):
-            key = int(key)
-
+    def __filter_list(list_data: List, operators: Union[List, Tuple], join_operator=JoinOperator.AND):
+        if not list_data:
+            return []
+        # Each key is extracted once from the rows, then filtered the same way as a data frame column.
+        columns: Dict[Hashable, pd.Series] = {}
+        masks = []
+        for key, value, operator in operators:
+            if key not in columns:
+                columns[key] = pd.Series(
+                    [row.get(key) if isinstance(row, Dict) else getattr(row, key, None) for row in list_data]
+                )
+            masks.append(_FilterDataNode.__get_mask(columns[key], value, operator))
+        mask = _FilterDataNode.__join_masks(masks, join_operator)
+        return [row for row, selected in zip(list_data, mask) if selected]
+
+    @staticmethod
+    def __get_mask(column: Union[pd.Series, np.ndarray], value, operator: Operator):
         if operator == Operator.EQUAL:
-            return array_data[:, key] == value
+            return column == value
         if operator == Operator.NOT_EQUAL:
-            return array_data[:, key] != value
+            return column != value
         if operator == Operator.LESS_THAN:
-            return array_data[:, key] < value
+            return column < value
         if operator == Operator.LESS_OR_EQUAL:
-            return array_data[:, key] <= value
+            return column <= value
         if operator == Operator.GREATER_THAN:
-            return array_data[:, key] > value
+            return column > value
         if operator == Operator.GREATER_OR_EQUAL:
-            return array_data[:, key] >= value
+            return column >= value
+        if operator in (Operator.IN, Operator.NOT_IN):
+            values = list(value)
+            mask = column.isin(values) if isinstance(column, pd.Series) else np.isin(column, values)
+            return mask if operator == Operator.IN else ~mask
+        if operator == Operator.BETWEEN:
+            lower, upper = value
+            return (column >= lower) & (column <= upper)
+        if operator == Operator.IS_NULL:
+            return pd.isna(column)
 
         raise NotImplementedError
 
     @staticmethod
-    def __filter_list(list_data: List, operators: Union[List, Tuple], join_operator=JoinOperator.AND):
-        filtered_list_data = [
-            _FilterDataNode.__filter_list_per_key_value(list_data, key, value, operator)
-            for key, value, operator in operators
-        ]
-        if not filtered_list_data:
-            return filtered_list_data
-
+    def __join_masks(masks: List, join_operator: JoinOperator) -> np.ndarray:
         if join_operator == JoinOperator.AND:
-            return _FilterDataNode.__list_intersect(filtered_list_data)
+            join = np.logical_and
         elif join_operator == JoinOperator.OR:
-            merged_list = list(chain.from_iterable(filtered_list_data))
-            if all(isinstance(e, Dict) for e in merged_list):
-                return list({frozenset(item.items()) for item in merged_list})
-            return list(set(merged_list))
+            join = np.logical_or
         else:
             raise NotImplementedError
 
+        # The masks are combined in place, so that a single boolean array is allocated whatever the number of filters.
+        mask = _FilterDataNode.__to_bool_array(masks[0])
+        for other_mask in masks[1:]:
+            join(mask, _FilterDataNode.__to_bool_array(other_mask), out=mask)
+        return mask
+
     @staticmethod
-    def __filter_list_per_key_value(list_data: List, key: str, value, operator: Operator):
-        filtered_list = []
-        for row in list_data:
-            if isinstance(row, Dict):
-                row_value = row.get(key, None)
-            else:
-                row_value = getattr(row, key, None)
-
-            if operator == Operator.EQUAL and row_value == value:
-                filtered_list.append(row)
-            if operator == Operator.NOT_EQUAL and row_value != value:
-                filtered_list.append(row)
-            if operator == Operator.LESS_THAN and row_value < value:
-                filtered_list.append(row)
-            if operator == Operator.LESS_OR_EQUAL and row_value <= value:
-                filtered_list.append(row)
-            if operator == Operator.GREATER_THAN and row_value > value:
-                filtered_list.append(row)
-            if operator == Operator.GREATER_OR_EQUAL and row_value >= value:
-                filtered_list.append(row)
-        return filtered_list
-
-    @staticmethod
-    def __list_intersect(list_data):
-        return list(set(list_data.pop()).intersection(*map(set, list_data)))
+    def __to_bool_array(mask) -> np.ndarray:
+        if isinstance(mask, pd.Series):
+            # Missing values of the nullable types (pd.NA) do not match any filter.
+            return mask.to_numpy(dtype=bool, na_value=False)
+        return np.asarray(mask, dtype=bool)
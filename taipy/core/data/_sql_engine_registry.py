@@ -0,0 +1,98 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+
+import os
+import threading
+from typing import Any, Dict, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+
+
+class _SQLEngineRegistry:
+    """Process-wide registry of the SQLAlchemy engines used by the SQL data nodes.
+
+    One engine, hence one connection pool, is created per connection string and pool options. All the data
+    nodes that point to the same database share it, whatever the number of times they are reloaded.
+    """
+
+    _engines: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Engine] = {}
+    # { database url (without password): { counter_name: value } }
+    _metrics: Dict[str, Dict[str, int]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _get(cls, conn_string: str, pool_options: Dict[str, Any]) -> Engine:
+        key = (conn_string, tuple(sorted(pool_options.items())))
+        if engine := cls._engines.get(key):
+            return engine
+        with cls._lock:
+            if (engine := cls._engines.get(key)) is None:
+                engine = create_engine(conn_string, **pool_options)
+                cls.__track_connections(engine)
+                cls._engines[key] = engine
+            return engine
+
+    @classmethod
+    def _get_metrics(cls) -> Dict[str, Dict[str, int]]:
+        """Get the connection counters of each database.
+
+        Returns:
+            A dictionary where each key is a database URL, where the password is hidden, and where the
+            associated value holds the number of connections opened ("connects"), the number of times a
+            connection was taken from the pool ("checkouts") and the number of connections currently in
+            use ("checked_out").
+        """
+        with cls._lock:
+            return {url: metrics.copy() for url, metrics in cls._metrics.items()}
+
+    @classmethod
+    def _dispose_all(cls, close: bool = True) -> None:
+        with cls._lock:
+            for engine in cls._engines.values():
+                engine.dispose(close=close)
+            cls._engines.clear()
+            cls._metrics.clear()
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # The lock may have been held by another thread of the parent process.
+        cls._lock = threading.Lock()
+        cls._dispose_all(close=False)
+
+    @classmethod
+    def __track_connections(cls, engine: Engine) -> None:
+        metrics = cls._metrics.setdefault(
+            engine.url.render_as_string(hide_password=True), {"connects": 0, "checkouts": 0, "checked_out": 0}
+        )
+
+        def on_connect(*_):
+            with cls._lock:
+                metrics["connects"] += 1
+
+        def on_checkout(*_):
+            with cls._lock:
+                metrics["checkouts"] += 1
+                metrics["checked_out"] += 1
+
+        def on_checkin(*_):
+            with cls._lock:
+                metrics["checked_out"] -= 1
+
+        event.listen(engine, "connect", on_connect)
+        event.listen(engine, "checkout", on_checkout)
+        event.listen(engine, "checkin", on_checkin)
+
+
+if hasattr(os, "register_at_fork"):
+    # The pooled connections of the parent process must not be used by a forked worker process.
+    os.register_at_fork(after_in_child=_SQLEngineRegistry._reset_after_fork)
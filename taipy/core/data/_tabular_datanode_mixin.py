@@ -9,7 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Any, Callable, Dict, List, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -59,6 +59,29 @@ class _TabularDataNodeMixin(object):
             return pd.DataFrame.from_records([self._encoder(row) for row in data])
         return pd.DataFrame(data)
 
+    def _read_schema(self) -> Optional[Any]:
+        """Return empty data with the columns and the types of the data node content.
+
+        The columns and the types are found without reading the whole data (e.g., from the file metadata).
+        The empty data has the exposed type of the data node. None is returned when the columns and the
+        types cannot be found that way.
+        """
+        return None
+
+    def _is_exposed_as_dataframe_or_array(self) -> bool:
+        return self.properties[self._EXPOSED_TYPE_PROPERTY] in [  # type: ignore[attr-defined]
+            self._EXPOSED_TYPE_PANDAS,
+            self._EXPOSED_TYPE_PANDAS_DATAFRAME,
+            self._EXPOSED_TYPE_NUMPY,
+            self._EXPOSED_TYPE_NUMPY_NDARRAY,
+        ]
+
+    def _to_exposed_schema(self, empty_dataframe: pd.DataFrame) -> Union[pd.DataFrame, np.ndarray]:
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]  # type: ignore[attr-defined]
+        if exposed_type in [self._EXPOSED_TYPE_NUMPY, self._EXPOSED_TYPE_NUMPY_NDARRAY]:
+            return empty_dataframe.to_numpy()
+        return empty_dataframe
+
     @classmethod
     def _get_valid_exposed_type(cls, properties: Dict):
         if (
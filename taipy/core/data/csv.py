@@ -11,7 +11,8 @@
 
 import csv
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set
+from itertools import islice
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -20,9 +21,11 @@ from .._entity._reload import _Reloader
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..common.scope import Scope
 from ._file_datanode_mixin import _FileDataNodeMixin
+from ._filter import _FilterDataNode
 from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
+from .operator import JoinOperator
 
 
 class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
@@ -41,6 +44,10 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
 
     __STORAGE_TYPE = "csv"
     __ENCODING_KEY = "encoding"
+    # The number of rows read and filtered at once by the `filter()` method.
+    _FILTER_CHUNK_SIZE = 100_000
+    # The number of rows read to infer the types of the columns without reading the whole file.
+    _SCHEMA_SAMPLE_SIZE = 1000
 
     _REQUIRED_PROPERTIES: List[str] = []
 
@@ -128,6 +135,62 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     def _read(self):
         return self._read_from_path()
 
+    def filter(self, operators: Union[List, Tuple], join_operator=JoinOperator.AND) -> Any:
+        """Read and filter the data referenced by this data node.
+
+        The file is read and filtered by chunks of rows, so that the whole content of the file is never loaded
+        in memory at once.
+        See `DataNode.filter()^` for the description of the arguments.
+        """
+        if len(operators) == 0:
+            return self._read()
+
+        properties = self.properties
+        exposed_type = properties[self._EXPOSED_TYPE_PROPERTY]
+        if exposed_type in [self._EXPOSED_TYPE_PANDAS, self._EXPOSED_TYPE_PANDAS_DATAFRAME]:
+            chunks = [
+                _FilterDataNode._filter(chunk, operators, join_operator) for chunk in self.__read_dataframe_chunks()
+            ]
+            return pd.concat(chunks) if chunks else pd.DataFrame()
+        if exposed_type in [self._EXPOSED_TYPE_NUMPY, self._EXPOSED_TYPE_NUMPY_NDARRAY]:
+            arrays = [
+                _FilterDataNode._filter(chunk.to_numpy(), operators, join_operator)
+                for chunk in self.__read_dataframe_chunks()
+            ]
+            return np.concatenate(arrays) if arrays else np.array([])
+
+        filtered_rows = []
+        with open(self._path, encoding=properties[self.__ENCODING_KEY]) as csvFile:
+            reader = csv.DictReader(csvFile) if properties[self._HAS_HEADER_PROPERTY] else csv.reader(csvFile)
+            while chunk := [self._decoder(line) for line in islice(reader, self._FILTER_CHUNK_SIZE)]:
+                filtered_rows.extend(_FilterDataNode._filter(chunk, operators, join_operator))
+        return filtered_rows
+
+    def _read_schema(self) -> Optional[Any]:
+        # The types of the columns are inferred from the first rows of the file.
+        if not self._is_exposed_as_dataframe_or_array():
+            return None
+        properties = self.properties
+        header = "infer" if properties[self._HAS_HEADER_PROPERTY] else None
+        try:
+            sample = pd.read_csv(
+                self._path, encoding=properties[self.__ENCODING_KEY], header=header, nrows=self._SCHEMA_SAMPLE_SIZE
+            )
+        except pd.errors.EmptyDataError:
+            sample = pd.DataFrame()
+        return self._to_exposed_schema(sample.iloc[:0])
+
+    def __read_dataframe_chunks(self):
+        properties = self.properties
+        header = "infer" if properties[self._HAS_HEADER_PROPERTY] else None
+        try:
+            with pd.read_csv(
+                self._path, encoding=properties[self.__ENCODING_KEY], header=header, chunksize=self._FILTER_CHUNK_SIZE
+            ) as reader:
+                yield from reader
+        except pd.errors.EmptyDataError:
+            return
+
     def _read_from_path(self, path: Optional[str] = None, **read_kwargs) -> Any:
         if path is None:
             path = self._path
@@ -34,6 +34,7 @@ from ..exceptions.exceptions import DataNodeIsBeingEdited, NoData
 from ..job.job_id import JobId
 from ..notification.event import Event, EventEntityType, EventOperation, _make_event
 from ..reason import DataNodeEditInProgress, DataNodeIsNotWritten
+from ._edit_log import _EditLog
 from ._filter import _FilterDataNode
 from .data_node_id import EDIT_COMMENT_KEY, EDIT_EDITOR_ID_KEY, EDIT_JOB_ID_KEY, EDIT_TIMESTAMP_KEY, DataNodeId, Edit
 from .operator import JoinOperator
@@ -109,9 +110,12 @@ class DataNode(_Entity, _Labeled):
     _logger = _PyForgeLogger._get_logger()
     _REQUIRED_PROPERTIES: List[str] = []
     _PATH_KEY = "path"
+    _MAX_EDITS_KEY = "max_edits"
     __EDIT_TIMEOUT = 30
+    # Number of the last edits kept with the data node, the full history being in the edit log.
+    _EDITS_HEADER_SIZE = 1
 
-    _TAIPY_PROPERTIES: Set[str] = set()
+    _TAIPY_PROPERTIES: Set[str] = {_MAX_EDITS_KEY}
 
     id: DataNodeId
     """The unique identifier of the data node."""
@@ -199,13 +203,30 @@ class DataNode(_Entity, _Labeled):
             <li>job_id: Only populated when the data node is written by a task execution and
                 corresponds to the job's id.</li></ul>
         Additional metadata related to the edition made to the data node can also be provided in Edits.
+
+        The edits are stored in an append-only log. If the "max_edits" property of the data node is set,
+        only the last *max_edits* edits are kept.
         """
-        return self._edits
+        if not _EditLog._exists(self.id):
+            return self._edits
+        edits = _EditLog._read(self.id)
+        # The log is only compacted once it holds twice as many edits as kept.
+        if (max_edits := self._properties.get(self._MAX_EDITS_KEY)) is not None:
+            edits = edits[-int(max_edits) :] if int(max_edits) > 0 else []
+        return edits
 
     @edits.setter  # type: ignore
-    @_self_setter(_MANAGER_NAME)
     def edits(self, val):
-        self._edits = val
+        _EditLog._write(self.id, val)
+        self.__set_edits_header(val)
+
+    @_self_setter(_MANAGER_NAME, attribute_name="edits")
+    def __set_edits_header(self, edits: List[Edit]):
+        self._edits = edits[-self._EDITS_HEADER_SIZE :]
+
+    @_self_setter(_MANAGER_NAME, attribute_name="edits")
+    def __add_edit(self, edit: Edit):
+        self._edits = [*self._edits, edit][-self._EDITS_HEADER_SIZE :]
 
     @property  # type: ignore
     @_self_reload(_MANAGER_NAME)
@@ -500,8 +521,11 @@ class DataNode(_Entity, _Labeled):
             timestamp = self._get_last_modified_datetime(self._properties.get(self._PATH_KEY)) or datetime.now()
         edit[EDIT_TIMESTAMP_KEY] = timestamp
         self.last_edit_date = edit.get(EDIT_TIMESTAMP_KEY)
-        self._edits.append(typing.cast(Edit, edit))
-        self.edits = self._edits
+        # Only the new edit is written: the edits made before the log existed are moved to it first.
+        edits = [typing.cast(Edit, edit)] if _EditLog._exists(self.id) else [*self.edits, typing.cast(Edit, edit)]
+        max_edits = self._properties.get(self._MAX_EDITS_KEY)
+        _EditLog._append(self.id, edits, int(max_edits) if max_edits is not None else None)
+        self.__add_edit(edit)
 
     def lock_edit(self, editor_id: Optional[str] = None):
         """Lock the data node modification.
@@ -648,6 +672,26 @@ class DataNode(_Entity, _Labeled):
     def _write(self, data):
         raise NotImplementedError
 
+    def _read_window(
+        self,
+        start: int,
+        end: int,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        operators: Optional[List[Tuple]] = None,
+    ) -> Optional[Tuple[Any, int]]:
+        """Read a window of the rows without reading the other rows.
+
+        The rows are filtered by the (key, value, `Operator^`) 3-tuples of *operators*, joined with
+        `JoinOperator.AND`, then sorted by the values of the *order_by* column.
+
+        Returns:
+            A tuple with a pandas dataframe holding the rows from *start* (included) to *end* (excluded),
+            and the number of rows matching the filters.<br/>
+            None if the storage of the data node cannot read a window of the rows.
+        """
+        return None
+
     @staticmethod
     def _new_id(config_id: str) -> DataNodeId:
         """Generate a unique datanode identifier."""
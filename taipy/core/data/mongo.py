@@ -14,6 +14,8 @@ from importlib import util
 from inspect import isclass
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
+import pandas as pd
+
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..common._check_dependencies import _check_dependency_is_installed
 from ..common.scope import Scope
@@ -158,6 +160,11 @@ class MongoCollectionDataNode(DataNode):
         return cls.__STORAGE_TYPE
 
     def filter(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND) -> List:
+        """Read and filter the documents of the collection.
+
+        The filters are translated into a Mongo query document, so that only the matching documents are read.
+        See `DataNode.filter()^` for the description of the arguments.
+        """
         cursor = self._read_by_query(operators, join_operator)
         return [self._decoder(row) for row in cursor]
 
@@ -169,7 +176,30 @@ class MongoCollectionDataNode(DataNode):
         """Query from a Mongo collection, exclude the _id field"""
         if not operators:
             return self.collection.find()
+        return self.collection.find(self.__build_query(operators, join_operator))
 
+    def _read_window(
+        self,
+        start: int,
+        end: int,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        operators: Optional[List[Tuple]] = None,
+    ) -> Optional[Tuple[pd.DataFrame, int]]:
+        query = self.__build_query(operators, JoinOperator.AND) if operators else {}
+        documents: List[Dict] = []
+        if end > start:
+            # The server sorts the documents and skips the ones before the window.
+            cursor = self.collection.find(query, {"_id": 0})
+            if order_by is not None:
+                cursor = cursor.sort(order_by, -1 if descending else 1)
+            documents = list(cursor.skip(start).limit(end - start))
+        window = pd.DataFrame.from_records(documents)
+        window.index = pd.RangeIndex(start, start + len(window))
+        return window, self.collection.count_documents(query)
+
+    @staticmethod
+    def __build_query(operators: Union[List, Tuple], join_operator: JoinOperator) -> Dict:
         if not isinstance(operators, List):
             operators = [operators]
 
@@ -187,16 +217,22 @@ class MongoCollectionDataNode(DataNode):
                 conditions.append({key: {"$lt": value}})
             elif operator == Operator.LESS_OR_EQUAL:
                 conditions.append({key: {"$lte": value}})
+            elif operator == Operator.IN:
+                conditions.append({key: {"$in": list(value)}})
+            elif operator == Operator.NOT_IN:
+                conditions.append({key: {"$nin": list(value)}})
+            elif operator == Operator.BETWEEN:
+                conditions.append({key: {"$gte": value[0], "$lte": value[1]}})
+            elif operator == Operator.IS_NULL:
+                conditions.append({key: None})
+            else:
+                raise NotImplementedError(f"Operator {operator} is not supported.")
 
-        query = {}
         if join_operator == JoinOperator.AND:
-            query = {"$and": conditions}
-        elif join_operator == JoinOperator.OR:
-            query = {"$or": conditions}
-        else:
-            raise NotImplementedError(f"Join operator {join_operator} is not supported.")
-
-        return self.collection.find(query)
+            return {"$and": conditions}
+        if join_operator == JoinOperator.OR:
+            return {"$or": conditions}
+        raise NotImplementedError(f"Join operator {join_operator} is not supported.")
 
     def _append(self, data) -> None:
         """Append data to a Mongo collection."""
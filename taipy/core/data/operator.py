@@ -23,6 +23,10 @@ class Operator(Enum):
     - `LESS_OR_EQUAL`
     - `GREATER_THAN`
     - `GREATER_OR_EQUAL`
+    - `IN`: The value is an iterable of the accepted values.
+    - `NOT_IN`: The value is an iterable of the rejected values.
+    - `BETWEEN`: The value is a (lower, upper) tuple. Both bounds are included.
+    - `IS_NULL`: The value is ignored. Selects the missing values (None or NaN).
     """
 
     EQUAL = 1
@@ -31,6 +35,10 @@ class Operator(Enum):
     LESS_OR_EQUAL = 4
     GREATER_THAN = 5
     GREATER_OR_EQUAL = 6
+    IN = 7
+    NOT_IN = 8
+    BETWEEN = 9
+    IS_NULL = 10
 
 
 class JoinOperator(Enum):
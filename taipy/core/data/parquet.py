@@ -9,13 +9,21 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import functools
 from datetime import datetime, timedelta
+from importlib import util
+from operator import and_ as operator_and
+from operator import or_ as operator_or
 from os.path import isdir, isfile
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
+if util.find_spec("pyarrow"):
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
 from .._entity._reload import _Reloader
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..common.scope import Scope
@@ -24,6 +32,7 @@ from ._file_datanode_mixin import _FileDataNodeMixin
 from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
+from .operator import JoinOperator, Operator
 
 
 class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
@@ -203,6 +212,166 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     def _read(self):
         return self._read_from_path()
 
+    def filter(self, operators: Union[List, Tuple], join_operator=JoinOperator.AND) -> Any:
+        """Read and filter the data referenced by this data node.
+
+        With the *"pyarrow"* engine, the filters are pushed down to the Parquet reader: the row groups
+        whose statistics do not match the filters are skipped, and only the matching rows are loaded.
+        See `DataNode.filter()^` for the description of the arguments.
+        """
+        if len(operators) == 0:
+            return self._read()
+        if not isinstance(operators[0], (list, tuple)):
+            operators = [operators]
+        if (
+            self.properties[self.__ENGINE_PROPERTY] != "pyarrow"
+            or not self.last_edit_date
+            or not all(isinstance(key, str) for key, _, _ in operators)
+        ):
+            return super().filter(operators, join_operator)
+
+        expression = self.__to_pyarrow_expression(operators, join_operator)
+        if (read_filters := self.properties[self.__READ_KWARGS_PROPERTY].get("filters")) is not None:
+            if not isinstance(read_filters, pc.Expression):
+                read_filters = pq.filters_to_expression(read_filters)
+            expression = read_filters & expression
+        return self._read_from_path(filters=expression)
+
+    def __getitem__(self, item) -> Any:
+        properties = self.properties
+        is_column_projection = isinstance(item, str) or (
+            isinstance(item, list) and item and all(isinstance(column, str) for column in item)
+        )
+        if (
+            is_column_projection
+            and properties[self.__ENGINE_PROPERTY] == "pyarrow"
+            and properties[self._EXPOSED_TYPE_PROPERTY]
+            in [self._EXPOSED_TYPE_PANDAS, self._EXPOSED_TYPE_PANDAS_DATAFRAME]
+            and "columns" not in properties[self.__READ_KWARGS_PROPERTY]
+            and self.last_edit_date
+        ):
+            # Only the selected columns are read from the file.
+            return self._read_from_path(columns=[item] if isinstance(item, str) else item)[item]
+        return super().__getitem__(item)
+
+    def _read_schema(self) -> Optional[Any]:
+        # Only the footer of the file is read. The read arguments other than the column selection and the
+        # filters could change the types of the columns.
+        properties = self.properties
+        read_kwargs = properties[self.__READ_KWARGS_PROPERTY]
+        if (
+            properties[self.__ENGINE_PROPERTY] != "pyarrow"
+            or not self._is_exposed_as_dataframe_or_array()
+            or not self.last_edit_date
+            or not isfile(self._path)
+            or set(read_kwargs).difference(["columns", "filters"])
+        ):
+            return None
+        empty_dataframe = pq.read_schema(self._path).empty_table().to_pandas()
+        if (columns := read_kwargs.get("columns")) is not None:
+            empty_dataframe = empty_dataframe[list(columns)]
+        return self._to_exposed_schema(empty_dataframe)
+
+    def _read_window(
+        self,
+        start: int,
+        end: int,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        operators: Optional[List[Tuple]] = None,
+    ) -> Optional[Tuple[pd.DataFrame, int]]:
+        properties = self.properties
+        read_kwargs = properties[self.__READ_KWARGS_PROPERTY]
+        if (
+            properties[self.__ENGINE_PROPERTY] != "pyarrow"
+            or properties[self._EXPOSED_TYPE_PROPERTY]
+            not in [self._EXPOSED_TYPE_PANDAS, self._EXPOSED_TYPE_PANDAS_DATAFRAME]
+            or not self.last_edit_date
+            or not isfile(self._path)
+            or set(read_kwargs).difference(["columns", "filters"])
+        ):
+            return None
+        columns = read_kwargs.get("columns")
+        expression = read_kwargs.get("filters")
+        if expression is not None and not isinstance(expression, pc.Expression):
+            expression = pq.filters_to_expression(expression)
+        if operators:
+            operators_expression = self.__to_pyarrow_expression(operators, JoinOperator.AND)
+            expression = operators_expression if expression is None else expression & operators_expression
+        if expression is None and order_by is None:
+            return self.__read_row_groups(start, end, columns)
+
+        # The filters skip the row groups whose statistics do not match, and the rows are only converted
+        # to pandas once the window is selected.
+        table = pq.read_table(self._path, columns=columns, filters=expression)
+        if order_by is None:
+            window = table.slice(start, max(end - start, 0))
+        else:
+            indices = pc.sort_indices(table, sort_keys=[(order_by, "descending" if descending else "ascending")])
+            window = table.take(indices[start:end])
+        return window.to_pandas(), table.num_rows
+
+    def __read_row_groups(self, start: int, end: int, columns: Optional[List[str]] = None) -> Tuple[pd.DataFrame, int]:
+        # Only the row groups holding rows of the window are read.
+        parquet_file = pq.ParquetFile(self._path)
+        metadata = parquet_file.metadata
+        row_groups: List[int] = []
+        first_row = row_group_start = 0
+        for i in range(metadata.num_row_groups):
+            row_group_end = row_group_start + metadata.row_group(i).num_rows
+            if row_group_start < end and row_group_end > start:
+                if not row_groups:
+                    first_row = row_group_start
+                row_groups.append(i)
+            row_group_start = row_group_end
+        if row_groups:
+            table = parquet_file.read_row_groups(row_groups, columns=columns, use_pandas_metadata=True)
+            table = table.slice(start - first_row, end - start)
+        else:
+            table = parquet_file.schema_arrow.empty_table()
+            if columns is not None:
+                table = table.select(columns)
+        window = table.to_pandas()
+        if isinstance(window.index, pd.RangeIndex) and window.index.start == 0:
+            # The positions of the rows are the index of the whole data.
+            window.index = pd.RangeIndex(start, start + len(window))
+        return window, metadata.num_rows
+
+    @staticmethod
+    def __to_pyarrow_expression(operators: Union[List, Tuple], join_operator: JoinOperator):
+        expressions = []
+        for key, value, operator in operators:
+            field = pc.field(key)
+            if operator == Operator.EQUAL:
+                expressions.append(field == value)
+            elif operator == Operator.NOT_EQUAL:
+                # As in pandas, the missing values are different from any value.
+                expressions.append((field != value) | field.is_null(nan_is_null=True))
+            elif operator == Operator.LESS_THAN:
+                expressions.append(field < value)
+            elif operator == Operator.LESS_OR_EQUAL:
+                expressions.append(field <= value)
+            elif operator == Operator.GREATER_THAN:
+                expressions.append(field > value)
+            elif operator == Operator.GREATER_OR_EQUAL:
+                expressions.append(field >= value)
+            elif operator == Operator.IN:
+                expressions.append(field.isin(list(value)))
+            elif operator == Operator.NOT_IN:
+                expressions.append(~field.isin(list(value)) | field.is_null(nan_is_null=True))
+            elif operator == Operator.BETWEEN:
+                expressions.append((field >= value[0]) & (field <= value[1]))
+            elif operator == Operator.IS_NULL:
+                expressions.append(field.is_null(nan_is_null=True))
+            else:
+                raise NotImplementedError(f"Operator {operator} is not supported.")
+
+        if join_operator == JoinOperator.AND:
+            return functools.reduce(operator_and, expressions)
+        if join_operator == JoinOperator.OR:
+            return functools.reduce(operator_or, expressions)
+        raise NotImplementedError(f"Join operator {join_operator} is not supported.")
+
     def _read_from_path(self, path: Optional[str] = None, **read_kwargs) -> Any:
         if path is None:
             path = self._path
@@ -216,7 +385,7 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
 
         properties = self.properties
 
-        kwargs = properties[self.__READ_KWARGS_PROPERTY]
+        kwargs = dict(properties[self.__READ_KWARGS_PROPERTY])
         kwargs.update(
             {
                 self.__ENGINE_PROPERTY: properties[self.__ENGINE_PROPERTY],
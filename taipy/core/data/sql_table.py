@@ -9,15 +9,16 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import io
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Set, Union
 
 import pandas as pd
-from sqlalchemy import MetaData, Table
+from sqlalchemy import MetaData, Table, text
 
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..common.scope import Scope
-from ..exceptions.exceptions import MissingRequiredProperty
+from ..exceptions.exceptions import MissingRequiredProperty, UnknownInsertStrategy
 from ._abstract_sql import _AbstractSQLDataNode
 from .data_node_id import DataNodeId, Edit
 
@@ -45,10 +46,29 @@ class SQLTableDataNode(_AbstractSQLDataNode):
     - *sqlite_file_extension* (str): The filename extension of the SQLite file. The default value is ".db".
     - *db_extra_args* (`Dict[str, Any]`): A dictionary of additional arguments to be passed into database
         connection string.
+    - *insert_strategy* (`str`): How the rows are inserted when the data node is written or appended:
+        *"executemany"* (the default) sends batches of parameter sets, which the dialect can group into
+        multi-row INSERT statements; *"copy"* streams the rows with `COPY FROM STDIN`, on the *postgresql*
+        engine only; *"multi"* uses `pandas.DataFrame.to_sql()` with multi-row INSERT statements.
+    - *insert_chunksize* (`int`): The number of rows inserted at once. The default value is 10000 rows,
+        except for the *"multi"* strategy where it is computed to keep the number of parameters of each
+        statement under 2000.
     """
 
     __STORAGE_TYPE = "sql_table"
     __TABLE_KEY = "table_name"
+    __INSERT_STRATEGY_KEY = "insert_strategy"
+    __INSERT_CHUNKSIZE_KEY = "insert_chunksize"
+
+    _INSERT_STRATEGY_EXECUTEMANY = "executemany"
+    _INSERT_STRATEGY_COPY = "copy"
+    _INSERT_STRATEGY_MULTI = "multi"
+    __VALID_INSERT_STRATEGIES = [_INSERT_STRATEGY_EXECUTEMANY, _INSERT_STRATEGY_COPY, _INSERT_STRATEGY_MULTI]
+    __DEFAULT_INSERT_CHUNKSIZE = 10_000
+    # The NULL marker of the COPY strategy: an unquoted empty field is an empty string, not NULL.
+    __COPY_NULL = r"\N"
+    # Keeps multi-row INSERT statements under the bound parameter limits of the database engines.
+    __MAX_MULTI_INSERT_PARAMETERS = 2000
 
     def __init__(
         self,
@@ -70,6 +90,20 @@ class SQLTableDataNode(_AbstractSQLDataNode):
             properties = {}
         if properties.get(self.__TABLE_KEY) is None:
             raise MissingRequiredProperty(f"Property {self.__TABLE_KEY} is not informed and is required.")
+        if properties.get(self.__INSERT_STRATEGY_KEY) is None:
+            properties[self.__INSERT_STRATEGY_KEY] = self._INSERT_STRATEGY_EXECUTEMANY
+        if properties[self.__INSERT_STRATEGY_KEY] not in self.__VALID_INSERT_STRATEGIES:
+            raise UnknownInsertStrategy(
+                f"Invalid insert strategy: {properties[self.__INSERT_STRATEGY_KEY]}. "
+                f"Supported strategies are {', '.join(self.__VALID_INSERT_STRATEGIES)}"
+            )
+        if (
+            properties[self.__INSERT_STRATEGY_KEY] == self._INSERT_STRATEGY_COPY
+            and properties.get("db_engine") != "postgresql"
+        ):
+            raise UnknownInsertStrategy(
+                f"The {self._INSERT_STRATEGY_COPY} insert strategy is only supported by the postgresql engine."
+            )
         super().__init__(
             config_id,
             scope,
@@ -85,7 +119,7 @@ class SQLTableDataNode(_AbstractSQLDataNode):
             editor_expiration_date=editor_expiration_date,
             properties=properties,
         )
-        self._TAIPY_PROPERTIES.update({self.__TABLE_KEY})
+        self._TAIPY_PROPERTIES.update({self.__TABLE_KEY, self.__INSERT_STRATEGY_KEY, self.__INSERT_CHUNKSIZE_KEY})
 
     @classmethod
     def storage_type(cls) -> str:
@@ -95,6 +129,10 @@ class SQLTableDataNode(_AbstractSQLDataNode):
     def _get_base_read_query(self) -> str:
         return f"SELECT * FROM {self.properties[self.__TABLE_KEY]}"
 
+    def _get_read_source(self):
+        # Selecting from the table itself rather than from a subquery lets the database use its indexes.
+        return text(self.properties[self.__TABLE_KEY])
+
     def _do_append(self, data, engine, connection) -> None:
         self.__insert_data(data, engine, connection)
 
@@ -103,12 +141,15 @@ class SQLTableDataNode(_AbstractSQLDataNode):
 
     def __insert_data(self, data, engine, connection, delete_table: bool = False) -> None:
         table = self._create_table(engine)
-        self._insert_dataframe(
-            self._convert_data_to_dataframe(self.properties[self._EXPOSED_TYPE_PROPERTY], data),
-            table,
-            connection,
-            delete_table,
-        )
+        df = self._convert_data_to_dataframe(self.properties[self._EXPOSED_TYPE_PROPERTY], data)
+        chunksize = self.properties.get(self.__INSERT_CHUNKSIZE_KEY)
+        strategy = self.properties[self.__INSERT_STRATEGY_KEY]
+        if strategy == self._INSERT_STRATEGY_COPY:
+            self._copy_dataframe(df, table, connection, delete_table, chunksize)
+        elif strategy == self._INSERT_STRATEGY_MULTI:
+            self._insert_dataframe_multi(df, table, connection, delete_table, chunksize)
+        else:
+            self._insert_dataframe(df, table, connection, delete_table, chunksize)
 
     def _create_table(self, engine) -> Table:
         return Table(
@@ -128,13 +169,85 @@ class SQLTableDataNode(_AbstractSQLDataNode):
 
     @classmethod
     def _insert_dataframe(
-        cls, df: Union[pd.DataFrame, pd.Series], table: Any, connection: Any, delete_table: bool
+        cls,
+        df: Union[pd.DataFrame, pd.Series],
+        table: Any,
+        connection: Any,
+        delete_table: bool,
+        chunksize: Optional[int] = None,
     ) -> None:
+        """Insert the rows with executemany, by chunks of rows.
+
+        Only one chunk of rows is converted to parameter sets at a time. The dialects that support it
+        group the parameter sets of a chunk into multi-row INSERT statements ("insertmanyvalues").
+        """
         if isinstance(df, pd.Series):
-            data = [df.to_dict()]
-        elif isinstance(df, pd.DataFrame):
-            data = df.to_dict(orient="records")
-        cls._insert_dicts(data, table, connection, delete_table)
+            cls._insert_dicts([df.to_dict()], table, connection, delete_table)
+            return
+        cls.__delete_all_rows(table, connection, delete_table)
+        chunksize = chunksize or cls.__DEFAULT_INSERT_CHUNKSIZE
+        connection = connection.execution_options(insertmanyvalues_page_size=chunksize)
+        for start in range(0, len(df), chunksize):
+            cls._insert_dicts(df.iloc[start : start + chunksize].to_dict(orient="records"), table, connection, False)
+
+    @classmethod
+    def _insert_dataframe_multi(
+        cls,
+        df: Union[pd.DataFrame, pd.Series],
+        table: Any,
+        connection: Any,
+        delete_table: bool,
+        chunksize: Optional[int] = None,
+    ) -> None:
+        """Insert the rows with pandas, using one multi-row INSERT statement per chunk of rows."""
+        if isinstance(df, pd.Series):
+            df = df.to_frame().T
+        cls.__delete_all_rows(table, connection, delete_table)
+        if chunksize is None:
+            chunksize = max(cls.__MAX_MULTI_INSERT_PARAMETERS // max(len(df.columns), 1), 1)
+        df.to_sql(
+            table.name,
+            connection,
+            schema=table.schema,
+            if_exists="append",
+            index=False,
+            method="multi",
+            chunksize=chunksize,
+        )
+
+    @classmethod
+    def _copy_dataframe(
+        cls,
+        df: Union[pd.DataFrame, pd.Series],
+        table: Any,
+        connection: Any,
+        delete_table: bool,
+        chunksize: Optional[int] = None,
+    ) -> None:
+        """Stream the rows to PostgreSQL with COPY FROM STDIN, as CSV, by chunks of rows.
+
+        The missing values are written as an explicit NULL marker, so that the empty strings are not loaded
+        as NULL, as with the other insert strategies.
+        """
+        if isinstance(df, pd.Series):
+            df = df.to_frame().T
+        cls.__delete_all_rows(table, connection, delete_table)
+        preparer = connection.dialect.identifier_preparer
+        columns = ", ".join(preparer.quote(str(c)) for c in df.columns)
+        statement = (
+            f"COPY {preparer.format_table(table)} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{cls.__COPY_NULL}')"
+        )
+        chunksize = chunksize or cls.__DEFAULT_INSERT_CHUNKSIZE
+        # The raw connection is the one of the current transaction.
+        cursor = connection.connection.cursor()
+        try:
+            for start in range(0, len(df), chunksize):
+                buffer = io.StringIO()
+                df.iloc[start : start + chunksize].to_csv(buffer, index=False, header=False, na_rep=cls.__COPY_NULL)
+                buffer.seek(0)
+                cursor.copy_expert(statement, buffer)
+        finally:
+            cursor.close()
 
     @classmethod
     def __delete_all_rows(cls, table: Any, connection: Any, delete_table: bool) -> None:
@@ -76,6 +76,10 @@ class UnknownCompressionAlgorithm(Exception):
     """Raised if the compression algorithm is not supported by ParquetDataNode."""
 
 
+class UnknownInsertStrategy(Exception):
+    """Raised if the insert strategy is not known or not supported by the database engine of a SQLTableDataNode."""
+
+
 class NonExistingDataNode(Exception):
     """Raised if a requested DataNode is not known by the DataNode Manager."""
 
@@ -10,10 +10,12 @@
 # specific language governing permissions and limitations under the License.
 
 import uuid
-from typing import Callable, Iterable, List, Optional, Union
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Union
 
 from .._manager._manager import _Manager
 from .._repository._abstract_repository import _AbstractRepository
+from .._repository._range import _Range
 from .._version._version_manager_factory import _VersionManagerFactory
 from .._version._version_mixin import _VersionMixin
 from ..exceptions.exceptions import JobNotDeletedException
@@ -22,6 +24,7 @@ from ..reason import EntityDoesNotExist, JobIsNotFinished, ReasonCollection
 from ..task.task import Task
 from .job import Job
 from .job_id import JobId
+from .status import Status
 
 
 class _JobManager(_Manager[Job], _VersionMixin):
@@ -78,14 +81,42 @@ class _JobManager(_Manager[Job], _VersionMixin):
         _OrchestratorFactory._build_orchestrator().cancel_job(job)
 
     @classmethod
-    def _get_latest(cls, task: Task) -> Optional[Job]:
-        jobs_of_task = list(filter(lambda job: task in job, cls._get_all()))
-        if len(jobs_of_task) == 0:
-            return None
-        if len(jobs_of_task) == 1:
-            return jobs_of_task[0]
-        else:
-            return max(jobs_of_task)
+    def _get_latest(cls, task: Union[Task, str]) -> Optional[Job]:
+        return cls._repository._load_latest(cls.__build_filters(task))
+
+    @classmethod
+    def _get_all_matching(
+        cls,
+        task: Optional[Union[Task, str]] = None,
+        status: Optional[Union[Status, Iterable[Status]]] = None,
+        since: Optional[datetime] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Job]:
+        if not (filters := cls.__build_filters(task, status)):
+            return []
+        if order_by is None and not offset and limit is None:
+            if since is not None:
+                return cls._repository._load_created_since(since, filters)
+            return cls._repository._load_all(filters)
+        if since is not None:
+            filters = [{**_filter, "creation_date": _Range(since)} for _filter in filters]
+        return cls._repository._load_page(filters, order_by or "id", descending, offset, limit)
+
+    @classmethod
+    def __build_filters(
+        cls, task: Optional[Union[Task, str]] = None, status: Optional[Union[Status, Iterable[Status]]] = None
+    ) -> List[Dict]:
+        filters = cls._build_filters_with_version(None) or [{}]
+        if task is not None:
+            task_id = task if isinstance(task, str) else task.id
+            filters = [{**_filter, "task_id": task_id} for _filter in filters]
+        if status is not None:
+            statuses = [status] if isinstance(status, Status) else list(status)
+            filters = [{**_filter, "status": repr(s)} for _filter in filters for s in statuses]
+        return filters
 
     @classmethod
     def _is_deletable(cls, job: Union[Job, JobId]) -> ReasonCollection:
@@ -11,9 +11,11 @@
 
 import abc
 import threading
+import time
 from queue import Empty, SimpleQueue
+from typing import Hashable, List, Optional, Set
 
-from .event import Event
+from .event import Event, EventOperation
 
 
 class CoreEventConsumerBase(threading.Thread):
@@ -51,9 +53,35 @@ class CoreEventConsumerBase(threading.Thread):
         Then, we would specify the type of event we want to receive by registering with the Notifier.
         After that, we create an object of the consumer class by providing
         the registration_id and registered_queue and start consuming the event.
+
+    ??? example "Batched usage"
+
+        ```python
+        class MyBatchedEventConsumer(CoreEventConsumerBase):
+            def process_events(self, events: List[Event]):
+                # Custom processing of the events received within the same window
+                print(f"Received {len(events)} events")
+
+        if __name__ == "__main__":
+            registration_id, registered_queue = Notifier.register(entity_type=EventEntityType.JOB)
+
+            consumer = MyBatchedEventConsumer(registration_id, registered_queue, batch_size=100, batch_window=0.5)
+            consumer.start()
+            # ...
+            consumer.stop()
+
+            Notifier.unregister(registration_id)
+        ```
+
+        When a batch size greater than 1 is provided, the events are collected until the batch is
+        full or until *batch_window* seconds elapsed since the first event of the batch. The
+        successive updates of the same entity attribute are then coalesced, only the last one being
+        kept, and the resulting events are handed to `process_events()` at once.
     """
 
-    def __init__(self, registration_id: str, queue: SimpleQueue) -> None:
+    def __init__(
+        self, registration_id: str, queue: SimpleQueue, batch_size: int = 1, batch_window: float = 0.0
+    ) -> None:
         """Initialize a CoreEventConsumerBase instance.
 
         Arguments:
@@ -61,10 +89,18 @@ class CoreEventConsumerBase(threading.Thread):
                 registration id invoking `Notifier.register()^` method.
             queue (SimpleQueue): The queue from which events will be consumed. You can get a
                 queue invoking `Notifier.register()^` method.
+            batch_size (int): The maximum number of events collected before being processed
+                together by `process_events()`. The default value, 1, processes each event as
+                soon as it is received with `process_event()`.
+            batch_window (float): The maximum time, in seconds, to wait for more events once
+                the first event of a batch is received. Only used if *batch_size* is greater
+                than 1.
         """
         threading.Thread.__init__(self, name=f"Thread-PyForge-Core-Consumer-{registration_id}")
         self.daemon = True
         self.queue = queue
+        self.batch_size = batch_size
+        self.batch_window = batch_window
         self.__STOP_FLAG = False
         self._TIMEOUT = 0.1
 
@@ -81,7 +117,10 @@ class CoreEventConsumerBase(threading.Thread):
         while not self.__STOP_FLAG:
             try:
                 event: Event = self.queue.get(block=True, timeout=self._TIMEOUT)
-                self.process_event(event)
+                if self.batch_size > 1:
+                    self.process_events(self._coalesce(self.__collect_batch(event)))
+                else:
+                    self.process_event(event)
             except Empty:
                 pass
 
@@ -89,3 +128,54 @@ class CoreEventConsumerBase(threading.Thread):
     def process_event(self, event: Event) -> None:
         """This method should be overridden in subclasses to define how events are processed."""
         raise NotImplementedError
+
+    def process_events(self, events: List[Event]) -> None:
+        """Process the events of a batch, in the order they were published.
+
+        This method is only called if a batch size greater than 1 is provided. By default, it
+        calls `process_event()` for each event. It can be overridden in subclasses to process
+        the events of a batch at once.
+
+        Arguments:
+            events (List[Event^]): The events collected within the batch window, the successive
+                updates of the same entity attribute being coalesced.
+        """
+        for event in events:
+            self.process_event(event)
+
+    def _coalescing_key(self, event: Event) -> Optional[Hashable]:
+        """Return the key identifying the events of a batch that only the last one is processed for.
+
+        By default, the updates of the same entity attribute are coalesced. The events with a
+        None key are never coalesced.
+        """
+        if event.operation is not EventOperation.UPDATE:
+            return None
+        return event.entity_type, event.entity_id, event.attribute_name
+
+    def _coalesce(self, events: List[Event]) -> List[Event]:
+        coalesced: List[Event] = []
+        seen: Set[Hashable] = set()
+        for event in reversed(events):
+            if (key := self._coalescing_key(event)) is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            coalesced.append(event)
+        coalesced.reverse()
+        return coalesced
+
+    def __collect_batch(self, first_event: Event) -> List[Event]:
+        events = [first_event]
+        deadline = time.monotonic() + self.batch_window
+        while len(events) < self.batch_size:
+            try:
+                events.append(self.queue.get_nowait())
+            except Empty:
+                if (remaining := deadline - time.monotonic()) <= 0:
+                    break
+                try:
+                    events.append(self.queue.get(block=True, timeout=remaining))
+                except Empty:
+                    break
+        return events
@@ -9,8 +9,11 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from queue import SimpleQueue
-from typing import Any, Dict, Optional, Set, Tuple
+from queue import Queue, SimpleQueue
+from threading import Lock, Thread
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from pyforge.common.logger._pyforge_logger import _PyForgeLogger
 
 from ._registration import _Registration
 from ._topic import _Topic
@@ -55,6 +58,19 @@ class Notifier:
 
     _topics_registrations_list: Dict[_Topic, Set[_Registration]] = {}
 
+    # The topics are indexed by (entity type, entity id, operation) then by attribute name, with None as the
+    # wildcard, so that publishing an event only looks up the few buckets that can match it.
+    __topics_index: Dict[Tuple, Dict[Optional[str], _Topic]] = {}
+    __registrations_by_id: Dict[str, _Registration] = {}
+    __indexed_topics_registrations_list: Optional[Dict[_Topic, Set[_Registration]]] = None
+    __lock = Lock()
+
+    # When started, the events are delivered to the registered listeners by a background thread.
+    __fan_out_queue: Optional[Queue] = None
+    __fan_out_thread: Optional[Thread] = None
+    __STOP_FAN_OUT = object()
+    __logger = _PyForgeLogger._get_logger()
+
     @classmethod
     def register(
         cls,
@@ -124,10 +140,14 @@ class Notifier:
         """
         registration = _Registration(entity_type, entity_id, operation, attribute_name)
 
-        if registrations := cls._topics_registrations_list.get(registration.topic, None):
-            registrations.add(registration)
-        else:
-            cls._topics_registrations_list[registration.topic] = {registration}
+        with cls.__lock:
+            cls.__sync_index()
+            if registrations := cls._topics_registrations_list.get(registration.topic, None):
+                registrations.add(registration)
+            else:
+                cls._topics_registrations_list[registration.topic] = {registration}
+                cls.__index_topic(registration.topic)
+            cls.__registrations_by_id[registration.registration_id] = registration
 
         return registration.registration_id, registration.queue
 
@@ -150,19 +170,15 @@ class Notifier:
         Arguments:
             registration_id (`RegistrationId`): The registration id returned by the `register` method.
         """
-        to_remove_registration: Optional[_Registration] = None
-
-        for _, registrations in cls._topics_registrations_list.items():
-            for registration in registrations:
-                if registration.registration_id == registration_id:
-                    to_remove_registration = registration
-                    break
-
-        if to_remove_registration:
-            registrations = cls._topics_registrations_list[to_remove_registration.topic]
-            registrations.remove(to_remove_registration)
-            if len(registrations) == 0:
-                del cls._topics_registrations_list[to_remove_registration.topic]
+        with cls.__lock:
+            cls.__sync_index()
+            if to_remove_registration := cls.__registrations_by_id.pop(registration_id, None):
+                topic = to_remove_registration.topic
+                registrations = cls._topics_registrations_list[topic]
+                registrations.remove(to_remove_registration)
+                if len(registrations) == 0:
+                    del cls._topics_registrations_list[topic]
+                    cls.__unindex_topic(topic)
 
     @classmethod
     def publish(cls, event: Event) -> None:
@@ -171,10 +187,100 @@ class Notifier:
         Arguments:
             event (`Event^`): The event to publish.
         """
+        if (fan_out_queue := cls.__fan_out_queue) is not None:
+            fan_out_queue.put(event)
+        else:
+            cls.__deliver(event)
+
+    @classmethod
+    def _start_fan_out(cls, max_size: int) -> None:
+        """Deliver the published events from a background thread.
+
+        Publishing an event then only queues it, up to *max_size* events waiting to be delivered.
+        """
+        with cls.__lock:
+            if cls.__fan_out_thread is not None:
+                return
+            cls.__fan_out_queue = Queue(maxsize=max_size)
+            cls.__fan_out_thread = Thread(
+                target=cls.__fan_out, args=(cls.__fan_out_queue,), name="pyforge_notifier", daemon=True
+            )
+            cls.__fan_out_thread.start()
+
+    @classmethod
+    def _stop_fan_out(cls) -> None:
+        """Deliver the events waiting in the queue, then deliver the next published events synchronously."""
+        with cls.__lock:
+            fan_out_queue, fan_out_thread = cls.__fan_out_queue, cls.__fan_out_thread
+            cls.__fan_out_queue, cls.__fan_out_thread = None, None
+        if fan_out_queue is not None and fan_out_thread is not None:
+            fan_out_queue.put(cls.__STOP_FAN_OUT)
+            fan_out_thread.join()
+
+    @classmethod
+    def __fan_out(cls, fan_out_queue: Queue) -> None:
+        while (event := fan_out_queue.get()) is not cls.__STOP_FAN_OUT:
+            try:
+                cls.__deliver(event)
+            except Exception as e:
+                cls.__logger.error(f"Error while delivering event {event}: {e}")
+
+    @classmethod
+    def __deliver(cls, event: Event) -> None:
+        for registration in cls.__get_matching_registrations(event):
+            registration.queue.put(event)
+
+    @classmethod
+    def __get_matching_registrations(cls, event: Event) -> List[_Registration]:
+        matching_registrations: List[_Registration] = []
+        with cls.__lock:
+            cls.__sync_index()
+            for entity_type in cls.__value_or_wildcard(event.entity_type):
+                for entity_id in cls.__value_or_wildcard(event.entity_id):
+                    for operation in cls.__value_or_wildcard(event.operation):
+                        if not (topics := cls.__topics_index.get((entity_type, entity_id, operation))):
+                            continue
+                        if event.attribute_name:
+                            matching_topics: Iterable[Optional[_Topic]] = (
+                                topics.get(attribute_name)
+                                for attribute_name in cls.__value_or_wildcard(event.attribute_name)
+                            )
+                        else:
+                            matching_topics = topics.values()
+                        for topic in matching_topics:
+                            if topic is not None:
+                                matching_registrations.extend(cls._topics_registrations_list[topic])
+        return matching_registrations
+
+    @staticmethod
+    def __value_or_wildcard(value: Any) -> Tuple:
+        return (value, None) if value is not None else (None,)
+
+    @classmethod
+    def __index_topic(cls, topic: _Topic) -> None:
+        prefix = (topic.entity_type, topic.entity_id, topic.operation)
+        cls.__topics_index.setdefault(prefix, {})[topic.attribute_name] = topic
+
+    @classmethod
+    def __unindex_topic(cls, topic: _Topic) -> None:
+        prefix = (topic.entity_type, topic.entity_id, topic.operation)
+        if topics := cls.__topics_index.get(prefix):
+            topics.pop(topic.attribute_name, None)
+            if not topics:
+                del cls.__topics_index[prefix]
+
+    @classmethod
+    def __sync_index(cls) -> None:
+        """Rebuild the indexes if the registrations were replaced, e.g., reset by tests."""
+        if cls.__indexed_topics_registrations_list is cls._topics_registrations_list:
+            return
+        cls.__topics_index = {}
+        cls.__registrations_by_id = {}
         for topic, registrations in cls._topics_registrations_list.items():
-            if Notifier._is_matching(event, topic):
-                for registration in registrations:
-                    registration.queue.put(event)
+            cls.__index_topic(topic)
+            for registration in registrations:
+                cls.__registrations_by_id[registration.registration_id] = registration
+        cls.__indexed_topics_registrations_list = cls._topics_registrations_list
 
     @staticmethod
     def _is_matching(event: Event, topic: _Topic) -> bool:
@@ -22,6 +22,7 @@ from ._orchestrator._orchestrator_factory import _OrchestratorFactory
 from ._version._version_manager_factory import _VersionManagerFactory
 from .config import CoreSection
 from .exceptions.exceptions import OrchestratorServiceIsAlreadyRunning
+from .notification.notifier import Notifier
 
 
 class Orchestrator:
@@ -63,6 +64,8 @@ class Orchestrator:
             self.__class__._is_running = True
 
         self._manage_version_and_block_config()
+        if notification_queue_size := Config.core.notification_queue_size:
+            Notifier._start_fan_out(int(notification_queue_size))
         self.__start_dispatcher(force_restart)
         self.__logger.info("Orchestrator service has been started.")
 
@@ -80,6 +83,7 @@ class Orchestrator:
         self.__logger.info("Stopping job dispatcher...")
         if self._dispatcher:
             self._dispatcher = _OrchestratorFactory._remove_dispatcher(wait, timeout)
+        Notifier._stop_fan_out()
         with self.__class__.__lock_is_running:
             self.__class__._is_running = False
         with self.__class__.__lock_version_is_initialized:
@@ -14,5 +14,7 @@ from ._scenario_model import _ScenarioModel
 
 
 class _ScenarioFSRepository(_FileSystemRepository):
+    _INDEXED_ATTRIBUTES = _FileSystemRepository._INDEXED_ATTRIBUTES + ("cycle",)
+
     def __init__(self) -> None:
         super().__init__(model_type=_ScenarioModel, converter=_ScenarioConverter, dir_name="scenarios")
@@ -11,6 +11,7 @@
 
 from datetime import datetime
 from functools import partial
+from itertools import islice
 from typing import Any, Callable, Dict, List, Literal, Optional, Union
 
 from pyforge.common.config import Config
@@ -18,6 +19,7 @@ from pyforge.common.config import Config
 from .._entity._entity_ids import _EntityIds
 from .._manager._manager import _Manager
 from .._repository._abstract_repository import _AbstractRepository
+from .._repository._range import _Range
 from .._version._version_mixin import _VersionMixin
 from ..common.warn_if_inputs_not_ready import _warn_if_inputs_not_ready
 from ..config.scenario_config import ScenarioConfig
@@ -57,6 +59,7 @@ from .scenario_id import ScenarioId
 
 class _ScenarioManager(_Manager[Scenario], _VersionMixin):
     _AUTHORIZED_TAGS_KEY = "authorized_tags"
+    __STORED_SORT_KEYS = ("id", "config_id", "creation_date")
     _ENTITY_NAME = Scenario.__name__
     _EVENT_ENTITY_TYPE = EventEntityType.SCENARIO
 
@@ -185,15 +188,19 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
             sequences=sequences,
         )
 
+        tasks_to_set = []
         for task in tasks:
             if scenario_id not in task._parent_ids:
                 task._parent_ids.update([scenario_id])
-                _task_manager._set(task)
+                tasks_to_set.append(task)
+        _task_manager._set_many(tasks_to_set)
 
+        data_nodes_to_set = []
         for dn in additional_data_nodes.values():
             if scenario_id not in dn._parent_ids:
                 dn._parent_ids.update([scenario_id])
-                _data_manager._set(dn)
+                data_nodes_to_set.append(dn)
+        _data_manager._set_many(data_nodes_to_set)
 
         cls._set(scenario)
 
@@ -292,6 +299,44 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
             fil.update({"cycle": cycle.id})
         return cls._get_all_by(filters)
 
+    @classmethod
+    def _get_page(
+        cls,
+        cycle: Optional[Cycle] = None,
+        tag: Optional[str] = None,
+        created_start_time: Optional[datetime] = None,
+        created_end_time: Optional[datetime] = None,
+        sort_key: Optional[str] = None,
+        descending: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Scenario]:
+        """
+        Returns a page of the scenarios filtered by cycle, tag and creation time, sorted by the sorting key.
+
+        Without sorting key, the scenarios are sorted by creation date. When the sorting key is a stored
+        attribute, the filters, the sorting and the pagination are handled by the repository.
+        """
+        filters = cls._build_filters_with_version("all" if cycle else None) or [{}]
+        if cycle:
+            filters = [{**_filter, "cycle": cycle.id} for _filter in filters]
+        if created_start_time or created_end_time:
+            creation_time = _Range(created_start_time, created_end_time)
+            filters = [{**_filter, "creation_date": creation_time} for _filter in filters]
+        end = None if limit is None else offset + limit
+
+        if sort_key is None or sort_key in cls.__STORED_SORT_KEYS:
+            order_by = sort_key or "creation_date"
+            if not tag:
+                return cls._repository._load_page(filters, order_by, descending, offset, limit)
+            scenarios = cls._repository._iter_all(filters, order_by, descending)
+            return list(islice((scenario for scenario in scenarios if scenario.has_tag(tag)), offset, end))
+
+        scenarios = cls._repository._load_all(filters)
+        if tag:
+            scenarios = [scenario for scenario in scenarios if scenario.has_tag(tag)]
+        return cls._sort_scenarios(scenarios, descending, sort_key)[offset:end]  # type: ignore[arg-type]
+
     @classmethod
     def _get_primary_scenarios(cls) -> List[Scenario]:
         return [scenario for scenario in cls._get_all() if scenario.is_primary]
@@ -136,6 +136,14 @@ class _SequenceManager(_Manager[Sequence], _VersionMixin):
             cls._logger.error(f"Sequence {sequence.id} belongs to a non-existing Scenario {scenario_id}.")
             raise SequenceBelongsToNonExistingScenario(sequence.id, scenario_id)
 
+    @classmethod
+    def _set_many(cls, sequences: Iterable[Sequence]) -> None:
+        """
+        Save or update several Sequences.
+        """
+        for sequence in sequences:
+            cls._set(sequence)
+
     @staticmethod
     def __get_sequence_tasks(tasks: Union[List[Task], List[TaskId]]) -> List[Task]:
         task_manager = _TaskManagerFactory._build_manager()
@@ -177,11 +185,18 @@ class _SequenceManager(_Manager[Sequence], _VersionMixin):
     @classmethod
     def _bulk_create_from_scenario(cls, scenario: Scenario) -> Dict[str, Sequence]:
         _sequences: Dict[str, Sequence] = {}
+        # The tasks shared by several sequences are updated once and saved in a single batch.
+        tasks_to_set: Dict[TaskId, Task] = {}
 
         for sequence_name, sequence_data in scenario._sequences.items():
-            sequence = cls._create(
+            tasks = [
+                tasks_to_set.get(task.id if isinstance(task, Task) else task, task)
+                for task in sequence_data.get(scenario._SEQUENCE_TASKS_KEY, [])
+            ]
+            _tasks = cls.__get_sequence_tasks(tasks)
+            sequence = cls._build_sequence(
                 sequence_name,
-                sequence_data.get(scenario._SEQUENCE_TASKS_KEY, []),
+                _tasks,
                 sequence_data.get(scenario._SEQUENCE_SUBSCRIBERS_KEY, []),
                 sequence_data.get(scenario._SEQUENCE_PROPERTIES_KEY, {}),
                 scenario.id,
@@ -189,8 +204,16 @@ class _SequenceManager(_Manager[Sequence], _VersionMixin):
             )
             if not isinstance(sequence, Sequence):
                 raise NonExistingSequence(sequence_name, scenario.id)
+            for task in _tasks:
+                if sequence.id not in task._parent_ids:
+                    task._parent_ids.update([sequence.id])
+                    tasks_to_set[task.id] = task
+            if not sequence._is_consistent():
+                raise InvalidSequence(sequence.id)
             _sequences[sequence_name] = sequence
 
+        _TaskManagerFactory._build_manager()._set_many(tasks_to_set.values())
+        for sequence in _sequences.values():
             Notifier.publish(_make_event(sequence, EventOperation.CREATION))
 
         return _sequences
@@ -252,6 +275,13 @@ class _SequenceManager(_Manager[Sequence], _VersionMixin):
             cls.__log_error_entity_not_found(sequence_id)
             return default
 
+    @classmethod
+    def _get_many(cls, sequences: Iterable[Union[str, Sequence]]) -> List[Sequence]:
+        """
+        Returns several Sequences by ids or references. The Sequences not found are ignored.
+        """
+        return [sequence for sequence in map(cls._get, sequences) if sequence is not None]
+
     @classmethod
     def _get_all(cls, version_number: Optional[str] = None) -> List[Sequence]:
         """
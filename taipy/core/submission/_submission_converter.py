@@ -37,6 +37,10 @@ class _SubmissionConverter(_AbstractConverter):
             running_jobs=list(submission._running_jobs),
             blocked_jobs=list(submission._blocked_jobs),
             pending_jobs=list(submission._pending_jobs),
+            submitted_at=submission._submitted_at.isoformat() if submission._submitted_at else None,
+            run_at=submission._run_at.isoformat() if submission._run_at else None,
+            finished_at=submission._finished_at.isoformat() if submission._finished_at else None,
+            finished_jobs=list(submission._finished_jobs),
         )
 
     @classmethod
@@ -61,4 +65,9 @@ class _SubmissionConverter(_AbstractConverter):
         submission._blocked_jobs = set(model.blocked_jobs)
         submission._pending_jobs = set(model.pending_jobs)
 
+        submission._submitted_at = datetime.fromisoformat(model.submitted_at) if model.submitted_at else None
+        submission._run_at = datetime.fromisoformat(model.run_at) if model.run_at else None
+        submission._finished_at = datetime.fromisoformat(model.finished_at) if model.finished_at else None
+        submission._finished_jobs = set(model.finished_jobs)
+
         return submission
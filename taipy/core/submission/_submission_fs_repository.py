@@ -14,5 +14,7 @@ from ._submission_model import _SubmissionModel
 
 
 class _SubmissionFSRepository(_FileSystemRepository):
+    _INDEXED_ATTRIBUTES = (*_FileSystemRepository._INDEXED_ATTRIBUTES, "entity_id")
+
     def __init__(self) -> None:
         super().__init__(model_type=_SubmissionModel, converter=_SubmissionConverter, dir_name="submission")
@@ -10,7 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 from threading import Lock
-from typing import List, Optional, Union
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, Union
 
 from pyforge.common.logger._pyforge_logger import _PyForgeLogger
 
@@ -35,6 +35,13 @@ class _SubmissionManager(_Manager[Submission], _VersionMixin):
     __lock = Lock()
     __logger = _PyForgeLogger._get_logger()
 
+    # The submissions being executed, along with their repository stamp, so that they are only reloaded
+    # when they were saved by someone else in the meantime.
+    __tracked_submissions: Dict[str, Tuple[Hashable, Submission]] = {}
+    __FINISHED_JOB_STATUSES = frozenset(
+        {Status.COMPLETED, Status.SKIPPED, Status.FAILED, Status.CANCELED, Status.ABANDONED}
+    )
+
     @classmethod
     def _get_all(cls, version_number: Optional[str] = None) -> List[Submission]:
         """
@@ -55,14 +62,16 @@ class _SubmissionManager(_Manager[Submission], _VersionMixin):
         return submission
 
     @classmethod
-    def _update_submission_status(cls, submission: Submission, job: Job) -> None:
+    def _update_submission_status(cls, submission: Union[Submission, SubmissionId], job: Job) -> None:
         with cls.__lock:
-            submission = cls._get(submission)
+            submission = cls.__get_tracked_submission(submission)
+            job_status = job.status
+            cls.__record_job_dates(submission, job, job_status)
 
             if submission._submission_status == SubmissionStatus.FAILED:
+                cls.__save(submission)
                 return
 
-            job_status = job.status
             if job_status == Status.FAILED:
                 cls.__set_submission_status(submission, SubmissionStatus.FAILED, job)
                 cls.__logger.debug(
@@ -90,10 +99,7 @@ class _SubmissionManager(_Manager[Submission], _VersionMixin):
                 submission._running_jobs.discard(job.id)
                 submission._blocked_jobs.discard(job.id)
                 submission._pending_jobs.discard(job.id)
-            cls._set(submission)
 
-            # The submission_status is set later to make sure notification for updating
-            # the submission_status attribute is triggered
             if submission._is_canceled:
                 cls.__set_submission_status(submission, SubmissionStatus.CANCELED, job)
             elif submission._is_abandoned:
@@ -114,12 +120,11 @@ class _SubmissionManager(_Manager[Submission], _VersionMixin):
 
     @classmethod
     def __set_submission_status(cls, submission: Submission, new_submission_status: SubmissionStatus, job: Job) -> None:
-        if not submission._is_in_context:
-            submission = cls._get(submission)
         _current_submission_status = submission._submission_status
         submission._submission_status = new_submission_status
 
-        cls._set(submission)
+        # The submission is saved once, along with the job status change, before notifying the new status.
+        cls.__save(submission)
 
         if _current_submission_status != submission._submission_status:
             event = _make_event(
@@ -135,16 +140,42 @@ class _SubmissionManager(_Manager[Submission], _VersionMixin):
             else:
                 submission._in_context_attributes_changed_collector.append(event)
 
+    @staticmethod
+    def __record_job_dates(submission: Submission, job: Job, job_status: Status) -> None:
+        if (submitted_at := job.submitted_at) is not None:
+            if submission._submitted_at is None or submitted_at < submission._submitted_at:
+                submission._submitted_at = submitted_at
+        if job_status == Status.RUNNING and (run_at := job.run_at) is not None:
+            if submission._run_at is None or run_at < submission._run_at:
+                submission._run_at = run_at
+        if job_status in _SubmissionManager.__FINISHED_JOB_STATUSES:
+            submission._finished_jobs.add(job.id)
+            if (finished_at := job.finished_at) is not None:
+                if submission._finished_at is None or finished_at > submission._finished_at:
+                    submission._finished_at = finished_at
+
+    @classmethod
+    def __get_tracked_submission(cls, submission: Union[Submission, SubmissionId]) -> Submission:
+        submission_id = submission if isinstance(submission, str) else submission.id
+        if tracked := cls.__tracked_submissions.get(submission_id):
+            stamp, tracked_submission = tracked
+            if stamp is not None and stamp == cls._repository._get_stamp(submission_id):
+                return tracked_submission
+        return cls._get(submission_id)
+
+    @classmethod
+    def __save(cls, submission: Submission) -> None:
+        cls._set(submission)
+        if len(submission._finished_jobs) >= len(submission._jobs):
+            cls.__tracked_submissions.pop(submission.id, None)
+        else:
+            cls.__tracked_submissions[submission.id] = (cls._repository._get_stamp(submission.id), submission)
+
     @classmethod
     def _get_latest(cls, entity: Union[Scenario, Sequence, Task]) -> Optional[Submission]:
         entity_id = entity.id if not isinstance(entity, str) else entity
-        submissions_of_task = list(filter(lambda submission: submission.entity_id == entity_id, cls._get_all()))
-        if len(submissions_of_task) == 0:
-            return None
-        if len(submissions_of_task) == 1:
-            return submissions_of_task[0]
-        else:
-            return max(submissions_of_task)
+        filters = [{**_filter, "entity_id": entity_id} for _filter in cls._build_filters_with_version(None) or [{}]]
+        return cls._repository._load_latest(filters)
 
     @classmethod
     def _delete(cls, submission: Union[Submission, SubmissionId]) -> None:
@@ -152,11 +183,28 @@ class _SubmissionManager(_Manager[Submission], _VersionMixin):
             submission = cls._get(submission)
         if cls._is_deletable(submission):
             super()._delete(submission.id)
+            cls.__tracked_submissions.pop(submission.id, None)
         else:
             err = SubmissionNotDeletedException(submission.id)
             cls._logger.error(err)
             raise err
 
+    @classmethod
+    def _delete_many(cls, ids: Iterable):
+        super()._delete_many(ids)
+        for submission_id in ids:
+            cls.__tracked_submissions.pop(submission_id, None)
+
+    @classmethod
+    def _delete_all(cls):
+        super()._delete_all()
+        cls.__tracked_submissions.clear()
+
+    @classmethod
+    def _delete_by_version(cls, version_number: str):
+        super()._delete_by_version(version_number)
+        cls.__tracked_submissions.clear()
+
     @classmethod
     def _hard_delete(cls, submission_id: SubmissionId) -> None:
         submission = cls._get(submission_id)
@@ -9,7 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Union
 
 from .._repository._base_pyforge_model import _BaseModel
@@ -34,6 +34,10 @@ class _SubmissionModel(_BaseModel):
     running_jobs: List[str]
     blocked_jobs: List[str]
     pending_jobs: List[str]
+    submitted_at: Optional[str] = None
+    run_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    finished_jobs: List[str] = field(default_factory=list)
 
     @staticmethod
     def from_dict(data: Dict[str, Any]):
@@ -53,6 +57,10 @@ class _SubmissionModel(_BaseModel):
             running_jobs=_BaseModel._deserialize_attribute(data["running_jobs"]),
             blocked_jobs=_BaseModel._deserialize_attribute(data["blocked_jobs"]),
             pending_jobs=_BaseModel._deserialize_attribute(data["pending_jobs"]),
+            submitted_at=data.get("submitted_at"),
+            run_at=data.get("run_at"),
+            finished_at=data.get("finished_at"),
+            finished_jobs=_BaseModel._deserialize_attribute(data.get("finished_jobs", [])),
         )
 
     def to_list(self):
@@ -72,4 +80,8 @@ class _SubmissionModel(_BaseModel):
             _BaseModel._serialize_attribute(self.running_jobs),
             _BaseModel._serialize_attribute(self.blocked_jobs),
             _BaseModel._serialize_attribute(self.pending_jobs),
+            self.submitted_at,
+            self.run_at,
+            self.finished_at,
+            _BaseModel._serialize_attribute(self.finished_jobs),
         ]
@@ -106,6 +106,12 @@ class Submission(_Entity, _Labeled):
         self._blocked_jobs: Set = set()
         self._pending_jobs: Set = set()
 
+        # Recorded by the submission manager on each status change of the jobs, to avoid reloading them.
+        self._submitted_at: Optional[datetime] = None
+        self._run_at: Optional[datetime] = None
+        self._finished_at: Optional[datetime] = None
+        self._finished_jobs: Set = set()
+
     def __lt__(self, other) -> bool:
         """Compare the creation date of two submissions."""
         return self.creation_date.timestamp() < other.creation_date.timestamp()
@@ -163,6 +169,8 @@ class Submission(_Entity, _Labeled):
         The submitted date and time corresponds to the date and time of the first job
         that was submitted. If no job was submitted, the submitted date and time is None.
         """
+        if self._is_tracked():
+            return self._submitted_at
         jobs_submitted_at = [job.submitted_at for job in self.jobs if job.submitted_at]
         if jobs_submitted_at:
             return min(jobs_submitted_at)
@@ -176,6 +184,8 @@ class Submission(_Entity, _Labeled):
         The run date and time corresponds to the date and time of the first job
         that was run. If no job was run, the run date and time is None.
         """
+        if self._is_tracked():
+            return self._run_at
         jobs_run_at = [job.run_at for job in self.jobs if job.run_at]
         if jobs_run_at:
             return min(jobs_run_at)
@@ -190,6 +200,8 @@ class Submission(_Entity, _Labeled):
         that was completed. If at least one of the jobs is not finished, the finished
         date and time is None.
         """
+        if self._is_tracked():
+            return self._finished_at if len(self._finished_jobs) >= len(self._jobs) else None
         if all(job.finished_at for job in self.jobs):
             return max([job.finished_at for job in self.jobs if job.finished_at])
         return None
@@ -217,7 +229,7 @@ class Submission(_Entity, _Labeled):
         from ..job._job_manager_factory import _JobManagerFactory
 
         job_manager = _JobManagerFactory._build_manager()
-        return [job_manager._get(job) for job in self._jobs]
+        return job_manager._get_many(self._jobs)
 
     @jobs.setter  # type: ignore
     @_self_setter(_MANAGER_NAME)
@@ -318,6 +330,10 @@ class Submission(_Entity, _Labeled):
 
         return tp.is_deletable(self)
 
+    def _is_tracked(self) -> bool:
+        """Indicate if the execution dates were recorded from the status changes of the jobs."""
+        return self._submitted_at is not None
+
     @staticmethod
     def __new_id() -> SubmissionId:
         """Generate a unique Submission identifier."""
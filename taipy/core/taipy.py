@@ -10,7 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Literal, Optional, Set, Union, overload
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Set, Union, overload
 
 from pyforge.common.logger._pyforge_logger import _PyForgeLogger
 
@@ -39,6 +39,7 @@ from .exceptions.exceptions import DataNodeConfigIsNotGlobal, ModelNotFound, Non
 from .job._job_manager_factory import _JobManagerFactory
 from .job.job import Job
 from .job.job_id import JobId
+from .job.status import Status
 from .orchestrator import Orchestrator
 from .reason import EntityDoesNotExist, EntityIsNotSubmittableEntity, ReasonCollection
 from .scenario._scenario_manager_factory import _ScenarioManagerFactory
@@ -498,6 +499,8 @@ def get_scenarios(
     created_start_time: Optional[datetime] = None,
     created_end_time: Optional[datetime] = None,
     sort_key: Literal["name", "id", "config_id", "creation_date", "tags"] = "name",
+    limit: Optional[int] = None,
+    offset: int = 0,
 ) -> List[Scenario]:
     """Retrieve a list of existing scenarios filtered by cycle or tag.
 
@@ -520,11 +523,22 @@ def get_scenarios(
             dates, in alphabetical order for name and id, and in lexicographical order for tags.
             The default value is "name".<br/>
             If an incorrect sorting key is provided, the scenarios are sorted by name.
+        limit (Optional[int]): The maximum number of scenarios to return. If None, all the
+            scenarios are returned.
+        offset (int): The number of scenarios to skip before the first returned one.
+            The default value is 0.<br/>
+            When *limit* or *offset* is provided, the unsorted scenarios are returned by creation date.
+            Only the scenarios of the requested page are loaded, unless they are sorted by name or tags.
 
     Returns:
         The list of scenarios filtered by cycle or tag.
     """
     scenario_manager = _ScenarioManagerFactory._build_manager()
+    if limit is not None or offset:
+        sort = sort_key if is_sorted else None
+        return scenario_manager._get_page(
+            cycle, tag, created_start_time, created_end_time, sort, descending and is_sorted, offset, limit
+        )
     if not cycle and not tag:
         scenarios = scenario_manager._get_all()
     elif cycle and not tag:
@@ -765,22 +779,68 @@ def get_sequences() -> List[Sequence]:
     return _SequenceManagerFactory._build_manager()._get_all()
 
 
-def get_jobs() -> List[Job]:
-    """Return all the existing jobs.
+def get_jobs(
+    task: Optional[Task] = None,
+    status: Optional[Union[Status, Iterable[Status]]] = None,
+    since: Optional[datetime] = None,
+    order_by: Optional[str] = None,
+    descending: bool = False,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List[Job]:
+    """Return the existing jobs, optionally filtered by task, status, and creation date.
+
+    Arguments:
+        task (Optional[Task^]): If provided, only the jobs created from this task are returned.
+        status (Optional[Union[Status^, Iterable[Status^]]]): If provided, only the jobs with this
+            status, or with one of these statuses, are returned.
+        since (Optional[datetime]): If provided, only the jobs created at or after this date are returned.
+        order_by (Optional[str]): The name of the stored job attribute to sort the jobs by
+            (e.g., "creation_date"). The jobs with the same value are sorted by id.<br/>
+            If None, the jobs are sorted by id when *limit* or *offset* is provided, and returned
+            unsorted otherwise.
+        descending (bool): If True, the jobs are sorted in descending order. The default value is False.
+        limit (Optional[int]): The maximum number of jobs to return. If None, all the jobs are returned.
+        offset (int): The number of jobs to skip before the first returned one. The default value is 0.
 
     Returns:
-        The list of all jobs.
+        The list of the jobs matching all the provided criteria.
     """
-    return _JobManagerFactory._build_manager()._get_all()
+    job_manager = _JobManagerFactory._build_manager()
+    if task is None and status is None and since is None and order_by is None and limit is None and not offset:
+        return job_manager._get_all()
+    return job_manager._get_all_matching(task, status, since, order_by, descending, offset, limit)
+
 
+def get_submissions(
+    attributes: Optional[Dict[str, Any]] = None,
+    order_by: Optional[str] = None,
+    descending: bool = False,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List[Submission]:
+    """Return the existing submissions, optionally filtered, sorted, and paginated.
 
-def get_submissions() -> List[Submission]:
-    """Return all the existing submissions.
+    Arguments:
+        attributes (Optional[Dict[str, Any]]): If provided, only the submissions whose stored attributes
+            have these values are returned (e.g., `{"entity_id": scenario.id}`).
+        order_by (Optional[str]): The name of the stored submission attribute to sort the submissions by
+            (e.g., "creation_date"). The submissions with the same value are sorted by id.<br/>
+            If None, the submissions are sorted by id when *attributes*, *limit* or *offset* is
+            provided, and returned unsorted otherwise.
+        descending (bool): If True, the submissions are sorted in descending order. The default value is False.
+        limit (Optional[int]): The maximum number of submissions to return. If None, all the submissions
+            are returned.
+        offset (int): The number of submissions to skip before the first returned one. The default value is 0.
 
     Returns:
-        The list of all submissions.
+        The list of submissions.
     """
-    return _SubmissionManagerFactory._build_manager()._get_all()
+    submission_manager = _SubmissionManagerFactory._build_manager()
+    if attributes is None and order_by is None and limit is None and not offset:
+        return submission_manager._get_all()
+    filters = submission_manager._build_filters_with_attributes(attributes)
+    return submission_manager._get_page_by(filters, order_by or "id", descending, offset, limit)
 
 
 def delete_job(job: Job, force: Optional[bool] = False):
@@ -846,13 +906,35 @@ def get_latest_submission(entity: Union[Scenario, Sequence, Task]) -> Optional[S
     return _SubmissionManagerFactory._build_manager()._get_latest(entity)
 
 
-def get_data_nodes() -> List[DataNode]:
-    """Return all the existing data nodes.
+def get_data_nodes(
+    attributes: Optional[Dict[str, Any]] = None,
+    order_by: Optional[str] = None,
+    descending: bool = False,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List[DataNode]:
+    """Return the existing data nodes, optionally filtered, sorted, and paginated.
+
+    Arguments:
+        attributes (Optional[Dict[str, Any]]): If provided, only the data nodes whose stored attributes
+            have these values are returned (e.g., `{"config_id": "sales", "owner_id": scenario.id}`).
+        order_by (Optional[str]): The name of the stored data node attribute to sort the data nodes by
+            (e.g., "config_id"). The data nodes with the same value are sorted by id.<br/>
+            If None, the data nodes are sorted by id when *attributes*, *limit* or *offset* is
+            provided, and returned unsorted otherwise.
+        descending (bool): If True, the data nodes are sorted in descending order. The default value is False.
+        limit (Optional[int]): The maximum number of data nodes to return. If None, all the data nodes
+            are returned.
+        offset (int): The number of data nodes to skip before the first returned one. The default value is 0.
 
     Returns:
-        The list of all data nodes.
+        The list of data nodes.
     """
-    return _DataManagerFactory._build_manager()._get_all()
+    data_manager = _DataManagerFactory._build_manager()
+    if attributes is None and order_by is None and limit is None and not offset:
+        return data_manager._get_all()
+    filters = data_manager._build_filters_with_attributes(attributes)
+    return data_manager._get_page_by(filters, order_by or "id", descending, offset, limit)
 
 
 def get_cycles() -> List[Cycle]:
@@ -67,7 +67,10 @@ default_config: Config = {
     "run_server": True,
     "server_config": None,
     "single_client": False,
+    "state_idle_timeout": 0,
     "state_retention_period": 0,
+    "state_spill_folder": None,
+    "state_spill_min_size": 1_048_576,
     "system_notification": False,
     "theme": None,
     "time_zone": None,
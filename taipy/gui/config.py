@@ -60,7 +60,10 @@ ConfigParameter = t.Literal[
     "theme",
     "time_zone",
     "title",
+    "state_idle_timeout",
     "state_retention_period",
+    "state_spill_folder",
+    "state_spill_min_size",
     "stylekit",
     "upload_folder",
     "use_arrow",
@@ -130,7 +133,10 @@ Config = t.TypedDict(
         "run_server": bool,
         "server_config": t.Optional[ServerConfig],
         "single_client": bool,
+        "state_idle_timeout": int,
         "state_retention_period": int,
+        "state_spill_folder": t.Optional[str],
+        "state_spill_min_size": int,
         "stylekit": t.Union[bool, Stylekit],
         "system_notification": bool,
         "theme": t.Optional[t.Dict[str, t.Any]],
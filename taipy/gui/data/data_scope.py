@@ -11,29 +11,161 @@
 
 from __future__ import annotations
 
+import os
+import pickle
+import time
 import typing as t
+import uuid
+from importlib.util import find_spec
+from threading import Lock
 from types import SimpleNamespace
 
+import pandas as pd
+
 from .._warnings import _warn
+from ..utils.memory_size import _get_memory_size
 
 if t.TYPE_CHECKING:
     from ..gui import Gui
 
 
+class _DataScope(SimpleNamespace):
+    """
+    Variables of a client.
+
+    The variables that were not set in this scope are read from the scope of the initial values. These
+    values are kept once, and shared by all the scopes until a scope sets its own value (copy on write).
+
+    The large values of an idle scope can be spilled to disk: they are read back the next time they are
+    accessed.
+    """
+
+    __slots__ = ("__initial_values", "__spilled")
+
+    def __init__(self, initial_values: SimpleNamespace) -> None:
+        super().__init__()
+        self.__initial_values = initial_values
+        # { variable_name: spill_file_path }
+        self.__spilled: t.Dict[str, str] = {}
+
+    def __getattr__(self, name: str) -> t.Any:
+        # Only called for the variables that were not set in this scope.
+        if name.startswith("_DataScope__"):
+            raise AttributeError(name)
+        if (path := self.__spilled.get(name)) is not None:
+            try:
+                value = _DataScope.__load(path)
+            except FileNotFoundError:
+                if self.__spilled.get(name) != path:
+                    # Read back by a concurrent access, which set the value before removing the file.
+                    return getattr(self, name)
+                _warn(f"Spilled variable '{name}' could not be read back from disk")
+                self.__spilled.pop(name, None)
+                return getattr(self.__initial_values, name)
+            # Unregisters the spill path and removes the file.
+            setattr(self, name, value)
+            return value
+        return getattr(self.__initial_values, name)
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        # The value is set before the spill file is removed, so that a concurrent access never misses it.
+        super().__setattr__(name, value)
+        if (spilled := getattr(self, "_DataScope__spilled", None)) and (path := spilled.pop(name, None)):
+            _DataScope.__remove(path)
+
+    def __delattr__(self, name: str) -> None:
+        if (path := self.__spilled.pop(name, None)) is not None:
+            _DataScope.__remove(path)
+        else:
+            super().__delattr__(name)
+
+    def _get_variables(self) -> t.Dict[str, t.Any]:
+        for name in list(self.__spilled):
+            getattr(self, name)
+        return {**vars(self.__initial_values), **vars(self)}
+
+    def _spill(self, folder: str, min_size: int) -> t.List[str]:
+        """Write the values of this scope that are larger than *min_size* bytes to *folder*.
+
+        Returns:
+            The names of the variables that were spilled.
+        """
+        names = []
+        for name, value in list(vars(self).items()):
+            if callable(value) or _get_memory_size(value) < min_size:
+                continue
+            path = os.path.join(folder, uuid.uuid4().hex)
+            try:
+                path = _DataScope.__dump(path, value)
+            except Exception as e:
+                _warn(f"Variable '{name}' could not be spilled to disk", e)
+                continue
+            # The spill path is registered first, so that a concurrent access never misses the value.
+            self.__spilled[name] = path
+            if vars(self).get(name) is not value:
+                # Set again meanwhile: the spilled value is outdated.
+                if self.__spilled.pop(name, None) is not None:
+                    _DataScope.__remove(path)
+                continue
+            super().__delattr__(name)
+            names.append(name)
+        return names
+
+    def _clear_spilled(self) -> None:
+        paths = list(self.__spilled.values())
+        self.__spilled.clear()
+        for path in paths:
+            _DataScope.__remove(path)
+
+    @staticmethod
+    def __dump(path: str, value: t.Any) -> str:
+        if isinstance(value, pd.DataFrame) and find_spec("pyarrow"):
+            try:
+                value.to_parquet(f"{path}.parquet")
+                return f"{path}.parquet"
+            except Exception:
+                # Columns that parquet cannot represent: fall back to pickle.
+                _DataScope.__remove(f"{path}.parquet")
+        with open(f"{path}.pickle", "wb") as file:
+            pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+        return f"{path}.pickle"
+
+    @staticmethod
+    def __load(path: str) -> t.Any:
+        if path.endswith(".parquet"):
+            value = pd.read_parquet(path)
+        else:
+            with open(path, "rb") as file:
+                value = pickle.load(file)
+        return value
+
+    @staticmethod
+    def __remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
 class _DataScopes:
     _GLOBAL_ID = "global"
+    _INITIAL_VALUES_ID = "initial_values"
     _META_PRE_RENDER = "pre_render"
     _META_LOCAL_STORAGE = "local_storage"
     _DEFAULT_METADATA = {_META_PRE_RENDER: False, _META_LOCAL_STORAGE: {}}
 
     def __init__(self, gui: "Gui") -> None:
         self.__gui = gui
-        self.__scopes: t.Dict[str, SimpleNamespace] = {_DataScopes._GLOBAL_ID: SimpleNamespace()}
+        self.__initial_values = SimpleNamespace()
+        self.__scopes: t.Dict[str, _DataScope] = {_DataScopes._GLOBAL_ID: _DataScope(self.__initial_values)}
         # { scope_name: { metadata: value } }
         self.__scopes_metadata: t.Dict[str, t.Dict[str, t.Any]] = {
             _DataScopes._GLOBAL_ID: _DataScopes._get_new_default_metadata()
         }
         self.__single_client = True
+        # { scope_name: time of the last request from the client }
+        self.__last_access: t.Dict[str, float] = {}
+        self.__eviction_lock = Lock()
 
     @staticmethod
     def _get_new_default_metadata() -> t.Dict[str, t.Any]:
@@ -47,7 +179,7 @@ class _DataScopes:
     def is_single_client(self) -> bool:
         return self.__single_client
 
-    def get_scope(self, client_id: t.Optional[str]) -> t.Tuple[SimpleNamespace, t.Dict[str, str]]:
+    def get_scope(self, client_id: t.Optional[str]) -> t.Tuple[_DataScope, t.Dict[str, str]]:
         if self.__single_client:
             return self.__scopes[_DataScopes._GLOBAL_ID], self.__scopes_metadata[_DataScopes._GLOBAL_ID]
         # global context in case request is not registered or client_id is not
@@ -62,9 +194,71 @@ class _DataScopes:
             self.create_scope(client_id)
         return self.__scopes[client_id], self.__scopes_metadata[client_id]
 
-    def get_all_scopes(self) -> t.Dict[str, SimpleNamespace]:
+    def set_scope_accessed(self, id: t.Optional[str]) -> None:
+        if id and not self.__single_client and id in self.__scopes:
+            self.__last_access[id] = time.monotonic()
+
+    def evict_idle_scopes(
+        self, idle_timeout: float, spill_folder: t.Optional[str] = None, spill_min_size: int = 0
+    ) -> t.List[str]:
+        """Release the memory held by the scopes of the clients that were idle for *idle_timeout* seconds.
+
+        If *spill_folder* is set, the values of these scopes that are larger than *spill_min_size* bytes are
+        written to that folder and read back when the client accesses them again. Otherwise, the scopes are
+        deleted.
+
+        Returns:
+            The identifiers of the scopes that were deleted.
+        """
+        if self.__single_client or idle_timeout <= 0 or not self.__eviction_lock.acquire(blocking=False):
+            return []
+        try:
+            deadline = time.monotonic() - idle_timeout
+            idle_ids = [id for id, last_access in list(self.__last_access.items()) if last_access < deadline]
+            if spill_folder:
+                os.makedirs(spill_folder, exist_ok=True)
+                for id in idle_ids:
+                    if scope := self.__scopes.get(id):
+                        scope._spill(spill_folder, spill_min_size)
+                    # Tracked again when the client sends a request.
+                    self.__last_access.pop(id, None)
+                return []
+            for id in idle_ids:
+                self.delete_scope(id)
+            return idle_ids
+        finally:
+            self.__eviction_lock.release()
+
+    def get_all_scopes(self) -> t.Dict[str, _DataScope]:
         return self.__scopes
 
+    def set_initial_value(self, name: str, value: t.Any) -> None:
+        setattr(self.__initial_values, name, value)
+
+    def get_memory_usage(self) -> t.Dict[str, t.Dict[str, int]]:
+        """Estimate the size of the values held by each scope.
+
+        A value is only accounted for in the scope that holds it: the initial values and the values of
+        the shared variables, which all the client scopes reference, are not repeated for each client.
+        """
+        global_scope = self.__scopes[_DataScopes._GLOBAL_ID]
+        shared_variables = set(self.__gui._get_shared_variables())
+        usage = {_DataScopes._INITIAL_VALUES_ID: _DataScopes.__get_sizes(vars(self.__initial_values))}
+        for id, scope in list(self.__scopes.items()):
+            values = vars(scope)
+            if id != _DataScopes._GLOBAL_ID:
+                values = {
+                    name: value
+                    for name, value in values.items()
+                    if name not in shared_variables or value is not getattr(global_scope, name, None)
+                }
+            usage[id] = _DataScopes.__get_sizes(values)
+        return usage
+
+    @staticmethod
+    def __get_sizes(values: t.Dict[str, t.Any]) -> t.Dict[str, int]:
+        return {name: _get_memory_size(value) for name, value in values.items() if not callable(value)}
+
     def create_scope(self, id: str) -> None:
         if self.__single_client:
             return
@@ -72,8 +266,9 @@ class _DataScopes:
             _warn("Empty session id, might be due to unestablished WebSocket connection.")
             return
         if id not in self.__scopes:
-            self.__scopes[id] = SimpleNamespace()
+            self.__scopes[id] = _DataScope(self.__initial_values)
             self.__scopes_metadata[id] = _DataScopes._get_new_default_metadata()
+            self.__last_access[id] = time.monotonic()
             # Propagate shared variables to the new scope from the global scope
             for var in self.__gui._get_shared_variables():
                 if hasattr(self.__scopes[_DataScopes._GLOBAL_ID], var):
@@ -86,5 +281,7 @@ class _DataScopes:
             _warn("Empty session id, might be due to unestablished WebSocket connection.")
             return
         if id in self.__scopes:
+            self.__scopes[id]._clear_spilled()
             del self.__scopes[id]
             del self.__scopes_metadata[id]
+        self.__last_access.pop(id, None)
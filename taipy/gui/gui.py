@@ -28,7 +28,7 @@ from importlib.util import find_spec
 from inspect import currentframe, getabsfile, iscoroutinefunction, ismethod, ismodule
 from pathlib import Path
 from threading import Thread, Timer
-from types import FrameType, FunctionType, LambdaType, ModuleType, SimpleNamespace
+from types import FrameType, FunctionType, LambdaType, ModuleType
 from urllib.parse import unquote, urlencode, urlparse
 
 import markdown as md_lib
@@ -68,7 +68,7 @@ from .custom.utils import get_current_resource_handler, is_in_custom_page_contex
 from .data.content_accessor import _ContentAccessor
 from .data.data_accessor import _DataAccessors
 from .data.data_format import _DataFormat
-from .data.data_scope import _DataScopes
+from .data.data_scope import _DataScope, _DataScopes
 from .extension.library import Element, ElementLibrary
 from .page import Page
 from .partial import Partial
@@ -373,6 +373,8 @@ class Gui:
 
         # sid from client_id
         self.__client_id_2_sid: t.Dict[str, t.Set[str]] = {}
+        # time of the next check for idle states
+        self.__next_idle_check = 0.0
 
         # Load default config
         self._flask_blueprint: t.List[Blueprint] = []
@@ -591,13 +593,13 @@ class Gui:
     def _bindings(self):
         return self.__bindings
 
-    def _get_data_scope(self) -> SimpleNamespace:
+    def _get_data_scope(self) -> _DataScope:
         return self.__bindings._get_data_scope()
 
     def _get_data_scope_metadata(self) -> t.Dict[str, t.Any]:
         return self.__bindings._get_data_scope_metadata()
 
-    def _get_all_data_scopes(self) -> t.Dict[str, SimpleNamespace]:
+    def _get_all_data_scopes(self) -> t.Dict[str, _DataScope]:
         return self.__bindings._get_all_scopes()
 
     def _get_config(self, name: ConfigParameter, default_value: t.Any) -> t.Any:
@@ -616,8 +618,8 @@ class Gui:
             res["light"] = light_theme
         return res if theme or dark_theme or light_theme else None
 
-    def _bind(self, name: str, value: t.Any) -> None:
-        self._bindings()._bind(name, value)
+    def _bind(self, name: str, value: t.Any, copy_on_write: bool = False) -> None:
+        self._bindings()._bind(name, value, copy_on_write)
 
     def __get_state(self):
         return self.__state
@@ -644,6 +646,8 @@ class Gui:
                     sids = set()
                     self.__client_id_2_sid[client_id] = sids
                 sids.add(sid)
+        if client_id:
+            self.__bindings._set_scope_accessed(client_id)
         g.client_id = client_id
 
     def __is_var_modified_in_context(self, var_name: str, derived_vars: t.Set[str]) -> bool:
@@ -696,6 +700,27 @@ class Gui:
             except Exception as e:
                 _warn(f"Unexpected error removing state {client_id}", e)
 
+    def __evict_idle_states(self):
+        if (idle_timeout := self._get_config("state_idle_timeout", 0)) <= 0:
+            return
+        now = time.monotonic()
+        if now < self.__next_idle_check:
+            return
+        self.__next_idle_check = now + min(idle_timeout, 60)
+        # The states of the other clients are spilled to disk in the background, not while handling this message.
+        Thread(target=self.__do_evict_idle_states, args=(idle_timeout,), daemon=True).start()
+
+    def __do_evict_idle_states(self, idle_timeout: float):
+        try:
+            for client_id in self.__bindings._evict_idle_scopes(
+                idle_timeout,
+                self._get_config("state_spill_folder", None),
+                self._get_config("state_spill_min_size", 0),
+            ):
+                self.__client_id_2_sid.pop(client_id, None)
+        except Exception as e:
+            _warn("Unexpected error evicting idle states", e)
+
     def _manage_message(self, msg_type: _WsType, message: dict) -> None:
         try:
             client_id = None
@@ -753,6 +778,7 @@ class Gui:
                     _warn(f"Resolving  name '{name}' failed", e1)
             else:
                 _warn(f"Decoding Message has failed: {message}", e)
+        self.__evict_idle_states()
 
     # To be expanded by inheriting classes
     # this will be used to handle ws messages that is not handled by the base Gui class
@@ -1179,8 +1205,16 @@ class Gui:
         # apply state context if any
         state_context = payload.get("state_context")
         if isinstance(state_context, dict):
+            re_evaluated_vars = []
             for var, val in state_context.items():
-                self._update_var(var, val, True, forward=False)
+                hash_expr = self.__evaluator.get_hash_from_expr(var)
+                if hash_expr in self._get_shared_variables():
+                    self._set_broadcast()
+                _setscopeattr_drill(self, hash_expr, val)
+                if var == hash_expr or hash_expr.startswith("tpec_"):
+                    re_evaluated_vars.append(var)
+            # dependent expressions are re-evaluated once, after all the variables are set
+            self.__evaluator.re_evaluate_exprs(self, re_evaluated_vars)
 
     @staticmethod
     def set_unsupported_data_converter(converter: t.Optional[t.Callable[[t.Any], t.Any]]) -> None:
@@ -1313,7 +1347,7 @@ class Gui:
         self.__pre_render_pages()
         data = {
             k: v
-            for k, v in vars(self._get_data_scope()).items()
+            for k, v in self._get_data_scope()._get_variables().items()
             if not k.startswith("_")
             and not callable(v)
             and "TpExPr" not in k
@@ -1321,7 +1355,7 @@ class Gui:
         }
         function_data = {
             k: v
-            for k, v in vars(self._get_data_scope()).items()
+            for k, v in self._get_data_scope()._get_variables().items()
             if not k.startswith("_") and "TpExPr" not in k and isinstance(v, (FunctionType, LambdaType))
         }
         self.__send_ws(
@@ -2305,7 +2339,8 @@ class Gui:
         if not hasattr(self._bindings(), encoded_var_name):
             bind_locals = self._get_locals_bind_from_context(bind_context)
             if var_name in bind_locals.keys():
-                self._bind(encoded_var_name, bind_locals[var_name])
+                # The variables of the modules initially reference the same value in all the states.
+                self._bind(encoded_var_name, bind_locals[var_name], copy_on_write=True)
             else:
                 _warn(
                     f"Variable '{var_name}' is not available in either the '{self._get_locals_context()}' or '__main__' modules."  # noqa: E501
@@ -2646,6 +2681,20 @@ class Gui:
             }
         )
 
+    def get_memory_usage(self) -> t.Dict[str, t.Dict[str, int]]:
+        """Get the memory used by the variables of the states.
+
+        The variables defined in the modules initially reference the same value in all the states: a
+        state only holds a value of its own when the variable is set in this state. The size of the
+        initial values is reported once, under the "initial_values" key.
+
+        Returns:
+            A dictionary where each key is the identifier of a state (see `get_state_id()^`), or
+            "initial_values", and where the associated value is a dictionary that holds the estimated
+            size, in bytes, of the value of each variable held by that state.
+        """
+        return self.__bindings._get_memory_usage()
+
     def get_flask_app(self) -> Flask:
         """Get the internal Flask application.
 
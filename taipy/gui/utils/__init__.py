@@ -38,6 +38,7 @@ from .html import _get_css_var_value
 from .is_debugging import is_debugging
 from .is_port_open import _is_port_open
 from .isnotebook import _is_in_notebook
+from .memory_size import _get_memory_size
 from .types import (
     _DoNotUpdate,
     _PyForgeBase,
@@ -25,13 +25,16 @@ class _Bindings:
         self.__gui = gui
         self.__scopes = _DataScopes(gui)
 
-    def _bind(self, name: str, value: t.Any) -> None:
+    def _bind(self, name: str, value: t.Any, copy_on_write: bool = False) -> None:
         if hasattr(self, name):
             raise ValueError(f"Variable '{name}' is already bound")
         if not name.isidentifier():
             raise ValueError(f"Variable name '{name}' is invalid")
         if isinstance(value, dict):
-            setattr(self._get_data_scope(), name, _MapDict(value))
+            value = _MapDict(value)
+        if copy_on_write:
+            # The value is shared by all the scopes until they set the variable.
+            self.__scopes.set_initial_value(name, value)
         else:
             setattr(self._get_data_scope(), name, value)
         # prop = property(self.__value_getter(name), self.__value_setter(name))
@@ -71,6 +74,12 @@ class _Bindings:
     def _delete_scope(self, id: str):
         self.__scopes.delete_scope(id)
 
+    def _set_scope_accessed(self, id: t.Optional[str]):
+        self.__scopes.set_scope_accessed(id)
+
+    def _evict_idle_scopes(self, idle_timeout: float, spill_folder: t.Optional[str], spill_min_size: int):
+        return self.__scopes.evict_idle_scopes(idle_timeout, spill_folder, spill_min_size)
+
     def _new_scopes(self):
         self.__scopes = _DataScopes(self.__gui)
 
@@ -82,3 +91,6 @@ class _Bindings:
 
     def _get_all_scopes(self):
         return self.__scopes.get_all_scopes()
+
+    def _get_memory_usage(self):
+        return self.__scopes.get_memory_usage()
@@ -16,6 +16,7 @@ import builtins
 import re
 import typing as t
 import warnings
+from types import CodeType
 
 from .._warnings import PyForgeGuiWarning, _warn
 
@@ -68,6 +69,10 @@ class _Evaluator:
         self.__expr_to_holders: t.Dict[str, t.Set[t.Type[_PyForgeBase]]] = {}
         # shared variables between multiple clients
         self.__shared_variable = shared_variable
+        # key = source of an evaluated expression, value = compiled code
+        self.__source_to_code: t.Dict[str, CodeType] = {}
+        # key = expression, value = source and compiled code used to re-evaluate the expression
+        self.__expr_to_code: t.Dict[str, t.Tuple[str, CodeType]] = {}
 
     @staticmethod
     def _expr_decode(s: str):
@@ -176,6 +181,23 @@ class _Evaluator:
                 self.__shared_variable.append(expr_hash)
         return expr_hash
 
+    def __compile(self, source: str) -> CodeType:
+        if (code := self.__source_to_code.get(source)) is None:
+            code = compile(source, "<string>", "eval")
+            self.__source_to_code[source] = code
+        return code
+
+    def __get_expr_code(self, expr: str) -> t.Tuple[str, CodeType]:
+        if (source_code := self.__expr_to_code.get(expr)) is None:
+            expr_decoded, _ = _variable_decode(expr)
+            if self._is_expression(expr_decoded):
+                source = 'f"' + expr_decoded.replace('"', '\\"') + '"'
+            else:
+                source = expr_decoded
+            source_code = (source, self.__compile(source))
+            self.__expr_to_code[expr] = source_code
+        return source_code
+
     def evaluate_bind_holder(self, gui: Gui, holder: t.Type[_PyForgeBase], expr: str) -> str:
         expr_hash = self.__expr_to_hash.get(expr, "unknownExpr")
         hash_name = self.__get_holder_hash(holder, expr_hash)
@@ -261,7 +283,7 @@ class _Evaluator:
             # entries in var_val are not always seen (NameError) when passed as locals
             ctx.update(var_val)
             with gui._get_authorization():
-                expr_evaluated = eval(not_encoded_expr if is_edge_case else expr_string, ctx)
+                expr_evaluated = eval(self.__compile(not_encoded_expr if is_edge_case else expr_string), ctx)
         except Exception as e:
             exception_str = not_encoded_expr if is_edge_case else expr_string
             _warn(
@@ -283,33 +305,74 @@ class _Evaluator:
         if not expr:
             return
 
-        expr_decoded, _ = _variable_decode(expr)
         var_map = self.__expr_to_var_map.get(expr, {})
         eval_dict = {k: _getscopeattr_drill(gui, gui._bind_var(v)) for k, v in var_map.items()}
-        if self._is_expression(expr_decoded):
-            expr_string = 'f"' + _variable_decode(expr)[0].replace('"', '\\"') + '"'
-        else:
-            expr_string = expr_decoded
+        expr_string = _variable_decode(expr)[0]
         try:
+            expr_string, code = self.__get_expr_code(expr)
             ctx: t.Dict[str, t.Any] = {}
             ctx.update(self.__global_ctx)
             ctx.update(eval_dict)
-            expr_evaluated = eval(expr_string, ctx)
+            expr_evaluated = eval(code, ctx)
             _setscopeattr(gui, var_name, expr_evaluated)
             if holder is not None:
                 holder.set(expr_evaluated)
         except Exception as e:
             _warn(f"Exception raised evaluating {_Evaluator._clean_exception_expr(expr_string)}", e)
 
-    def re_evaluate_expr(self, gui: Gui, var_name: str) -> t.Set[str]:  # noqa C901
+    def re_evaluate_expr(self, gui: Gui, var_name: str) -> t.Set[str]:
         """
         This function will execute when the _update_var function is handling
         an expression with only a single variable
         """
+        return self.re_evaluate_exprs(gui, [var_name])
+
+    def re_evaluate_exprs(self, gui: Gui, var_names: t.Iterable[str]) -> t.Set[str]:
+        """
+        Re-evaluate the expressions that depend on any of the modified variables.
+
+        Each expression is evaluated once, after the expressions it depends on.
+        """
         modified_vars: t.Set[str] = set()
+        updated_vars = [v for var_name in var_names if (v := self.__propagate_update(gui, var_name)) is not None]
+        # refresh expressions and holders
+        for expr in self.__get_dependent_exprs(updated_vars):
+            hash_expr = self.__expr_to_hash.get(expr, "UnknownExpr")
+            if expr not in updated_vars and not expr.startswith(_PyForgeBase._HOLDER_PREFIX):
+                expr_var_map = self.__expr_to_var_map.get(expr)  # ["x", "y"]
+                if expr_var_map is None:
+                    _warn(f"Something is amiss with expression list for {expr}.")
+                else:
+                    eval_dict = {k: _getscopeattr_drill(gui, gui._bind_var(v)) for k, v in expr_var_map.items()}
+                    expr_string = _variable_decode(expr)[0]
+                    try:
+                        expr_string, code = self.__get_expr_code(expr)
+                        ctx: t.Dict[str, t.Any] = {}
+                        ctx.update(self.__global_ctx)
+                        ctx.update(eval_dict)
+                        expr_evaluated = eval(code, ctx)
+                        _setscopeattr(gui, hash_expr, expr_evaluated)
+                    except Exception as e:
+                        _warn(f"Exception raised evaluating {_Evaluator._clean_exception_expr(expr_string)}", e)
+            # refresh holders if any
+            for h in self.__expr_to_holders.get(expr, []):
+                holder_hash = self.__get_holder_hash(h, self.get_hash_from_expr(expr))
+                if holder_hash not in modified_vars:
+                    _setscopeattr(gui, holder_hash, self.__evaluate_holder(gui, h, expr))
+                    modified_vars.add(holder_hash)
+            modified_vars.add(hash_expr)
+        return modified_vars
+
+    def __propagate_update(self, gui: Gui, var_name: str) -> t.Optional[str]:  # noqa C901
+        """
+        Propagate the update of an edge case expression to its variable.
+
+        Returns:
+            The name of the variable which expressions depend on, or None if there is none.
+        """
         # Verify that the current hash is an edge case one (only a single variable inside the original expression)
         if var_name.startswith("tp_"):
-            return modified_vars
+            return None
         expr_original = None
         # if var_name starts with tpec_ --> it is an edge case with modified var
         if var_name.startswith("tpec_"):
@@ -344,45 +407,45 @@ class _Evaluator:
                     else:
                         key = v
                 if key == "":
-                    return modified_vars
+                    return None
                 _setscopeattr_drill(gui, f"{var_name}.{_getscopeattr(gui, key)}", _getscopeattr(gui, var_name_original))
         # A middle check to see if var_name is from _MapDict
         if "." in var_name:
             var_name = var_name[: var_name.index(".")]
         # otherwise, that var_name is correct and doesn't require any resolution
-        if var_name not in self.__var_to_expr_list:
-            # _warn("{var_name} not found.")
-            return modified_vars
-        # refresh expressions and holders
-        for expr in self.__var_to_expr_list[var_name]:
-            expr_decoded, _ = _variable_decode(expr)
-            hash_expr = self.__expr_to_hash.get(expr, "UnknownExpr")
-            if expr != var_name and not expr.startswith(_PyForgeBase._HOLDER_PREFIX):
-                expr_var_map = self.__expr_to_var_map.get(expr)  # ["x", "y"]
-                if expr_var_map is None:
-                    _warn(f"Something is amiss with expression list for {expr}.")
-                else:
-                    eval_dict = {k: _getscopeattr_drill(gui, gui._bind_var(v)) for k, v in expr_var_map.items()}
-                    if self._is_expression(expr_decoded):
-                        expr_string = 'f"' + _variable_decode(expr)[0].replace('"', '\\"') + '"'
-                    else:
-                        expr_string = expr_decoded
-                    try:
-                        ctx: t.Dict[str, t.Any] = {}
-                        ctx.update(self.__global_ctx)
-                        ctx.update(eval_dict)
-                        expr_evaluated = eval(expr_string, ctx)
-                        _setscopeattr(gui, hash_expr, expr_evaluated)
-                    except Exception as e:
-                        _warn(f"Exception raised evaluating {_Evaluator._clean_exception_expr(expr_string)}", e)
-            # refresh holders if any
-            for h in self.__expr_to_holders.get(expr, []):
-                holder_hash = self.__get_holder_hash(h, self.get_hash_from_expr(expr))
-                if holder_hash not in modified_vars:
-                    _setscopeattr(gui, holder_hash, self.__evaluate_holder(gui, h, expr))
-                    modified_vars.add(holder_hash)
-            modified_vars.add(hash_expr)
-        return modified_vars
+        return var_name
+
+    def __get_dependent_exprs(self, var_names: t.List[str]) -> t.List[str]:
+        """
+        List the expressions that depend, directly or through other expressions, on some variables.
+
+        The dependency graph links each variable to the expressions that use it, and each expression to the
+        variable that holds its value (its hash). The expressions are returned in topological order.
+        """
+        visited: t.Set[str] = set()
+        post_order: t.List[str] = []
+        # iterative depth-first traversal: (node, iterator on its dependent expressions)
+        for var_name in var_names:
+            if var_name in visited:
+                continue
+            visited.add(var_name)
+            stack = [(var_name, iter(self.__var_to_expr_list.get(var_name, ())))]
+            while stack:
+                node, dependents = stack[-1]
+                expr = next(dependents, None)
+                if expr is None:
+                    stack.pop()
+                    if node not in var_names:
+                        post_order.append(node)
+                    continue
+                if expr in visited:
+                    continue
+                visited.add(expr)
+                # the holders of the expression are refreshed with it
+                hash_expr = self.__expr_to_hash.get(expr)
+                stack.append((expr, iter(self.__var_to_expr_list.get(hash_expr, ()) if hash_expr else ())))
+        post_order.reverse()
+        return post_order
 
     def _get_instance_in_context(self, name: str):
         return self.__global_ctx.get(name)
@@ -0,0 +1,40 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+
+import sys
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+from ._map_dict import _MapDict
+
+
+def _get_memory_size(value: t.Any) -> int:
+    """Estimate the size, in bytes, of a value.
+
+    The size of the dataframes, series, and arrays includes their data. The size of the lists, tuples,
+    and dictionaries includes the size of their items, but not the size of the objects the items refer to.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, _MapDict):
+        value = value._dict
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(sys.getsizeof(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sys.getsizeof(item) for item in value.values())
+    return sys.getsizeof(value)
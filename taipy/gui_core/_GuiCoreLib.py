@@ -29,6 +29,7 @@ from ._adapters import (
     _GuiCoreScenarioSort,
 )
 from ._context import _GuiCoreContext
+from ._data_node_table import _DataNodeTableAccessor
 
 Scenario.__bases__ += (_GuiCoreDoNotUpdate,)
 Sequence.__bases__ += (_GuiCoreDoNotUpdate,)
@@ -325,6 +326,7 @@ class _GuiCore(ElementLibrary):
         gui._add_adapter_for_type(_GuiCore.__SCENARIO_ADAPTER, self.ctx.scenario_adapter)
         gui._add_adapter_for_type(_GuiCore.__DATANODE_ADAPTER, self.ctx.data_node_adapter)
         gui._add_adapter_for_type(_GuiCore.__JOB_ADAPTER, self.ctx.job_adapter)
+        gui._get_accessor()._register(_DataNodeTableAccessor)
         return _GuiCore.__CTX_VAR_NAME, self.ctx
 
     def on_user_init(self, state: State):
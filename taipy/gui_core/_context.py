@@ -51,7 +51,9 @@ from pyforge.core import delete as core_delete
 from pyforge.core import get as core_get
 from pyforge.core import submit as core_submit
 from pyforge.core.data._file_datanode_mixin import _FileDataNodeMixin
+from pyforge.core.data._tabular_datanode_mixin import _TabularDataNodeMixin
 from pyforge.core.data.data_node_id import EDIT_COMMENT_KEY, EDIT_EDITOR_ID_KEY, EDIT_JOB_ID_KEY, EDIT_TIMESTAMP_KEY
+from pyforge.core.data.mongo import MongoCollectionDataNode
 from pyforge.core.notification import CoreEventConsumerBase, EventEntityType
 from pyforge.core.notification.event import Event, EventOperation
 from pyforge.core.notification.notifier import Notifier
@@ -69,6 +71,8 @@ from ._adapters import (
     _GuiCoreScenarioProperties,
     _invoke_action,
 )
+from ._data_node_cache import _DataNodeReadCache
+from ._data_node_table import _DataNodeTable
 from ._utils import _ClientStatus
 from .filters import CustomScenarioFilter, ParamType
 
@@ -85,6 +89,13 @@ class _GuiCoreContext(CoreEventConsumerBase):
     __ACTION = "action"
     _CORE_CHANGED_NAME = "core_changed"
     _AUTH_CHANGED_NAME = "auth_changed"
+    # The core events are processed by batches so that the clients are refreshed once per entity and window
+    _EVENTS_BATCH_SIZE = 1000
+    _EVENTS_BATCH_WINDOW = 0.1
+    # The maximum size, in bytes, of the data read from the data nodes and kept for the next refreshes
+    _DATA_NODE_CACHE_SIZE = 1024**3
+    # The number of rows read to describe the columns of the data nodes that cannot provide their schema
+    _SCHEMA_SAMPLE_SIZE = 1000
 
     def __init__(self, gui: Gui) -> None:
         self.gui = gui
@@ -93,6 +104,7 @@ class _GuiCoreContext(CoreEventConsumerBase):
         self.scenario_configs: t.Optional[t.List[t.Tuple[str, str]]] = None
         self.jobs_list: t.Optional[t.List[Job]] = None
         self.client_submission: t.Dict[str, _ClientStatus] = {}
+        self.__data_node_cache = _DataNodeReadCache(self._DATA_NODE_CACHE_SIZE)
         # register to pyforge core notification
         reg_id, reg_queue = Notifier.register()
         # locks
@@ -103,7 +115,7 @@ class _GuiCoreContext(CoreEventConsumerBase):
         # Gui event listener
         gui._add_event_listener("authorization", self._auth_listener, with_state=True)
         # super
-        super().__init__(reg_id, reg_queue)
+        super().__init__(reg_id, reg_queue, self._EVENTS_BATCH_SIZE, self._EVENTS_BATCH_WINDOW)
 
     def on_user_init(self, state: State):
         self.gui._fire_event("authorization", get_state_id(state), {})
@@ -148,10 +160,18 @@ class _GuiCoreContext(CoreEventConsumerBase):
         elif event.entity_type is EventEntityType.DATA_NODE:
             with self.lock:
                 self.data_nodes_by_owner = None
+            if event.operation is EventOperation.DELETION and event.entity_id:
+                self.__data_node_cache._invalidate(event.entity_id)
             self.broadcast_core_changed(
                 {"datanode": event.entity_id if event.operation != EventOperation.DELETION else True}
             )
 
+    def _coalescing_key(self, event: Event) -> t.Optional[t.Hashable]:
+        # Apart from the submissions, the refresh of an updated entity does not depend on the updated attribute.
+        if event.operation is EventOperation.UPDATE and event.entity_type is not EventEntityType.SUBMISSION:
+            return event.entity_type, event.entity_id
+        return super()._coalescing_key(event)
+
     def broadcast_core_changed(self, payload: t.Dict[str, t.Any], client_id: t.Optional[str] = None):
         self.gui._broadcast(_GuiCoreContext._CORE_CHANGED_NAME, payload, client_id)
 
@@ -1119,7 +1139,8 @@ class _GuiCoreContext(CoreEventConsumerBase):
                     else payload.get("value")
                 )
                 # user_value = payload.get("user_value")
-                data = self.__read_tabular_data(datanode)
+                # The data is modified in place: it is not taken from the cache shared by the clients.
+                data = datanode.read()
                 new_data: t.Any = None
                 if isinstance(data, (pd.DataFrame, pd.Series)):
                     if isinstance(data, pd.DataFrame):
@@ -1200,13 +1221,38 @@ class _GuiCoreContext(CoreEventConsumerBase):
         return None
 
     def __read_tabular_data(self, datanode: DataNode):
-        return datanode.read()
+        # The last edit date is read first: if the data node is edited during the read, the value is not served
+        # for the new edit date.
+        last_edit_date = datanode.last_edit_date
+        if (value := self.__data_node_cache._get(datanode.id, last_edit_date)) is not None:
+            return value
+        value = datanode.read()
+        self.__data_node_cache._put(datanode.id, last_edit_date, value)
+        return value
+
+    def __read_tabular_schema(self, datanode: DataNode):
+        # Describing the columns does not require the data when the data node can provide its schema, or
+        # read the first rows.
+        if isinstance(datanode, _TabularDataNodeMixin) and (schema := datanode._read_schema()) is not None:
+            return schema
+        if (window := datanode._read_window(0, _GuiCoreContext._SCHEMA_SAMPLE_SIZE)) is not None:
+            return window[0].iloc[:0]
+        return self.__read_tabular_data(datanode)
 
     def get_data_node_tabular_data(self, id: str):
         self.__lazy_start()
         if id and is_readable(t.cast(DataNodeId, id)) and (dn := core_get(id)) and isinstance(dn, DataNode):
             if dn.is_ready_for_reading or (dn.edit_in_progress and dn.editor_id == self.gui._get_client_id()):
                 try:
+                    # The tables request the windows of rows they display, unless the data is being edited.
+                    if (
+                        isinstance(dn, (_TabularDataNodeMixin, MongoCollectionDataNode))
+                        and not dn.edit_in_progress
+                        and dn._read_window(0, 0) is not None
+                    ):
+                        return _DataNodeTable(
+                            dn, lambda: self.__read_tabular_data(dn), lambda: self.__read_tabular_schema(dn)
+                        )
                     value = self.__read_tabular_data(dn)
                     if _GuiCoreDatanodeAdapter._is_tabular_data(dn, value):
                         return value
@@ -1219,7 +1265,7 @@ class _GuiCoreContext(CoreEventConsumerBase):
         if id and is_readable(t.cast(DataNodeId, id)) and (dn := core_get(id)) and isinstance(dn, DataNode):
             if dn.is_ready_for_reading or (dn.edit_in_progress and dn.editor_id == self.gui._get_client_id()):
                 try:
-                    value = self.__read_tabular_data(dn)
+                    value = self.__read_tabular_schema(dn)
                     if _GuiCoreDatanodeAdapter._is_tabular_data(dn, value):
                         return self.gui._tbl_cols(
                             True, True, "{}", json.dumps({"data": "tabular_data"}), tabular_data=value
@@ -1238,7 +1284,7 @@ class _GuiCoreContext(CoreEventConsumerBase):
                         True,
                         "{}",
                         json.dumps({"data": "tabular_data"}),
-                        tabular_data=self.__read_tabular_data(dn),
+                        tabular_data=self.__read_tabular_schema(dn),
                     )
                 except Exception:
                     return None
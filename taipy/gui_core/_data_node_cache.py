@@ -0,0 +1,86 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+
+import typing as t
+from collections import OrderedDict
+from datetime import datetime
+from threading import Lock
+
+from pyforge.gui.utils import _get_memory_size
+
+
+class _DataNodeReadCache:
+    """
+    Bounded LRU cache of the data read from the data nodes displayed by the GUI.
+
+    Each value is stored along with the last edit date of the data node it was read from, and is only
+    served again while the data node has not been edited since. The cache holds at most *capacity*
+    bytes, as estimated from the size of the values. A value larger than the capacity is not cached.
+
+    Attributes:
+        capacity (int): The maximum total size, in bytes, of the cached values. 0 disables the cache.
+        hits (int): The number of reads served by the cache.
+        misses (int): The number of reads that required reading the data node.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.__size = 0
+        self.__entries: OrderedDict[str, t.Tuple[datetime, t.Any, int]] = OrderedDict()
+        self.__lock = Lock()
+
+    def _get(self, data_node_id: str, last_edit_date: t.Optional[datetime]) -> t.Optional[t.Any]:
+        with self.__lock:
+            entry = self.__entries.get(data_node_id)
+            if entry is None or last_edit_date is None or entry[0] != last_edit_date:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(data_node_id)
+            self.hits += 1
+            return entry[1]
+
+    def _put(self, data_node_id: str, last_edit_date: t.Optional[datetime], value: t.Any):
+        if last_edit_date is None or value is None:
+            return
+        size = self._size_of(value)
+        with self.__lock:
+            self.__pop(data_node_id)
+            if size > self.capacity:
+                return
+            self.__entries[data_node_id] = (last_edit_date, value, size)
+            self.__size += size
+            while self.__size > self.capacity:
+                self.__pop(next(iter(self.__entries)))
+
+    def _invalidate(self, data_node_id: str):
+        with self.__lock:
+            self.__pop(data_node_id)
+
+    def _stats(self) -> t.Dict[str, int]:
+        with self.__lock:
+            return {
+                "entries": len(self.__entries),
+                "size": self.__size,
+                "capacity": self.capacity,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    @staticmethod
+    def _size_of(value: t.Any) -> int:
+        return _get_memory_size(value)
+
+    def __pop(self, data_node_id: str):
+        if (entry := self.__entries.pop(data_node_id, None)) is not None:
+            self.__size -= entry[2]
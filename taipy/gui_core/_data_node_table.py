@@ -0,0 +1,179 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+
+import typing as t
+
+import pandas as pd
+
+from pyforge.core import DataNode
+from pyforge.core.data.operator import Operator
+from pyforge.gui._warnings import _warn
+from pyforge.gui.data.data_accessor import _DataAccessor
+from pyforge.gui.data.data_format import _DataFormat
+
+
+class _DataNodeTable:
+    """Tabular data of a data node, read by windows of rows as the table displays them."""
+
+    def __init__(self, datanode: DataNode, read: t.Callable[[], t.Any], read_schema: t.Callable[[], t.Any]):
+        self.datanode = datanode
+        self._read = read
+        self._read_schema = read_schema
+
+
+class _DataNodeTableAccessor(_DataAccessor):
+    """
+    Data accessor that serves the rows requested by the tables from the data node windows.
+
+    The data node sorts and filters the rows, and only reads the rows of the requested window. The requests
+    that need all the rows (charts, aggregations, comparisons, unsupported filters, ...) are served from the
+    whole data, by the accessor of its type.
+    """
+
+    __FILTER_OPERATORS = {
+        "==": Operator.EQUAL,
+        "!=": Operator.NOT_EQUAL,
+        "<": Operator.LESS_THAN,
+        "<=": Operator.LESS_OR_EQUAL,
+        ">": Operator.GREATER_THAN,
+        ">=": Operator.GREATER_OR_EQUAL,
+    }
+
+    @staticmethod
+    def get_supported_classes() -> t.List[t.Type]:
+        return [_DataNodeTable]
+
+    def get_data(
+        self, var_name: str, value: _DataNodeTable, payload: t.Dict[str, t.Any], data_format: _DataFormat
+    ) -> t.Dict[str, t.Any]:
+        window = None
+        try:
+            window = self.__read_window(value, payload)
+        except Exception as e:
+            _warn(f"Cannot read a window of the rows of {value.datanode.id}.", e)
+        if window is None:
+            data = value._read()
+            return self.__get_accessor(data).get_data(var_name, data, payload, data_format)
+
+        data, start, row_count, full_row_count = window
+        # The window is formatted (styles, tooltips, formats, ...) as a whole.
+        window_payload = {k: v for k, v in payload.items() if k not in ("filters", "orderby", "sort")}
+        window_payload.update(start=0, end=len(data) - 1)
+        ret_payload = self.__get_accessor(data).get_data(var_name, data, window_payload, data_format)
+        if isinstance(ret_value := ret_payload.get("value"), dict):
+            ret_value.update(start=start, rowcount=row_count)
+            ret_value.pop("fullrowcount", None)
+            if full_row_count != row_count:
+                ret_value["fullrowcount"] = full_row_count
+        return ret_payload
+
+    def get_cols_description(self, var_name: str, value: _DataNodeTable) -> t.Dict[str, t.Dict[str, str]]:
+        schema = value._read_schema()
+        return self.__get_accessor(schema).get_cols_description(var_name, schema)
+
+    def to_pandas(self, value: _DataNodeTable) -> t.Union[t.List[t.Any], t.Any]:
+        data = value._read()
+        return self.__get_accessor(data).to_pandas(data)
+
+    def on_edit(self, value: _DataNodeTable, payload: t.Dict[str, t.Any]) -> t.Optional[t.Any]:
+        data = value._read()
+        return self.__get_accessor(data).on_edit(data, payload)
+
+    def on_delete(self, value: _DataNodeTable, payload: t.Dict[str, t.Any]) -> t.Optional[t.Any]:
+        data = value._read()
+        return self.__get_accessor(data).on_delete(data, payload)
+
+    def on_add(
+        self, value: _DataNodeTable, payload: t.Dict[str, t.Any], new_row: t.Optional[t.List[t.Any]] = None
+    ) -> t.Optional[t.Any]:
+        data = value._read()
+        return self.__get_accessor(data).on_add(data, payload, new_row)
+
+    def to_csv(self, var_name: str, value: _DataNodeTable) -> t.Optional[str]:
+        data = value._read()
+        return self.__get_accessor(data).to_csv(var_name, data)
+
+    def __get_accessor(self, data: t.Any) -> _DataAccessor:
+        return self._gui._get_accessor()._get_instance(data)
+
+    @staticmethod
+    def __get_index(payload: t.Dict[str, t.Any], key: str, default: int) -> int:
+        try:
+            return int(str(payload.get(key, default)), base=10)
+        except ValueError:
+            return default
+
+    @staticmethod
+    def __get_columns(value: _DataNodeTable) -> t.Set[t.Any]:
+        # Only the columns of a data frame schema are known: other schemas are served from the whole data.
+        schema = value._read_schema()
+        return set(schema.columns) if isinstance(schema, pd.DataFrame) else set()
+
+    @classmethod
+    def __get_operators(cls, filters: t.List[t.Dict[str, t.Any]], columns: t.Set[t.Any]) -> t.Optional[t.List[t.Tuple]]:
+        operators = []
+        for fd in filters:
+            operator = cls.__FILTER_OPERATORS.get(fd.get("action", ""))
+            col = fd.get("col")
+            value = fd.get("value")
+            # The date values and the case insensitive comparisons are only supported on the whole data.
+            if (
+                operator is None
+                or col not in columns
+                or (isinstance(value, str) and fd.get("matchCase", False) is False)
+            ):
+                return None
+            operators.append((col, value, operator))
+        return operators
+
+    @classmethod
+    def __read_window(
+        cls, value: _DataNodeTable, payload: t.Dict[str, t.Any]
+    ) -> t.Optional[t.Tuple[t.Any, int, int, int]]:
+        if (
+            payload.get("alldata", False)
+            or payload.get("reverse", False)
+            or payload.get("aggregates")
+            or isinstance(payload.get("compare"), str)
+        ):
+            return None
+        start = max(cls.__get_index(payload, "start", 0), 0)
+        end = cls.__get_index(payload, "end", -1)
+        if end < start:
+            return None
+        filters = payload.get("filters")
+        filters = filters if isinstance(filters, list) and filters else None
+        order_by = payload.get("orderby")
+        order_by = order_by if isinstance(order_by, str) and order_by else None
+        # The columns sent by the table are only used to read the data node if they are columns of its schema.
+        columns = cls.__get_columns(value) if filters or order_by else set()
+        if order_by is not None and order_by not in columns:
+            return None
+        operators = None
+        if filters and (operators := cls.__get_operators(filters, columns)) is None:
+            return None
+        descending = payload.get("sort") == "desc"
+        datanode = value.datanode
+
+        if (window := datanode._read_window(start, end + 1, order_by, descending, operators)) is None:
+            return None
+        data, row_count = window
+        if start >= row_count > 0:
+            # As for the whole data, the rows are served from the first one.
+            start, end = 0, end - start
+            data, row_count = t.cast(
+                t.Tuple[t.Any, int], datanode._read_window(0, end + 1, order_by, descending, operators)
+            )
+        full_row_count = row_count
+        if operators:
+            full_row_count = t.cast(t.Tuple[t.Any, int], datanode._read_window(0, 0))[1]
+        return data, start, row_count, full_row_count
@@ -0,0 +1,117 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+
+from pyforge.common.config import Config
+from pyforge.core import Scope
+from pyforge.core._manager._entity_cache import _EntityCache
+from pyforge.core.data._data_manager import _DataManager
+from pyforge.core.data.in_memory import InMemoryDataNode
+from pyforge.core.task._task_manager import _TaskManager
+from pyforge.core.task.task import Task
+
+
+def _create_data_node(config_id="foo", **properties):
+    data_node = InMemoryDataNode(config_id, Scope.SCENARIO, properties=properties)
+    _DataManager._set(data_node)
+    return data_node
+
+
+def test_get_is_served_by_the_cache():
+    data_node = _create_data_node()
+    stats = _DataManager._get_cache_stats()
+
+    first = _DataManager._get(data_node.id)
+    second = _DataManager._get(data_node.id)
+
+    assert first == second == data_node
+    assert first is not second
+    new_stats = _DataManager._get_cache_stats()
+    assert new_stats["misses"] == stats["misses"] + 1
+    assert new_stats["hits"] == stats["hits"] + 1
+    assert new_stats["size"] == 1
+
+
+def test_cached_entity_is_not_modified_by_callers():
+    data_node = _create_data_node(foo="bar")
+
+    _DataManager._get(data_node.id)._properties.data["foo"] = "baz"
+    _DataManager._get(data_node.id)._edits.append({"foo": "bar"})
+
+    fetched = _DataManager._get(data_node.id)
+    assert fetched._properties.data["foo"] == "bar"
+    assert fetched._properties._entity_owner is fetched
+    assert fetched._edits == []
+
+
+def test_cache_is_invalidated_on_set_and_delete():
+    data_node = _create_data_node()
+    _DataManager._get(data_node.id)
+
+    data_node.properties["foo"] = "bar"
+    assert _DataManager._get(data_node.id).properties["foo"] == "bar"
+
+    _DataManager._delete(data_node.id)
+    assert _DataManager._get(data_node.id) is None
+    assert _DataManager._get_cache_stats()["size"] == 0
+
+
+def test_cache_is_invalidated_when_the_entity_is_saved_by_another_process():
+    data_node = _create_data_node()
+    _DataManager._get(data_node.id)
+
+    path = _DataManager._repository.dir_path / f"{data_node.id}.json"
+    model = json.loads(path.read_text())
+    model["owner_id"] = "another_owner"
+    path.write_text(json.dumps(model))
+
+    assert _DataManager._get(data_node.id).owner_id == "another_owner"
+
+
+def test_referenced_entities_are_up_to_date():
+    data_node = _create_data_node()
+    task = Task("task", {}, print, [data_node], id="TASK_cached")
+    _TaskManager._set(task)
+    assert _TaskManager._get(task.id).input["foo"]._edit_in_progress is False
+
+    data_node.lock_edit()
+
+    assert _TaskManager._get(task.id).input["foo"]._edit_in_progress is True
+
+
+def test_cache_size():
+    data_nodes = [_create_data_node(f"foo_{i}") for i in range(3)]
+    Config.configure_core(entity_cache_size=2)
+    for data_node in data_nodes:
+        _DataManager._get(data_node.id)
+    assert _DataManager._get_cache_stats()["size"] == 2
+
+    Config.configure_core(entity_cache_size=0)
+    stats = _DataManager._get_cache_stats()
+    _DataManager._get(data_nodes[0].id)
+    _DataManager._get(data_nodes[0].id)
+    assert _DataManager._get_cache_stats()["size"] == 0
+    assert _DataManager._get_cache_stats()["hits"] == stats["hits"]
+
+
+def test_least_recently_used_entity_is_evicted():
+    cache = _EntityCache(2)
+    cache._put("a", 1, InMemoryDataNode("a", Scope.SCENARIO))
+    cache._put("b", 1, InMemoryDataNode("b", Scope.SCENARIO))
+    assert cache._get("a", 1) is not None
+    cache._put("c", 1, InMemoryDataNode("c", Scope.SCENARIO))
+
+    assert cache._get("b", 1) is None
+    assert cache._get("a", 1) is not None
+    assert cache._get("c", 1) is not None
+    assert cache._get("c", 2) is None
+    assert cache._stats() == {"size": 2, "capacity": 2, "hits": 3, "misses": 2}
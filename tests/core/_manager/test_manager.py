@@ -115,6 +115,16 @@ class TestManager:
         fetched_model = MockManager._get(m.id)
         assert m == fetched_model
 
+    def test_set_many_and_get_many(self):
+        MockManager._delete_all()
+
+        objs = [MockEntity(f"uuid-{i}", f"Foo{i}") for i in range(5)]
+        MockManager._set_many(objs)
+
+        assert len(MockManager._get_all()) == 5
+        fetched = MockManager._get_many(["uuid-4", objs[0], "not-existing", "uuid-2"])
+        assert [entity.id for entity in fetched] == ["uuid-4", "uuid-0", "uuid-2"]
+
     def test_exists(self):
         m = MockEntity("uuid", "foo")
         MockManager._set(m)
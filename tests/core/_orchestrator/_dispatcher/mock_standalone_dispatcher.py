@@ -11,7 +11,7 @@
 
 from concurrent.futures import Executor, Future
 from threading import Lock
-from typing import List
+from typing import Dict, List
 
 from pyforge.core import Job
 from pyforge.core._orchestrator._abstract_orchestrator import _AbstractOrchestrator
@@ -39,6 +39,8 @@ class MockStandaloneDispatcher(_StandaloneJobDispatcher):
     def __init__(self, orchestrator: _AbstractOrchestrator):
         super(_StandaloneJobDispatcher, self).__init__(orchestrator)
         self._executor: Executor = MockProcessPoolExecutor()
+        self._executors: Dict[str, Executor] = {}
+        self._worker_config_hash = self._get_serialized_config()[1]
         self._nb_available_workers = 1
         self._nb_available_workers_lock = Lock()
 
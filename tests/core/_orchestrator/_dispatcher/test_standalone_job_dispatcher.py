@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import threading
 from concurrent.futures import Future, ProcessPoolExecutor
 from unittest import mock
 from unittest.mock import call
@@ -69,7 +70,7 @@ def test_dispatch_job():
     assert submit_first_call[0].job_id == job.id
     assert submit_first_call[0].task == task
     assert submit_first_call[1] == ()
-    assert submit_first_call[2]["config_as_string"] == _TomlSerializer()._serialize(Config._applied_config)
+    assert submit_first_call[2] == {"config_hash": dispatcher._worker_config_hash}
 
     # test that the job status is updated after execution on future
     assert len(dispatcher.update_job_status_from_future_calls) == 1
@@ -77,6 +78,29 @@ def test_dispatch_job():
     assert dispatcher.update_job_status_from_future_calls[0][1] == dispatcher._executor.f[0]
 
 
+def test_dispatch_job_sends_the_config_only_if_it_changed():
+    task = create_task()
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    dispatcher = MockStandaloneDispatcher(orchestrator)
+    config_hash = dispatcher._worker_config_hash
+
+    with mock.patch.object(_TomlSerializer, "_serialize", wraps=_TomlSerializer._serialize) as mck_serialize:
+        dispatcher._dispatch(Job(JobId("job_1"), task, "s_id", task.id))
+        dispatcher._dispatch(Job(JobId("job_2"), task, "s_id", task.id))
+        mck_serialize.assert_not_called()
+
+    Config.unblock_update()
+    Config.configure_core(custom_property="custom_property")
+    Config.block_update()
+    dispatcher._dispatch(Job(JobId("job_3"), task, "s_id", task.id))
+
+    submitted_configs = [submit_call[2] for submit_call in dispatcher._executor.submit_called[-3:]]
+    assert submitted_configs[0] == submitted_configs[1] == {"config_hash": config_hash}
+    new_config = submitted_configs[2]
+    assert new_config["config_hash"] != config_hash
+    assert new_config["config_as_string"] == _TomlSerializer()._serialize(Config._applied_config)
+
+
 def test_can_execute():
     dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
     assert dispatcher._nb_available_workers == 2
@@ -97,7 +121,9 @@ def test_update_job_status_from_future():
     ft = Future()
     ft.set_result(None)
     assert dispatcher._nb_available_workers == 2
-    dispatcher._update_job_status_from_future(job, ft)
+    with mock.patch.object(dispatcher, "_wake_up") as mck_wake_up:
+        dispatcher._update_job_status_from_future(job, ft)
+        mck_wake_up.assert_called_once()
     assert dispatcher._nb_available_workers == 3
     assert job.is_completed()
 
@@ -124,3 +150,25 @@ def test_run():
         assert_true_after_time(lambda: mck.call_count == 4, time=5, msg="The 4 jobs were not dequeued.")
         dispatcher.stop()
         mck.assert_has_calls([call(job_1), call(job_2), call(job_3), call(job_4)])
+
+
+def test_run_is_woken_up_by_new_jobs_and_stop():
+    task = create_task()
+    job = Job(JobId("job"), task, "s_id", task.id)
+    _JobManagerFactory._build_manager()._set(job)
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    executed = threading.Event()
+
+    with mock.patch(
+        "pyforge.core._orchestrator._dispatcher._job_dispatcher._JobDispatcher._execute_job",
+        side_effect=lambda _: executed.set(),
+    ):
+        dispatcher = _StandaloneJobDispatcher(orchestrator)
+        dispatcher._MAX_IDLE_TIME = 60  # The dispatcher must not rely on its idle timeout to get the job.
+        with mock.patch.object(_OrchestratorFactory, "_dispatcher", dispatcher):
+            dispatcher.start()
+            orchestrator._orchestrate_job_to_run_or_block([job])
+            assert executed.wait(timeout=5)
+
+            dispatcher.stop(timeout=5)
+            assert not dispatcher.is_running()
@@ -9,8 +9,10 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import asyncio
 import random
 import string
+from unittest import mock
 
 from pyforge import Scope
 from pyforge.common.config import Config
@@ -70,6 +72,20 @@ def test_execute_task_that_return_multiple_outputs():
     )
 
 
+def test_execute_coroutine_function():
+    async def async_multiply(nb1, nb2):
+        await asyncio.sleep(0)
+        return multiply(nb1, nb2)
+
+    task = _create_task(async_multiply)
+    _TaskFunctionWrapper("job_id_sync", task).execute()
+    assert task.output[f"{task.config_id}_output0"].read() == 42
+
+    task = _create_task(async_multiply)
+    assert asyncio.run(_TaskFunctionWrapper("job_id_async", task).execute_async()) == []
+    assert task.output[f"{task.config_id}_output0"].read() == 42
+
+
 def test_execute_task_that_returns_single_iterable_output():
     def return_2tuple(nb1, nb2):
         return multiply(nb1, nb2), multiply(nb1, nb2) / 2
@@ -128,3 +144,33 @@ def test_can_execute_task_with_a_modified_config():
     res = _TaskFunctionWrapper("job_id", task_asserting_cfg_is_correct).execute(config_as_string=cfg_as_str)
 
     assert len(res) == 0  # no exception raised so the asserts in the fct passed
+
+
+def test_execute_applies_the_config_only_if_it_changed():
+    def get_custom_property(n, m):
+        from pyforge.common.config import Config
+
+        return Config.core.custom_property
+
+    task = _create_task(get_custom_property)
+    output = list(task.output.values())[0]
+    Config.configure_core(custom_property="initial")
+    initial_cfg_as_str = _TomlSerializer()._serialize(Config._applied_config)
+    Config.configure_core(custom_property="updated")
+    updated_cfg_as_str = _TomlSerializer()._serialize(Config._applied_config)
+
+    with mock.patch.multiple(_TaskFunctionWrapper, _worker_config_as_string=None, _applied_config_hash=None):
+        _TaskFunctionWrapper._initialize_worker(initial_cfg_as_str, "initial_hash")
+        with mock.patch.object(_TomlSerializer, "_deserialize", wraps=_TomlSerializer._deserialize) as mck:
+            _TaskFunctionWrapper("job_1", task).execute(config_hash="initial_hash")
+            assert output.read() == "initial"
+            mck.assert_not_called()
+
+            _TaskFunctionWrapper("job_2", task).execute(config_as_string=updated_cfg_as_str, config_hash="updated_hash")
+            assert output.read() == "updated"
+            _TaskFunctionWrapper("job_3", task).execute(config_as_string=updated_cfg_as_str, config_hash="updated_hash")
+            assert mck.call_count == 1
+
+            _TaskFunctionWrapper("job_4", task).execute(config_hash="initial_hash")
+            assert output.read() == "initial"
+            assert mck.call_count == 2
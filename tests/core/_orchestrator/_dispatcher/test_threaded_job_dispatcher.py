@@ -0,0 +1,132 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from pyforge.common.config import Config
+from pyforge.core import JobId, Scope
+from pyforge.core._orchestrator._dispatcher import _ThreadedJobDispatcher
+from pyforge.core._orchestrator._dispatcher._async_executor import _AsyncExecutor
+from pyforge.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from pyforge.core.data._data_manager import _DataManager
+from pyforge.core.data.in_memory import InMemoryDataNode
+from pyforge.core.job._job_manager_factory import _JobManagerFactory
+from pyforge.core.job.job import Job
+from pyforge.core.task._task_manager_factory import _TaskManagerFactory
+from pyforge.core.task.task import Task
+from tests.core.utils import assert_true_after_time
+
+
+def return_42():
+    return 42
+
+
+async def async_return_42():
+    await asyncio.sleep(0)
+    return 42
+
+
+def create_job(function, **properties):
+    output = InMemoryDataNode("output", Scope.SCENARIO)
+    _DataManager._set(output)
+    task = Task("config_id", properties, function, [], [output])
+    _TaskManagerFactory._build_manager()._set(task)
+    job = Job(JobId(f"job_{task.id}"), task, "s_id", task.id)
+    _JobManagerFactory._build_manager()._set(job)
+    return job
+
+
+def test_init():
+    Config.configure_job_executions(mode="threaded")
+    dispatcher = _ThreadedJobDispatcher(_OrchestratorFactory._build_orchestrator())
+
+    assert isinstance(dispatcher._executor, ThreadPoolExecutor)
+    assert dispatcher._nb_available_workers == 2
+    assert dispatcher._executors == {}
+    dispatcher._executor.shutdown()
+
+
+def test_build_dispatcher():
+    Config.configure_job_executions(mode="threaded")
+    _OrchestratorFactory._build_orchestrator()
+    dispatcher = _OrchestratorFactory._build_dispatcher()
+
+    assert type(dispatcher) is _ThreadedJobDispatcher
+    assert _OrchestratorFactory._build_dispatcher() is dispatcher
+    _OrchestratorFactory._remove_dispatcher()
+
+
+def test_dispatch_jobs_according_to_their_execution_mode():
+    Config.configure_job_executions(mode="threaded")
+    dispatcher = _ThreadedJobDispatcher(_OrchestratorFactory._build_orchestrator())
+
+    thread_job = create_job(return_42)
+    dispatcher._dispatch(thread_job)
+    async_job = create_job(async_return_42, execution_mode="async")
+    dispatcher._dispatch(async_job)
+
+    assert_true_after_time(thread_job.is_completed, msg="The thread job did not complete.")
+    assert_true_after_time(async_job.is_completed, msg="The async job did not complete.")
+    assert thread_job.task.output["output"].read() == 42
+    assert async_job.task.output["output"].read() == 42
+    assert list(dispatcher._executors) == ["async"]
+    assert isinstance(dispatcher._executors["async"], _AsyncExecutor)
+
+    process_executor = mock.MagicMock()
+    with mock.patch.object(dispatcher, "_create_executor", return_value=process_executor):
+        dispatcher._dispatch(create_job(return_42, execution_mode="process"))
+    assert "config_hash" in process_executor.submit.call_args.kwargs
+
+    dispatcher._executor.shutdown()
+    dispatcher._executors["async"].shutdown()
+
+
+def test_async_executor_runs_coroutines_concurrently():
+    started = []
+
+    async def start_and_wait_for(name, other):
+        started.append(name)
+        while other not in started:
+            await asyncio.sleep(0.01)
+        return threading.current_thread().name
+
+    executor = _AsyncExecutor()
+    future_a = executor.submit(start_and_wait_for, "a", "b")
+    future_b = executor.submit(start_and_wait_for, "b", "a")
+
+    assert future_a.result(timeout=5) == future_b.result(timeout=5) == "pyforge_async_executor"
+    executor.shutdown()
+    assert executor._loop.is_closed()
+
+
+def test_async_executor_calls_the_done_callbacks_off_the_event_loop():
+    callback_threads = []
+    release_callback = threading.Event()
+
+    def blocking_callback(future):
+        callback_threads.append(threading.current_thread().name)
+        release_callback.wait(timeout=10)
+
+    executor = _AsyncExecutor()
+    future = executor.submit(async_return_42)
+    executor.add_done_callback(future, blocking_callback)
+    assert future.result(timeout=5) == 42
+
+    # The event loop is not stalled by the blocking callback.
+    assert executor.submit(async_return_42).result(timeout=2) == 42
+    assert_true_after_time(lambda: len(callback_threads) == 1, time=5)
+    assert callback_threads[0] != "pyforge_async_executor"
+    release_callback.set()
+    executor.shutdown()
+    assert executor._loop.is_closed()
@@ -162,3 +162,82 @@ def test_on_status_change_on_failed_job():
     assert j3.is_blocked()
     assert len(orchestrator.blocked_jobs) == 1
     assert orchestrator.jobs_to_run.qsize() == 0
+
+
+def test_on_status_change_on_completed_job_only_checks_the_jobs_waiting_for_its_outputs():
+    # dn_0 --> t1 --> dn_1 --> t2 --> dn_2
+    # dn_3 --> t3
+    dn_0_cfg = Config.configure_pickle_data_node("dn_0", default_data=0)
+    dn_1_cfg = Config.configure_pickle_data_node("dn_1")
+    dn_2_cfg = Config.configure_pickle_data_node("dn_2")
+    dn_3_cfg = Config.configure_pickle_data_node("dn_3")
+    t1_cfg = Config.configure_task("t1", nothing, [dn_0_cfg], [dn_1_cfg])
+    t2_cfg = Config.configure_task("t2", nothing, [dn_1_cfg], [dn_2_cfg])
+    t3_cfg = Config.configure_task("t3", nothing, [dn_3_cfg], [])
+    scenario = pyforge.create_scenario(Config.configure_scenario("scenario_cfg", [t1_cfg, t2_cfg, t3_cfg]))
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    j1 = orchestrator._lock_dn_output_and_create_job(scenario.t1, "s_id", "e_id")
+    j2 = orchestrator._lock_dn_output_and_create_job(scenario.t2, "s_id", "e_id")
+    j3 = orchestrator._lock_dn_output_and_create_job(scenario.t3, "s_id", "e_id")
+    orchestrator._orchestrate_job_to_run_or_block([j1, j2, j3])
+    assert orchestrator.jobs_to_run.get() == j1
+    assert orchestrator.blocked_jobs == [j2, j3]
+
+    is_blocked = orchestrator._is_blocked
+    with mock.patch(
+        "pyforge.core._orchestrator._orchestrator._Orchestrator._is_blocked", side_effect=is_blocked
+    ) as mck:
+        scenario.dn_1.write(1, job_id=j1.id)
+        j1.completed()
+
+        mck.assert_called_once_with(j2)
+        assert j2.is_pending()
+        assert j3.is_blocked()
+        assert orchestrator.blocked_jobs == [j3]
+        assert orchestrator.jobs_to_run.get() == j2
+
+
+def test_on_status_change_checks_the_jobs_waiting_for_a_data_node_written_outside_a_job():
+    # x --> t1
+    # y --> t2
+    x_cfg = Config.configure_pickle_data_node("x")
+    y_cfg = Config.configure_pickle_data_node("y", default_data=0)
+    t1_cfg = Config.configure_task("t1", nothing, [x_cfg], [])
+    t2_cfg = Config.configure_task("t2", nothing, [y_cfg], [])
+    scenario = pyforge.create_scenario(Config.configure_scenario("scenario_cfg", [t1_cfg, t2_cfg]))
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    j1 = orchestrator._lock_dn_output_and_create_job(scenario.t1, "s_id", "e_id")
+    orchestrator._orchestrate_job_to_run_or_block([j1])
+    assert orchestrator.blocked_jobs == [j1]
+    assert orchestrator._Orchestrator__data_node_updates is not None
+
+    scenario.x.write(5)
+    j2 = orchestrator._lock_dn_output_and_create_job(scenario.t2, "s_id", "e_id")
+    orchestrator._orchestrate_job_to_run_or_block([j2])
+    assert orchestrator.jobs_to_run.get() == j2
+    j2.completed()
+
+    assert j1.is_pending()
+    assert orchestrator.blocked_jobs == []
+    assert orchestrator.jobs_to_run.get() == j1
+    # The data node updates are only listened to while some jobs are blocked.
+    assert orchestrator._Orchestrator__data_node_updates is None
+
+
+def test_blocked_jobs_swapped_outside_the_orchestrator_are_checked():
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    scenario = create_scenario()
+    j1 = orchestrator._lock_dn_output_and_create_job(scenario.t1, "s_id", "e_id")
+    j2 = orchestrator._lock_dn_output_and_create_job(scenario.t2, "s_id", "e_id")
+    orchestrator._orchestrate_job_to_run_or_block([j2])
+    assert orchestrator.blocked_jobs == [j2]
+
+    # Another blocked job replaces the indexed one, without changing the number of blocked jobs.
+    j3 = create_job_from_task("j3", scenario.t3)
+    j3.status = Status.BLOCKED
+    orchestrator.blocked_jobs[0] = j3
+    scenario.dn_0.write(0)
+    j1.completed()
+
+    assert j3.is_pending()
+    assert orchestrator.blocked_jobs == []
@@ -16,6 +16,10 @@ from pyforge.common.config.checker.issue_collector import IssueCollector
 from pyforge.core.config.job_config import JobConfig
 
 
+async def async_print(*args):
+    print(*args)  # noqa: T201
+
+
 class TestJobConfigChecker:
     def test_check_mode(self, caplog):
         Config._collector = IssueCollector()
@@ -37,7 +41,7 @@ class TestJobConfigChecker:
             Config._collector = IssueCollector()
             Config.check()
         assert len(Config._collector.errors) == 1
-        expected_error_message = "Job execution mode must be either development, standalone."
+        expected_error_message = "Job execution mode must be either development, standalone, threaded."
         assert expected_error_message in caplog.text
 
         Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
@@ -66,7 +70,44 @@ class TestJobConfigChecker:
             Config.check()
         assert len(Config._collector.errors) == 1
         expected_error_message = (
-            "DataNode `foo`: In-memory storage type can ONLY be used in development mode. Current"
-            ' value of property `storage_type` is "in_memory".'
+            "DataNode `foo`: In-memory storage type can ONLY be used in development mode, or by tasks executed in"
+            ' the thread or async execution mode. Current value of property `storage_type` is "in_memory".'
+        )
+        assert expected_error_message in caplog.text
+
+    def test_check_standalone_mode_with_main_process_tasks(self, caplog):
+        in_memory_dn = Config.configure_data_node(id="foo", storage_type="in_memory")
+        Config.configure_task("thread_task", print, [in_memory_dn], [], execution_mode="thread")
+        Config.configure_task("async_task", async_print, [], [in_memory_dn], execution_mode="async")
+
+        Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+        Config.configure_task("process_task", print, [in_memory_dn], [])
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "DataNode `foo`: In-memory storage type can ONLY be used in development mode" in caplog.text
+
+    def test_check_threaded_mode(self, caplog):
+        in_memory_dn = Config.configure_data_node(id="foo", storage_type="in_memory")
+        Config.configure_task("thread_task", print, [in_memory_dn], [])
+
+        Config.configure_job_executions(mode=JobConfig._THREADED_MODE, max_nb_of_workers=2)
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+        Config.configure_task("process_task", print, [in_memory_dn], [], execution_mode="process")
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        expected_error_message = (
+            "DataNode `foo`: In-memory storage type cannot be used by TaskConfig `process_task` executed in worker"
+            " processes."
         )
         assert expected_error_message in caplog.text
@@ -359,3 +359,32 @@ class TestTaskConfigChecker:
         Config._collector = IssueCollector()
         Config.check()
         assert len(Config._collector.errors) == 0
+
+    def test_check_execution_mode(self, caplog):
+        async def async_func():
+            pass
+
+        dn_config = Config.configure_data_node("bar")
+        Config.configure_task("new", print, [], [dn_config], execution_mode="thread")
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+        Config.configure_task("new", print, [], [dn_config], execution_mode="foo")
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "The execution mode of TaskConfig `new` must be either process, thread, async." in caplog.text
+
+        Config.configure_task("new", print, [], [dn_config], execution_mode="async")
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "TaskConfig `new` can only use the async execution mode with a coroutine function." in caplog.text
+
+        Config.configure_task("new", async_func, [], [dn_config], execution_mode="async")
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
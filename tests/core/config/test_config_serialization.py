@@ -118,6 +118,8 @@ storage_folder = "user_data/"
 pyforge_storage_folder = ".pyforge/"
 repository_type = "filesystem"
 read_entity_retry = "0:int"
+entity_cache_size = "1000:int"
+notification_queue_size = "0:int"
 mode = "development"
 version_number = ""
 force = "False:bool"
@@ -285,6 +287,8 @@ def test_read_write_json_configuration_file():
 "pyforge_storage_folder": ".pyforge/",
 "repository_type": "filesystem",
 "read_entity_retry": "0:int",
+"entity_cache_size": "1000:int",
+"notification_queue_size": "0:int",
 "mode": "development",
 "version_number": "",
 "force": "False:bool","""
@@ -618,6 +622,8 @@ def test_read_write_json_configuration_file_migrate_sequence_in_scenario():
 "storage_folder": ".data/",
 "repository_type": "filesystem",
 "read_entity_retry": "0:int",
+"entity_cache_size": "1000:int",
+"notification_queue_size": "0:int",
 "mode": "development",
 "version_number": "",
 "force": "False:bool"
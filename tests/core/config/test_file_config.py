@@ -35,6 +35,8 @@ storage_folder = "user_data/"
 pyforge_storage_folder = ".pyforge/"
 repository_type = "filesystem"
 read_entity_retry = "0:int"
+entity_cache_size = "1000:int"
+notification_queue_size = "0:int"
 mode = "development"
 version_number = ""
 force = "False:bool"
@@ -26,6 +26,13 @@ def test_job_config():
     assert Config.job_config.foo == "bar"
 
 
+def test_threaded_job_config():
+    job_c = Config.configure_job_executions(mode="threaded")
+    assert job_c.is_threaded
+    assert not job_c.is_standalone
+    assert Config.job_config.mode == "threaded"
+
+
 def test_clean_config():
     job_config = Config.configure_job_executions(mode="standalone", max_nb_of_workers=3, prop="foo")
 
@@ -11,6 +11,7 @@
 
 import os
 import pathlib
+from datetime import timedelta
 
 import pytest
 
@@ -328,6 +329,21 @@ class TestDataManager:
         assert len([dn for dn in _DataManager._get_all() if dn.config_id == "foo"]) == 1
         assert len([dn for dn in _DataManager._get_all() if dn.config_id == "baz"]) == 2
 
+    def test_get_page_by_non_string_attributes(self):
+        dn_1 = PickleDataNode("foo", Scope.SCENARIO, validity_period=timedelta(days=2))
+        dn_2 = PickleDataNode("foo", Scope.SCENARIO, edit_in_progress=True)
+        _DataManager._set(dn_1)
+        _DataManager._set(dn_2)
+
+        def get_ids(attributes):
+            return [dn.id for dn in _DataManager._get_page_by(_DataManager._build_filters_with_attributes(attributes))]
+
+        assert get_ids({"edit_in_progress": False}) == [dn_1.id]
+        assert get_ids({"edit_in_progress": True}) == [dn_2.id]
+        assert get_ids({"validity_days": 2}) == [dn_1.id]
+        assert get_ids({"validity_days": None}) == [dn_2.id]
+        assert get_ids({"validity_days": 3}) == []
+
     def test_get_all_on_multiple_versions_environment(self):
         # Create 5 data nodes with 2 versions each
         # Only version 1.0 has the data node with config_id = "config_id_1"
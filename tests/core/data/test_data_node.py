@@ -24,6 +24,7 @@ from pyforge.common.config import Config
 from pyforge.common.config.exceptions.exceptions import InvalidConfigurationId
 from pyforge.core.data._data_manager import _DataManager
 from pyforge.core.data._data_manager_factory import _DataManagerFactory
+from pyforge.core.data._edit_log import _EditLog
 from pyforge.core.data.data_node import DataNode
 from pyforge.core.data.data_node_id import (
     EDIT_COMMENT_KEY,
@@ -940,6 +941,37 @@ class TestDataNode:
         assert len(edit_5) == 1
         assert edit_5[EDIT_TIMESTAMP_KEY] == timestamp
 
+    def test_track_edit_appends_to_the_edit_log(self):
+        dn_config = Config.configure_data_node("A", max_edits=3)
+        data_node = _DataManager._bulk_get_or_create([dn_config])[dn_config]
+        for i in range(8):
+            data_node.track_edit(comment=f"edit {i}")
+
+        # Only the last edit is saved with the data node, the others are in the edit log.
+        assert len(_DataManager._get(data_node.id)._edits) == 1
+        assert data_node.get_last_edit()[EDIT_COMMENT_KEY] == "edit 7"
+        # The log was compacted to the last 3 edits when it reached 7 edits, and only the last 3 are returned.
+        assert len(_EditLog._read(data_node.id)) == 4
+        assert [edit[EDIT_COMMENT_KEY] for edit in data_node.edits] == ["edit 5", "edit 6", "edit 7"]
+
+        _DataManager._delete(data_node.id)
+        assert not _EditLog._exists(data_node.id)
+
+    def test_track_edit_moves_previous_edits_to_the_edit_log(self):
+        timestamp = datetime.now()
+        data_node = FakeDataNode("foo", edits=[{EDIT_TIMESTAMP_KEY: timestamp, EDIT_COMMENT_KEY: "first"}])
+        _DataManager._set(data_node)
+        data_node.track_edit(comment="second")
+
+        assert [edit[EDIT_COMMENT_KEY] for edit in data_node.edits] == ["first", "second"]
+        assert data_node.edits[0][EDIT_TIMESTAMP_KEY] == timestamp
+
+        with mock.patch.object(_EditLog, "_write", wraps=_EditLog._write) as mck_write:
+            data_node.edits = []
+        mck_write.assert_called_once_with(data_node.id, [])
+        assert data_node.edits == []
+        assert data_node.get_last_edit() is None
+
     def test_normalize_path(self):
         dn = DataNode(
             config_id="foo_bar",
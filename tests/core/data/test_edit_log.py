@@ -0,0 +1,71 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import threading
+
+from pyforge.core.data._edit_log import _EditLog
+
+
+class TestEditLog:
+    def test_append_and_compact(self):
+        for i in range(6):
+            _EditLog._append("dn", [{"i": i}], max_edits=3)
+        assert [edit["i"] for edit in _EditLog._read("dn")] == [0, 1, 2, 3, 4, 5]
+        # The log is compacted to the last 3 edits once it holds more than 6 edits.
+        _EditLog._append("dn", [{"i": 6}], max_edits=3)
+        assert [edit["i"] for edit in _EditLog._read("dn")] == [4, 5, 6]
+
+        _EditLog._delete("dn")
+        assert not _EditLog._exists("dn")
+        assert _EditLog._read("dn") == []
+        assert os.listdir(os.path.dirname(_EditLog._path("dn"))) == []
+
+    def test_appended_lines_are_counted_once(self):
+        path = _EditLog._path("dn_count")
+        _EditLog._append("dn_count", [{"i": i} for i in range(10)], max_edits=10)
+        inode, size, count = _EditLog._line_counts[path]
+        assert (size, count) == (os.path.getsize(path), 10)
+
+        # Only the lines appended since the last count are counted: the log is compacted on the stale count.
+        _EditLog._line_counts[path] = (inode, size, 1000)
+        _EditLog._append("dn_count", [{"i": 10}], max_edits=10)
+        assert [edit["i"] for edit in _EditLog._read("dn_count")] == list(range(1, 11))
+        # The count starts again from the rewritten log.
+        _EditLog._append("dn_count", [{"i": 11}], max_edits=10)
+        assert len(_EditLog._read("dn_count")) == 11
+
+    def test_no_edit_is_lost_when_appending_during_compactions(self):
+        errors = []
+
+        def append(thread_id):
+            for i in range(200):
+                _EditLog._append("dn_threads", [{"thread": thread_id, "i": i}])
+
+        def compact():
+            try:
+                while any(thread.is_alive() for thread in appenders):
+                    _EditLog._compact("dn_threads", 10**6)
+            except Exception as e:
+                errors.append(e)
+
+        appenders = [threading.Thread(target=append, args=(thread_id,)) for thread_id in range(4)]
+        compactors = [threading.Thread(target=compact) for _ in range(2)]
+        for thread in [*appenders, *compactors]:
+            thread.start()
+        for thread in [*appenders, *compactors]:
+            thread.join()
+
+        assert errors == []
+        edits = _EditLog._read("dn_threads")
+        for thread_id in range(4):
+            assert [edit["i"] for edit in edits if edit["thread"] == thread_id] == list(range(200))
+        assert not [name for name in os.listdir(os.path.dirname(_EditLog._path("dn_threads"))) if name.endswith(".tmp")]
@@ -11,6 +11,7 @@
 
 import os
 import pathlib
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -117,3 +118,23 @@ def test_filter_numpy_exposed_type(csv_file):
         np.array([[1, 1], [1, 2], [2, 1], [2, 2]]),
     )
     assert np.array_equal(dn[(dn[:, 1] == 1) | (dn[:, 1] == 2)], np.array([[1, 1], [1, 2], [2, 1], [2, 2]]))
+
+
+def test_filter_reads_the_file_by_chunks(csv_file):
+    class Row:
+        def __init__(self, foo, bar):
+            self.foo = foo
+            self.bar = bar
+
+    data = pd.DataFrame({"foo": [1, 2, 3, 4, 5], "bar": [5, 4, 3, 2, 1]})
+    operators = [("foo", 2, Operator.GREATER_THAN), ("bar", 2, Operator.EQUAL)]
+    dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": csv_file, "exposed_type": "pandas"})
+    dn.write(data)
+    numpy_dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": csv_file, "exposed_type": "numpy"})
+    custom_dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": csv_file, "exposed_type": Row})
+
+    with mock.patch.object(CSVDataNode, "_FILTER_CHUNK_SIZE", 2):
+        with mock.patch.object(CSVDataNode, "_read", side_effect=AssertionError("The file must not be read at once")):
+            assert_frame_equal(dn.filter(operators, JoinOperator.OR), data.iloc[[2, 3, 4]])
+            assert numpy_dn.filter((0, 4, Operator.GREATER_OR_EQUAL)).tolist() == [[4, 2], [5, 1]]
+            assert [row.foo for row in custom_dn.filter(("bar", ["2", "4"], Operator.IN))] == ["2", "4"]
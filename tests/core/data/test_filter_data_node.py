@@ -168,6 +168,51 @@ def test_filter_list():
     )
 
 
+def test_filter_with_set_range_and_null_operators():
+    data_frame = pd.DataFrame({"a": [1, 2, None, 4, 5], "b": ["x", "y", "z", None, "x"]}, index=[10, 11, 12, 13, 14])
+    df_dn = FakeDataframeDataNode("fake_dataframe_dn", data_frame)
+
+    assert list(df_dn.filter(("b", ["x", "z"], Operator.IN)).index) == [10, 12, 14]
+    assert list(df_dn.filter(("b", {"x", "z"}, Operator.NOT_IN)).index) == [11, 13]
+    assert list(df_dn.filter(("a", (2, 4), Operator.BETWEEN)).index) == [11, 13]
+    assert list(df_dn.filter(("a", None, Operator.IS_NULL)).index) == [12]
+    assert list(
+        df_dn.filter([("a", None, Operator.IS_NULL), ("b", None, Operator.IS_NULL)], JoinOperator.OR).index
+    ) == [
+        12,
+        13,
+    ]
+    assert list(df_dn.filter([("a", 1, Operator.GREATER_THAN), ("b", ["x"], Operator.IN)]).index) == [14]
+
+    np_dn = FakeNumpyarrayDataNode("fake_np_dn", np.array([[1, 5], [2, 4], [3, 3], [4, 2]]))
+    assert np_dn.filter([(0, [1, 4], Operator.IN), (1, (2, 4), Operator.BETWEEN)]).tolist() == [[4, 2]]
+    assert np_dn.filter((1, [5, 4], Operator.NOT_IN)).tolist() == [[3, 3], [4, 2]]
+
+    list_dn = FakeListDataNode("fake_list_dn")
+    list_dn.data.append(FakeListDataNode.Row(None))
+    assert [row.value for row in list_dn.filter(("value", [7, 2, 3], Operator.IN))] == [2, 3, 7]
+    assert [row.value for row in list_dn.filter(("value", (8, 20), Operator.BETWEEN))] == [8, 9]
+    assert [row.value for row in list_dn.filter(("value", None, Operator.IS_NULL))] == [None]
+    assert [
+        row.value
+        for row in list_dn.filter([("value", 1, Operator.LESS_THAN), ("value", [9], Operator.IN)], JoinOperator.OR)
+    ] == [0, 9]
+
+
+def test_filter_list_of_dicts_keeps_the_rows_and_their_order():
+    rows = [{"a": i % 3, "b": i} for i in range(9)]
+    list_dn = FakeListDataNode("fake_list_dn")
+    list_dn.data = rows
+
+    assert list_dn.filter([("a", 1, Operator.EQUAL), ("b", 2, Operator.GREATER_THAN)]) == [rows[4], rows[7]]
+    assert list_dn.filter([("a", 0, Operator.EQUAL), ("b", 8, Operator.EQUAL)], JoinOperator.OR) == [
+        rows[0],
+        rows[3],
+        rows[6],
+        rows[8],
+    ]
+
+
 def test_filter_numpy_exposed_type(default_data_frame):
     default_array = default_data_frame.to_numpy()
 
@@ -12,6 +12,7 @@
 import os
 import pathlib
 from importlib import util
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -137,3 +138,23 @@ class TestFilterParquetDataNode:
             np.array([[1, 1], [1, 2], [2, 1], [2, 2]]),
         )
         assert np.array_equal(dn[(dn[:, 1] == 1) | (dn[:, 1] == 2)], np.array([[1, 1], [1, 2], [2, 1], [2, 2]]))
+
+    def test_filter_is_pushed_down_to_the_parquet_reader(self, parquet_file_path):
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": parquet_file_path, "exposed_type": "pandas"})
+        data = pd.DataFrame({"foo": [1.0, 2.0, None, 4.0, 5.0], "bar": ["a", "b", "c", None, "e"]})
+        dn._write_with_kwargs(data, row_group_size=2)
+
+        with mock.patch("pandas.read_parquet", wraps=pd.read_parquet) as mck_read_parquet:
+            assert dn.filter(("foo", (2, 4), Operator.BETWEEN))["foo"].tolist() == [2.0, 4.0]
+            assert "filters" in mck_read_parquet.call_args.kwargs
+
+            assert dn.filter(("foo", 2, Operator.NOT_EQUAL))["bar"].tolist() == ["a", "c", None, "e"]
+            assert dn.filter(("bar", ["b", "e"], Operator.NOT_IN))["foo"].fillna(0).tolist() == [1.0, 0, 4.0]
+            assert dn.filter([("foo", None, Operator.IS_NULL), ("bar", None, Operator.IS_NULL)], JoinOperator.OR)[
+                "bar"
+            ].tolist() == ["c", None]
+            assert dn.filter([("foo", [1, 5], Operator.IN), ("bar", "e", Operator.EQUAL)])["foo"].tolist() == [5.0]
+
+            assert dn["bar"].tolist() == data["bar"].tolist()
+            assert mck_read_parquet.call_args.kwargs["columns"] == ["bar"]
+        assert "filters" not in dn.properties["read_kwargs"]
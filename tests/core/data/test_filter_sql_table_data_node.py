@@ -150,3 +150,51 @@ class TestFilterSQLTableDataNode:
             dn.filter([("bar", 1, Operator.EQUAL), ("bar", 2, Operator.EQUAL)], JoinOperator.OR)
 
             assert read_mock["_read"].call_count == 0
+
+    def test_filter_pushdown(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+            "exposed_type": "pandas",
+        }
+        dn = SQLTableDataNode("foo", Scope.SCENARIO, properties=properties)
+        dn.write(pd.DataFrame({"foo": [1, 1, 1, 2, 2, 2], "bar": [1, 2, 3, 1, 2, 3]}))
+
+        filtered = dn.filter(("foo", np.int64(1), Operator.EQUAL), columns=["bar"], order_by="bar", descending=True)
+        assert_frame_equal(filtered, pd.DataFrame({"bar": [3, 2, 1]}))
+        filtered = dn.filter(("bar", [1, 3], Operator.IN), order_by="foo", limit=3)
+        assert_frame_equal(filtered, pd.DataFrame({"foo": [1, 1, 2], "bar": [1, 3, 1]}))
+        filtered = dn.filter(("bar", (2, 3), Operator.BETWEEN), columns=["foo"], limit=1)
+        assert_frame_equal(filtered, pd.DataFrame({"foo": [1]}))
+
+        dn.properties["exposed_type"] = MyCustomObject
+        objects = dn.filter(("foo", 2, Operator.EQUAL), order_by="bar", descending=True, limit=2)
+        assert [(o.foo, o.bar) for o in objects] == [(2, 3), (2, 2)]
+
+    def test_filter_pushdown_quotes_column_names(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+            "exposed_type": "pandas",
+        }
+        dn = SQLTableDataNode("foo", Scope.SCENARIO, properties=properties)
+        dn.write(pd.DataFrame({"foo": [1, 1, 2], "bar": [1, 2, 3]}))
+
+        # Column names are rendered as quoted identifiers, never as SQL fragments.
+        query = str(dn._get_read_query([("1=1 OR foo", 2, Operator.EQUAL)], order_by="foo; DROP TABLE example"))
+        assert 'WHERE "1=1 OR foo" = ' in query
+        assert query.endswith('ORDER BY "foo; DROP TABLE example"')
+        assert dn.filter(("1=1 OR foo", 2, Operator.EQUAL)).empty
+        assert dn.filter(("(SELECT bar FROM example)", 3, Operator.EQUAL)).empty
+        filtered = dn.filter(("foo", 1, Operator.EQUAL), order_by="foo; DROP TABLE example")
+        assert_frame_equal(filtered, pd.DataFrame({"foo": [1, 1], "bar": [1, 2]}))
+
+        assert_frame_equal(dn.read(), pd.DataFrame({"foo": [1, 1, 2], "bar": [1, 2, 3]}))
@@ -346,6 +346,10 @@ class TestMongoCollectionDataNode:
         assert len(mongo_dn.filter(("foo", 1, Operator.NOT_EQUAL))) == 3
         assert len(mongo_dn.filter(("bar", 2, Operator.EQUAL))) == 3
         assert len(mongo_dn.filter([("bar", 1, Operator.EQUAL), ("bar", 2, Operator.EQUAL)], JoinOperator.OR)) == 4
+        assert len(mongo_dn.filter(("foo", [2, 3], Operator.IN))) == 1
+        assert len(mongo_dn.filter(("foo", [1], Operator.NOT_IN))) == 3
+        assert len(mongo_dn.filter(("bar", (1, 1), Operator.BETWEEN))) == 1
+        assert len(mongo_dn.filter(("bar", None, Operator.IS_NULL))) == 2
 
         assert mongo_dn["foo"] == [1, 1, 1, 2, None, None]
         assert mongo_dn["bar"] == [1, 2, None, 2, 2, None]
@@ -359,6 +363,30 @@ class TestMongoCollectionDataNode:
             {},
         ]
 
+    @mongomock.patch(servers=(("localhost", 27017),))
+    @pytest.mark.parametrize("properties", __properties)
+    def test_read_window(self, properties):
+        mock_client = pymongo.MongoClient("localhost")
+        mock_client[properties["db_name"]][properties["collection_name"]].insert_many(
+            [{"foo": i % 3, "bar": i} for i in range(10)]
+        )
+        mongo_dn = MongoCollectionDataNode("foo", Scope.SCENARIO, properties=properties)
+
+        with patch.object(MongoCollectionDataNode, "_read") as read_mock:
+            window, row_count = mongo_dn._read_window(2, 5)
+            assert row_count == 10
+            assert window.to_dict(orient="list") == {"foo": [2, 0, 1], "bar": [2, 3, 4]}
+            assert window.index.tolist() == [2, 3, 4]
+
+            window, row_count = mongo_dn._read_window(0, 2, "bar", True, [("foo", 1, Operator.EQUAL)])
+            assert row_count == 3
+            assert window["bar"].tolist() == [7, 4]
+
+            window, row_count = mongo_dn._read_window(0, 0)
+            assert row_count == 10
+            assert window.empty
+            assert read_mock.call_count == 0
+
     @mongomock.patch(servers=(("localhost", 27017),))
     @pytest.mark.parametrize("properties", __properties)
     def test_filter_does_not_read_all_entities(self, properties):
@@ -114,3 +114,21 @@ def test_read_without_header_custom_exposed_type():
         assert row_pandas[0] == row_custom.id
         assert str(row_pandas[1]) == row_custom.integer
         assert row_pandas[2] == row_custom.text
+
+
+def test_read_schema():
+    data = pd.read_csv(csv_file_path)
+    dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": csv_file_path})
+    schema = dn._read_schema()
+    assert isinstance(schema, pd.DataFrame)
+    assert len(schema) == 0
+    assert schema.dtypes.equals(data.dtypes)
+
+    dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": csv_file_path, "has_header": False})
+    assert list(dn._read_schema().columns) == [0, 1, 2]
+
+    dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": csv_file_path, "exposed_type": "numpy"})
+    assert dn._read_schema().shape == (0, 3)
+
+    dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": csv_file_path, "exposed_type": MyCustomObject})
+    assert dn._read_schema() is None
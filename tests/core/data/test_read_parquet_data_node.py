@@ -12,12 +12,15 @@
 import os
 import pathlib
 from importlib import util
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 
 from pyforge import Scope
+from pyforge.core.data.operator import Operator
 from pyforge.core.data.parquet import ParquetDataNode
 from pyforge.core.exceptions.exceptions import NoData
 
@@ -182,6 +185,57 @@ class TestReadParquetDataNode:
             assert len(dn.read()) != len(df)
             assert len(dn.read()) == 2
 
+    @pytest.mark.parametrize("engine", __engine)
+    def test_read_schema(self, engine, parquet_file_path):
+        df = pd.read_parquet(parquet_file_path)
+        dn = ParquetDataNode("bar", Scope.SCENARIO, properties={"path": parquet_file_path, "engine": engine})
+        if engine != "pyarrow":
+            assert dn._read_schema() is None
+            return
+        schema = dn._read_schema()
+        assert isinstance(schema, pd.DataFrame)
+        assert len(schema) == 0
+        assert schema.dtypes.equals(df.dtypes)
+
+        properties = {"path": parquet_file_path, "read_kwargs": {"columns": ["b"]}}
+        assert list(ParquetDataNode("bar", Scope.SCENARIO, properties=properties)._read_schema().columns) == ["b"]
+        properties = {"path": parquet_file_path, "exposed_type": "numpy"}
+        assert ParquetDataNode("bar", Scope.SCENARIO, properties=properties)._read_schema().shape == (0, df.shape[1])
+        properties = {"path": parquet_file_path, "read_kwargs": {"dtype_backend": "pyarrow"}}
+        assert ParquetDataNode("bar", Scope.SCENARIO, properties=properties)._read_schema() is None
+        assert ParquetDataNode("foo", Scope.SCENARIO, properties={"path": "nonexistent.parquet"})._read_schema() is None
+
+    def test_read_window(self, tmpdir_factory):
+        path = str(tmpdir_factory.mktemp("data").join("window.parquet"))
+        df = pd.DataFrame({"a": range(100), "b": [i % 7 for i in range(100)]})
+        df.to_parquet(path, row_group_size=10)
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": path})
+
+        # Only the row groups holding the window are read.
+        with patch(
+            "pyarrow.parquet.ParquetFile.read_row_groups", autospec=True, side_effect=pq.ParquetFile.read_row_groups
+        ) as mock_read:
+            window, row_count = dn._read_window(25, 42)
+            assert mock_read.call_args.args[1] == [2, 3, 4]
+        assert row_count == 100
+        assert window.equals(df.iloc[25:42])
+
+        window, row_count = dn._read_window(1, 3, "a", descending=True, operators=[("b", 2, Operator.EQUAL)])
+        assert row_count == 14
+        assert window["a"].tolist() == [86, 79]
+
+        window, row_count = dn._read_window(100, 110)
+        assert row_count == 100
+        assert window.empty
+        assert list(window.columns) == ["a", "b"]
+
+        properties = {"path": path, "exposed_type": "numpy"}
+        assert ParquetDataNode("foo", Scope.SCENARIO, properties=properties)._read_window(0, 10) is None
+        assert (
+            ParquetDataNode("bar", Scope.SCENARIO, properties={"path": "nonexistent.parquet"})._read_window(0, 10)
+            is None
+        )
+
     def test_read_with_kwargs_never_written(self):
         path = "data/node/path"
         dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": path})
@@ -170,19 +170,41 @@ class TestReadSQLTableDataNode:
             properties=custom_properties,
         )
 
-        assert sql_data_node._get_read_query(("key", 1, Operator.EQUAL)) == "SELECT * FROM example WHERE key = '1'"
-        assert sql_data_node._get_read_query(("key", 1, Operator.NOT_EQUAL)) == "SELECT * FROM example WHERE key <> '1'"
-        assert (
-            sql_data_node._get_read_query(("key", 1, Operator.GREATER_THAN)) == "SELECT * FROM example WHERE key > '1'"
+        def compile_query(*args, **kwargs):
+            compiled = sql_data_node._get_read_query(*args, **kwargs).compile()
+            return " ".join(str(compiled).split()), compiled.params
+
+        assert compile_query(("key", 1, Operator.EQUAL)) == ("SELECT * FROM example WHERE key = :key_1", {"key_1": 1})
+        assert compile_query(("key", 1, Operator.NOT_EQUAL)) == (
+            "SELECT * FROM example WHERE key != :key_1",
+            {"key_1": 1},
         )
-        assert (
-            sql_data_node._get_read_query(("key", 1, Operator.GREATER_OR_EQUAL))
-            == "SELECT * FROM example WHERE key >= '1'"
+        assert compile_query(("key", 1, Operator.GREATER_THAN)) == (
+            "SELECT * FROM example WHERE key > :key_1",
+            {"key_1": 1},
         )
-        assert sql_data_node._get_read_query(("key", 1, Operator.LESS_THAN)) == "SELECT * FROM example WHERE key < '1'"
-        assert (
-            sql_data_node._get_read_query(("key", 1, Operator.LESS_OR_EQUAL))
-            == "SELECT * FROM example WHERE key <= '1'"
+        assert compile_query(("key", 1, Operator.GREATER_OR_EQUAL)) == (
+            "SELECT * FROM example WHERE key >= :key_1",
+            {"key_1": 1},
+        )
+        assert compile_query(("key", 1, Operator.LESS_THAN)) == (
+            "SELECT * FROM example WHERE key < :key_1",
+            {"key_1": 1},
+        )
+        assert compile_query(("key", 1, Operator.LESS_OR_EQUAL)) == (
+            "SELECT * FROM example WHERE key <= :key_1",
+            {"key_1": 1},
+        )
+        assert compile_query(("key", np.int64(1), Operator.EQUAL))[1] == {"key_1": 1}
+        assert type(compile_query(("key", np.int64(1), Operator.EQUAL))[1]["key_1"]) is int
+        assert compile_query(("key", (1, 3), Operator.BETWEEN)) == (
+            "SELECT * FROM example WHERE key BETWEEN :key_1 AND :key_2",
+            {"key_1": 1, "key_2": 3},
+        )
+        assert compile_query(("key", None, Operator.IS_NULL)) == ("SELECT * FROM example WHERE key IS NULL", {})
+        assert compile_query(("key", "a'; DROP TABLE example; --", Operator.EQUAL)) == (
+            "SELECT * FROM example WHERE key = :key_1",
+            {"key_1": "a'; DROP TABLE example; --"},
         )
 
         with pytest.raises(NotImplementedError):
@@ -190,17 +212,17 @@ class TestReadSQLTableDataNode:
                 [("key", 1, Operator.EQUAL), ("key2", 2, Operator.GREATER_THAN)], "SOME JoinOperator"
             )
 
-        assert (
-            sql_data_node._get_read_query(
-                [("key", 1, Operator.EQUAL), ("key2", 2, Operator.GREATER_THAN)], JoinOperator.AND
-            )
-            == "SELECT * FROM example WHERE key = '1' AND key2 > '2'"
+        assert compile_query([("key", 1, Operator.EQUAL), ("key2", 2, Operator.GREATER_THAN)], JoinOperator.AND) == (
+            "SELECT * FROM example WHERE key = :key_1 AND key2 > :key2_1",
+            {"key_1": 1, "key2_1": 2},
         )
-        assert (
-            sql_data_node._get_read_query(
-                [("key", 1, Operator.EQUAL), ("key2", 2, Operator.GREATER_THAN)], JoinOperator.OR
-            )
-            == "SELECT * FROM example WHERE key = '1' OR key2 > '2'"
+        assert compile_query([("key", 1, Operator.EQUAL), ("key2", 2, Operator.GREATER_THAN)], JoinOperator.OR) == (
+            "SELECT * FROM example WHERE key = :key_1 OR key2 > :key2_1",
+            {"key_1": 1, "key2_1": 2},
+        )
+        assert compile_query(columns=["foo", "bar"], order_by="foo", descending=True, limit=10) == (
+            "SELECT foo, bar FROM example ORDER BY foo DESC LIMIT :param_1",
+            {"param_1": 10},
         )
 
     @pytest.mark.parametrize("sql_properties", __sql_properties)
@@ -241,7 +263,7 @@ class TestReadSQLTableDataNode:
 
         with patch("sqlalchemy.engine.Engine.connect") as engine_mock:
             cursor_mock = engine_mock.return_value.__enter__.return_value
-            cursor_mock.execute.return_value = mock_return_data
+            cursor_mock.execute.return_value.mappings.return_value = mock_return_data
             custom_data = sql_data_node.read()
 
         for row_mock_data, row_custom in zip(mock_return_data, custom_data):
@@ -272,3 +294,59 @@ class TestReadSQLTableDataNode:
         data = dn.read()
 
         assert data.equals(pd.DataFrame([{"foo": 1, "bar": 2}, {"foo": 3, "bar": 4}]))
+
+    def test_read_chunks(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+        }
+        dn = SQLTableDataNode("foo", Scope.SCENARIO, properties=properties)
+        dn.write(pd.DataFrame({"foo": [i % 3 for i in range(10)], "bar": range(10)}))
+
+        chunks = list(dn.read_chunks(4))
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        assert pd.concat(chunks, ignore_index=True).equals(dn.read())
+
+        chunks = list(dn.read_chunks(2, operators=[("foo", 1, Operator.EQUAL)]))
+        assert [chunk["bar"].tolist() for chunk in chunks] == [[1, 4], [7]]
+
+        dn.properties["exposed_type"] = "numpy"
+        assert np.array_equal(next(dn.read_chunks(1)), np.array([[0, 0]]))
+
+        dn.properties["exposed_type"] = MyCustomObject
+        chunk = next(dn.read_chunks(3))
+        assert [(row.foo, row.bar) for row in chunk] == [(0, 0), (1, 1), (2, 2)]
+
+        with pytest.raises(ValueError):
+            dn.read_chunks(0)
+
+    def test_read_window(self, tmp_sqlite_sqlite3_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+        }
+        dn = SQLTableDataNode("foo", Scope.SCENARIO, properties=properties)
+        dn.write(pd.DataFrame({"foo": [i % 3 for i in range(10)], "bar": range(10)}))
+
+        window, row_count = dn._read_window(2, 5)
+        assert row_count == 10
+        assert window.equals(pd.DataFrame({"foo": [2, 0, 1], "bar": [2, 3, 4]}, index=pd.RangeIndex(2, 5)))
+
+        window, row_count = dn._read_window(0, 2, "bar", descending=True, operators=[("foo", 1, Operator.EQUAL)])
+        assert row_count == 3
+        assert window["bar"].tolist() == [7, 4]
+
+        window, row_count = dn._read_window(10, 12)
+        assert row_count == 10
+        assert window.empty
+
+        dn.properties["exposed_type"] = "numpy"
+        assert dn._read_window(0, 2) is None
@@ -17,6 +17,7 @@ import pytest
 from pyforge import Scope
 from pyforge.common.config import Config
 from pyforge.core.data._data_manager_factory import _DataManagerFactory
+from pyforge.core.data._sql_engine_registry import _SQLEngineRegistry
 from pyforge.core.data.data_node_id import DataNodeId
 from pyforge.core.data.sql_table import SQLTableDataNode
 from pyforge.core.exceptions.exceptions import InvalidExposedType, MissingRequiredProperty
@@ -179,3 +180,30 @@ class TestSQLTableDataNode:
 
             dn.some_random_attribute_that_does_not_related_to_engine = "foo"
             assert dn._engine is not None
+
+    def test_engine_shared_between_data_nodes(self, tmp_sqlite_db_file_path):
+        folder_path, db_name, file_extension = tmp_sqlite_db_file_path
+        properties = {
+            "db_name": db_name,
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+            "db_pool_pre_ping": True,
+        }
+        dn_1 = SQLTableDataNode("foo", Scope.SCENARIO, properties=properties.copy())
+        dn_2 = SQLTableDataNode("bar", Scope.SCENARIO, properties=properties.copy())
+        assert dn_1._get_engine() is dn_2._get_engine()
+        assert dn_1._get_engine().pool._pre_ping
+
+        url = dn_1._get_engine().url.render_as_string(hide_password=True)
+        before = _SQLEngineRegistry._get_metrics().get(url, {"connects": 0, "checkouts": 0})
+        assert len(dn_1.read()) == 2
+        assert len(dn_2.read()) == 2
+        metrics = _SQLEngineRegistry._get_metrics()[url]
+        assert metrics["connects"] - before["connects"] <= 1
+        assert metrics["checkouts"] - before["checkouts"] == 2
+        assert metrics["checked_out"] == 0
+
+        dn_3 = SQLTableDataNode("baz", Scope.SCENARIO, properties={**properties, "db_pool_pre_ping": False})
+        assert dn_3._get_engine() is not dn_1._get_engine()
@@ -10,7 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 from importlib import util
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pandas as pd
@@ -19,6 +19,7 @@ from pandas.testing import assert_frame_equal
 
 from pyforge import Scope
 from pyforge.core.data.sql_table import SQLTableDataNode
+from pyforge.core.exceptions.exceptions import UnknownInsertStrategy
 
 
 class MyCustomObject:
@@ -187,3 +188,70 @@ class TestWriteSQLTableDataNode:
         append_data_1 = pd.DataFrame([{"foo": 5, "bar": 6}, {"foo": 7, "bar": 8}])
         dn.append(append_data_1)
         assert_frame_equal(dn.read(), pd.concat([original_data, append_data_1]).reset_index(drop=True))
+
+    @pytest.mark.parametrize("insert_strategy", ["executemany", "multi"])
+    def test_sqlite_write_and_append_with_insert_strategy(self, tmp_sqlite_sqlite3_file_path, insert_strategy):
+        folder_path, db_name, file_extension = tmp_sqlite_sqlite3_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+            "insert_strategy": insert_strategy,
+            "insert_chunksize": 3,
+        }
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+
+        data = pd.DataFrame({"foo": range(10), "bar": [None if i % 4 == 0 else i * 10 for i in range(10)]})
+        dn.write(data)
+        assert_frame_equal(dn.read(), data)
+
+        append_data = pd.DataFrame({"foo": [10, 11], "bar": [100.0, 110.0]})
+        dn.append(append_data)
+        assert_frame_equal(dn.read(), pd.concat([data, append_data]).reset_index(drop=True))
+
+        dn.write(pd.DataFrame(columns=["foo", "bar"]))
+        assert len(dn.read()) == 0
+
+    def test_copy_insert_strategy(self):
+        properties = {
+            "db_username": "sa",
+            "db_password": "Passw0rd",
+            "db_name": "pyforge",
+            "db_engine": "postgresql",
+            "table_name": "example",
+            "insert_strategy": "copy",
+            "insert_chunksize": 2,
+        }
+        dn = SQLTableDataNode("foo", Scope.SCENARIO, properties=properties)
+        table = MagicMock()
+        connection = MagicMock()
+        connection.dialect.identifier_preparer.quote.side_effect = lambda name: name
+        connection.dialect.identifier_preparer.format_table.return_value = "example"
+        cursor = connection.connection.cursor.return_value
+        copied = []
+        cursor.copy_expert.side_effect = lambda statement, buffer: copied.append((statement, buffer.read()))
+
+        with patch("pyforge.core.data.sql_table.SQLTableDataNode._create_table", return_value=table):
+            dn._do_write(pd.DataFrame({"foo": [1, 2, 3], "bar": [4, None, 6]}), MagicMock(), connection)
+
+        connection.execute.assert_called_once_with(table.delete())
+        statement = "COPY example (foo, bar) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+        assert copied == [(statement, "1,4.0\n2,\\N\n"), (statement, "3,6.0\n")]
+        cursor.close.assert_called_once()
+
+        # Only the missing values are written as the NULL marker: the empty fields are loaded as empty strings.
+        copied.clear()
+        with patch("pyforge.core.data.sql_table.SQLTableDataNode._create_table", return_value=table):
+            dn._do_write(pd.DataFrame({"foo": [1, 2, 3], "bar": ["", None, "x"]}), MagicMock(), connection)
+        assert copied == [(statement, "1,\n2,\\N\n"), (statement, "3,x\n")]
+
+    def test_invalid_insert_strategy(self):
+        properties = {"db_name": "pyforge", "db_engine": "sqlite", "table_name": "example"}
+        with pytest.raises(UnknownInsertStrategy):
+            SQLTableDataNode("foo", Scope.SCENARIO, properties={**properties, "insert_strategy": "bulk"})
+        with pytest.raises(UnknownInsertStrategy):
+            SQLTableDataNode("foo", Scope.SCENARIO, properties={**properties, "insert_strategy": "copy"})
+        dn = SQLTableDataNode("foo", Scope.SCENARIO, properties=properties)
+        assert dn.properties["insert_strategy"] == "executemany"
@@ -12,6 +12,7 @@
 import multiprocessing
 import random
 import string
+from datetime import datetime
 from functools import partial
 from time import sleep
 from typing import cast
@@ -109,6 +110,21 @@ def test_get_latest_job():
     assert _JobManager._get_latest(task_2).id == job_2.id
 
 
+def test_get_latest_job_after_deletion():
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+    task = _create_task(multiply, name="get_latest_job_after_deletion")
+
+    job_1 = _OrchestratorFactory._orchestrator.submit_task(task).jobs[0]
+    sleep(0.01)
+    job_2 = _OrchestratorFactory._orchestrator.submit_task(task).jobs[0]
+    assert _JobManager._get_latest(task.id).id == job_2.id
+
+    _JobManager._delete(job_2)
+    assert _JobManager._get_latest(task).id == job_1.id
+    _JobManager._delete(job_1)
+    assert _JobManager._get_latest(task) is None
+
+
 def test_get_job_unknown():
     assert _JobManager._get(JobId("Unknown")) is None
 
@@ -124,6 +140,46 @@ def test_get_jobs():
     assert {job.id for job in _JobManager._get_all()} == {job_1.id, job_2.id}
 
 
+def test_get_jobs_by_task_status_and_creation_date():
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+    task = _create_task(multiply, name="get_jobs_by_task")
+    task_2 = _create_task(multiply, name="get_jobs_by_task_2")
+
+    job_1 = _OrchestratorFactory._orchestrator.submit_task(task).jobs[0]
+    sleep(0.01)
+    since = datetime.now()
+    job_2 = _JobManager._create(task, [print], "submit_id", task.id)
+    job_3 = _OrchestratorFactory._orchestrator.submit_task(task_2).jobs[0]
+
+    assert {job.id for job in _JobManager._get_all_matching(task=task)} == {job_1.id, job_2.id}
+    assert {job.id for job in _JobManager._get_all_matching(status=Status.COMPLETED)} == {job_1.id, job_3.id}
+    assert {job.id for job in _JobManager._get_all_matching(status=[Status.SUBMITTED])} == {job_2.id}
+    assert {job.id for job in _JobManager._get_all_matching(since=since)} == {job_2.id, job_3.id}
+    assert [job.id for job in _JobManager._get_all_matching(task, Status.COMPLETED, since)] == []
+    assert [job.id for job in _JobManager._get_all_matching(task_2, Status.COMPLETED, since)] == [job_3.id]
+    assert _JobManager._get_all_matching(status=[]) == []
+
+
+def test_get_jobs_page():
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+    task = _create_task(multiply, name="get_jobs_page")
+    jobs = []
+    for _ in range(5):
+        jobs.append(_OrchestratorFactory._orchestrator.submit_task(task).jobs[0])
+        sleep(0.01)
+    job_ids = [job.id for job in jobs]
+
+    assert [job.id for job in _JobManager._get_all_matching(order_by="creation_date", limit=2)] == job_ids[:2]
+    assert [
+        job.id
+        for job in _JobManager._get_all_matching(task, order_by="creation_date", descending=True, offset=1, limit=2)
+    ] == [job_ids[3], job_ids[2]]
+    since = jobs[2].creation_date
+    assert [job.id for job in _JobManager._get_all_matching(since=since, order_by="creation_date")] == job_ids[2:]
+    assert [job.id for job in _JobManager._get_all_matching(offset=3)] == sorted(job_ids)[3:]
+    assert [job.id for job in _JobManager._iter_all_by(order_by="creation_date", descending=True)] == job_ids[::-1]
+
+
 def test_delete_job():
     Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
 
@@ -10,6 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 from queue import SimpleQueue
+from typing import List
 
 from pyforge.common.config import Config
 from pyforge.core import pyforge as tp
@@ -58,6 +59,18 @@ class TaskCreationCoreEventConsumerProcessor(CoreEventConsumerBase):
         self.creation_event_operation_collected += 1
 
 
+class BatchedCoreEventConsumerProcessor(CoreEventConsumerBase):
+    def __init__(self, registration_id: str, queue: SimpleQueue, batch_size: int, batch_window: float):
+        self.batches: List[List[Event]] = []
+        super().__init__(registration_id, queue, batch_size, batch_window)
+
+    def process_event(self, event: Event):
+        raise AssertionError("The events should be processed by batches.")
+
+    def process_events(self, events: List[Event]):
+        self.batches.append(events)
+
+
 def test_core_event_consumer():
     register_id_0, register_queue_0 = Notifier.register()
     all_evt_csumer_0 = AllCoreEventConsumerProcessor(register_id_0, register_queue_0)
@@ -105,3 +118,38 @@ def test_core_event_consumer():
     all_evt_csumer_0.stop()
     sc_evt_csumer_1.stop()
     task_creation_evt_csumer_2.stop()
+
+
+def test_batched_core_event_consumer_coalesces_the_updates():
+    queue: SimpleQueue = SimpleQueue()
+    consumer = BatchedCoreEventConsumerProcessor("registration_id", queue, batch_size=10, batch_window=0.5)
+    creation = Event(EventEntityType.DATA_NODE, EventOperation.CREATION, entity_id="dn")
+    updates = [
+        Event(
+            EventEntityType.DATA_NODE, EventOperation.UPDATE, entity_id="dn", attribute_name="name", attribute_value=i
+        )
+        for i in range(3)
+    ]
+    other_update = Event(EventEntityType.DATA_NODE, EventOperation.UPDATE, entity_id="dn", attribute_name="owner_id")
+    for event in [creation, updates[0], other_update, updates[1], updates[2]]:
+        queue.put(event)
+
+    consumer.start()
+    assert_true_after_time(lambda: len(consumer.batches) == 1, time=10)
+    consumer.stop()
+
+    assert consumer.batches == [[creation, other_update, updates[2]]]
+
+
+def test_batched_core_event_consumer_batch_size():
+    queue: SimpleQueue = SimpleQueue()
+    consumer = BatchedCoreEventConsumerProcessor("registration_id", queue, batch_size=2, batch_window=1)
+    events = [Event(EventEntityType.JOB, EventOperation.CREATION, entity_id=f"job_{i}") for i in range(5)]
+    for event in events:
+        queue.put(event)
+
+    consumer.start()
+    assert_true_after_time(lambda: len(consumer.batches) == 3, time=30)
+    consumer.stop()
+
+    assert consumer.batches == [events[:2], events[2:4], events[4:]]
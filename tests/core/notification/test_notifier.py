@@ -12,6 +12,7 @@
 from queue import SimpleQueue
 
 from pyforge.common.config import Config
+from pyforge.core import Orchestrator
 from pyforge.core import pyforge as tp
 from pyforge.core._version._version_manager_factory import _VersionManagerFactory
 from pyforge.core.common.frequency import Frequency
@@ -844,3 +845,80 @@ def test_publish_deletion_event():
         and event.attribute_name is None
         for i, event in enumerate(published_events)
     )
+
+
+def test_publish_matches_the_same_topics_as_is_matching():
+    topics = [
+        _Topic(),
+        _Topic(EventEntityType.SCENARIO),
+        _Topic(EventEntityType.SCENARIO, "scenario_id"),
+        _Topic(EventEntityType.SCENARIO, "other_scenario_id"),
+        _Topic(operation=EventOperation.UPDATE),
+        _Topic(EventEntityType.DATA_NODE, operation=EventOperation.UPDATE, attribute_name="name"),
+        _Topic(attribute_name="name"),
+        _Topic(attribute_name="properties"),
+    ]
+    registrations = {
+        Notifier.register(topic.entity_type, topic.entity_id, topic.operation, topic.attribute_name): topic
+        for topic in topics
+    }
+    events = [
+        Event(EventEntityType.SCENARIO, EventOperation.CREATION, entity_id="scenario_id"),
+        Event(EventEntityType.SCENARIO, EventOperation.UPDATE, entity_id="scenario_id", attribute_name="name"),
+        Event(EventEntityType.DATA_NODE, EventOperation.UPDATE, entity_id="dn_id", attribute_name="name"),
+        Event(EventEntityType.DATA_NODE, EventOperation.UPDATE, entity_id="dn_id", attribute_name="properties"),
+        Event(EventEntityType.DATA_NODE, EventOperation.UPDATE, entity_id="dn_id"),
+    ]
+
+    for event in events:
+        Notifier.publish(event)
+        for (_, queue), topic in registrations.items():
+            if Notifier._is_matching(event, topic):
+                assert queue.get_nowait() == event
+            assert queue.empty()
+
+
+def test_indexes_are_rebuilt_when_the_registrations_are_reset():
+    registration_id, queue = Notifier.register(EventEntityType.CYCLE)
+    Notifier._topics_registrations_list = {}
+    Notifier.publish(Event(EventEntityType.CYCLE, EventOperation.CREATION, entity_id="cycle_id"))
+    assert queue.empty()
+
+    Notifier.unregister(registration_id)
+    new_registration_id, new_queue = Notifier.register(EventEntityType.CYCLE)
+    Notifier.publish(Event(EventEntityType.CYCLE, EventOperation.CREATION, entity_id="cycle_id"))
+    assert new_queue.qsize() == 1
+
+    Notifier.unregister(new_registration_id)
+    assert len(Notifier._topics_registrations_list) == 0
+
+
+def test_fan_out_delivers_the_events_in_order():
+    _, queue = Notifier.register(EventEntityType.DATA_NODE)
+    events = [Event(EventEntityType.DATA_NODE, EventOperation.CREATION, entity_id=f"dn_{i}") for i in range(100)]
+
+    Notifier._start_fan_out(10)
+    try:
+        for event in events:
+            Notifier.publish(event)
+    finally:
+        Notifier._stop_fan_out()
+
+    assert [queue.get_nowait() for _ in range(queue.qsize())] == events
+
+    Notifier.publish(events[0])
+    assert queue.get_nowait() == events[0]
+
+
+def test_orchestrator_starts_and_stops_the_fan_out():
+    Config.configure_core(notification_queue_size=10)
+    scenario_config = Config.configure_scenario("sc")
+    _, queue = Notifier.register(EventEntityType.SCENARIO, operation=EventOperation.CREATION)
+    orchestrator = Orchestrator()
+    orchestrator.run()
+    try:
+        scenario = tp.create_scenario(scenario_config)
+    finally:
+        orchestrator.stop()
+
+    assert queue.get(timeout=1).entity_id == scenario.id
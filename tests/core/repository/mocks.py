@@ -17,6 +17,7 @@ from typing import Any, Dict, Optional
 from pyforge.common.config import Config
 from pyforge.core._repository._abstract_converter import _AbstractConverter
 from pyforge.core._repository._filesystem_repository import _FileSystemRepository
+from pyforge.core._repository._sql_repository import _SQLRepository
 from pyforge.core._version._version_manager import _VersionManager
 
 
@@ -72,3 +73,8 @@ class MockFSRepository(_FileSystemRepository):
     @property
     def _storage_folder(self) -> pathlib.Path:
         return pathlib.Path(Config.core.storage_folder)  # type: ignore
+
+
+class MockSQLRepository(_SQLRepository):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -16,9 +16,10 @@ import shutil
 
 import pytest
 
+from pyforge.core._repository._range import _Range
 from pyforge.core.exceptions.exceptions import ModelNotFound
 
-from .mocks import MockConverter, MockFSRepository, MockModel, MockObj
+from .mocks import MockConverter, MockFSRepository, MockModel, MockObj, MockSQLRepository
 
 
 class TestRepositoriesStorage:
@@ -42,6 +43,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_save_and_fetch_model(self, mock_repo, params):
@@ -56,6 +58,30 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+        ],
+    )
+    def test_save_many_and_load_many(self, mock_repo, params):
+        r = mock_repo(**params)
+        r._delete_all()
+        objs = [MockObj(f"uuid-{i}", f"Foo{i}") for i in range(5)]
+        r._save_many(objs)
+        r._save_many([])
+
+        assert r._load_all() == objs
+        assert r._load_many(["uuid-3", "non-existent", "uuid-1"]) == [objs[3], objs[1]]
+        assert r._load_many([]) == []
+
+        objs[2].name = "Bar"
+        r._save_many(objs[2:3])
+        assert r._load("uuid-2").name == "Bar"
+        assert len(r._load_all()) == 5
+
+    @pytest.mark.parametrize(
+        "mock_repo,params",
+        [
+            (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_exists(self, mock_repo, params):
@@ -70,6 +96,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_get_all(self, mock_repo, params):
@@ -93,6 +120,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_delete_all(self, mock_repo, params):
@@ -114,6 +142,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_delete_many(self, mock_repo, params):
@@ -134,6 +163,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_search(self, mock_repo, params):
@@ -153,6 +183,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     @pytest.mark.parametrize("export_path", ["tmp"])
@@ -174,3 +205,151 @@ class TestRepositoriesStorage:
         assert pathlib.Path(os.path.join(export_path, "mock_model/uuid.json")).exists()
 
         shutil.rmtree(export_path, ignore_errors=True)
+
+    @pytest.mark.parametrize(
+        "mock_repo,params",
+        [
+            (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+        ],
+    )
+    def test_load_all_with_filters(self, mock_repo, params):
+        r = mock_repo(**params)
+        r._delete_all()
+
+        for i in range(6):
+            r._save(MockObj(f"uuid-{i}", f"Foo{i % 2}", version=f"{i % 3}"))
+
+        assert {m.id for m in r._load_all([{"version": "0"}])} == {"uuid-0", "uuid-3"}
+        assert {m.id for m in r._load_all([{"version": "0"}, {"version": "1"}])} == {
+            "uuid-0",
+            "uuid-1",
+            "uuid-3",
+            "uuid-4",
+        }
+        # Non-indexed attributes are still checked against the stored content
+        assert {m.id for m in r._load_all([{"version": "0", "name": "Foo1"}])} == {"uuid-3"}
+        assert r._load_all([{"version": "unknown"}]) == []
+
+        r._delete_by("version", "0")
+        assert {m.id for m in r._load_all()} == {"uuid-1", "uuid-2", "uuid-4", "uuid-5"}
+
+    @pytest.mark.parametrize(
+        "mock_repo,params",
+        [
+            (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+        ],
+    )
+    def test_load_page_and_iter_all(self, mock_repo, params):
+        r = mock_repo(**params)
+        r._delete_all()
+        r._ITERATION_PAGE_SIZE = 3
+        objs = [MockObj(f"uuid-{i}", f"Foo{9 - i}", version=f"{i % 2}") for i in range(10)]
+        objs.append(MockObj("uuid-x", None, version="1"))
+        r._save_many(objs)
+
+        assert r._load_page(limit=3) == objs[:3]
+        assert r._load_page(descending=True, offset=1, limit=3) == [objs[9], objs[8], objs[7]]
+        assert r._load_page([{"version": "0"}], offset=1, limit=2) == [objs[2], objs[4]]
+        assert r._load_page([{"version": "1", "name": "Foo2"}, {"name": "Foo4"}]) == [objs[5], objs[7]]
+        assert r._load_page([{"version": "0"}], order_by="version", descending=True, limit=2) == [objs[8], objs[6]]
+        # The entities without value come first in ascending order.
+        assert r._load_page(order_by="name", limit=3) == [objs[10], objs[9], objs[8]]
+        assert r._load_page(order_by="name", descending=True, offset=9) == [objs[0], objs[10]]
+
+        assert list(r._iter_all()) == sorted(objs, key=lambda obj: obj.id)
+        assert list(r._iter_all(order_by="name")) == [objs[10], *reversed(objs[:10])]
+        assert list(r._iter_all(order_by="name", descending=True)) == [*objs[:10], objs[10]]
+        assert list(r._iter_all([{"version": "1"}], order_by="version", descending=True)) == [
+            objs[10],
+            *reversed(objs[1:10:2]),
+        ]
+
+    @pytest.mark.parametrize(
+        "mock_repo,params",
+        [
+            (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+        ],
+    )
+    def test_load_all_with_range_filters(self, mock_repo, params):
+        r = mock_repo(**params)
+        r._delete_all()
+        r._save_many([MockObj(f"uuid-{i}", f"Foo{i}", version=f"{i}.0") for i in range(5)])
+
+        assert {m.id for m in r._load_all([{"version": _Range("1.0", "3.0")}])} == {"uuid-1", "uuid-2"}
+        assert {m.id for m in r._load_all([{"version": _Range("3.0")}, {"version": "0.0"}])} == {
+            "uuid-0",
+            "uuid-3",
+            "uuid-4",
+        }
+        assert [m.id for m in r._load_page([{"version": _Range(end="2.0")}], descending=True)] == ["uuid-1", "uuid-0"]
+
+    @pytest.mark.parametrize(
+        "mock_repo,params",
+        [
+            (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+        ],
+    )
+    def test_load_all_with_non_string_filters(self, mock_repo, params):
+        r = mock_repo(**params)
+        r._delete_all()
+        r._save_many([MockObj("uuid-0", "Foo0", version="1.0"), MockObj("uuid-1", None, version="1.0")])
+
+        # The non-indexed attributes are compared with their stored values, whatever their type.
+        assert [m.id for m in r._load_all([{"version": "1.0", "name": None}])] == ["uuid-1"]
+        assert r._load_all([{"name": 0}]) == []
+        assert r._load_all([{"name": False}]) == []
+        assert [m.id for m in r._load_all([{"name": _Range("Foo", "Fop")}])] == ["uuid-0"]
+
+    def test_index_is_shared_and_reconciled_with_folder(self):
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        r._save(MockObj("uuid-0", "foo", version="1.0"))
+
+        # Another repository instance, as in another process, sees the same catalog
+        other = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        assert [m.id for m in other._load_all([{"version": "1.0"}])] == ["uuid-0"]
+        other._save(MockObj("uuid-1", "bar", version="1.0"))
+        assert {m.id for m in r._load_all([{"version": "1.0"}])} == {"uuid-0", "uuid-1"}
+
+        # Files added or removed without the index knowing it are taken into account
+        with open(r.dir_path / "uuid-2.json", "w") as f:
+            json.dump({"id": "uuid-2", "name": "baz", "version": "1.0"}, f)
+        os.remove(r.dir_path / "uuid-0.json")
+        assert {m.id for m in r._load_all([{"version": "1.0"}])} == {"uuid-1", "uuid-2"}
+
+        # A stale or deleted index file is rebuilt from the entity files
+        os.remove(r.dir_path / ".index")
+        fresh = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        assert {m.id for m in fresh._load_all([{"version": "1.0"}])} == {"uuid-1", "uuid-2"}
+        assert (r.dir_path / ".index").exists()
+
+    def test_index_file_is_compacted(self):
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        r._index._COMPACTION_MIN_OBSOLETE_LINES = 10
+
+        for i in range(30):
+            r._save(MockObj("uuid", "foo", version=str(i)))
+
+        with open(r.dir_path / ".index") as f:
+            assert len(f.readlines()) <= 12
+        other = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        assert [m.id for m in other._load_all([{"version": "29"}])] == ["uuid"]
+
+    def test_index_is_rebuilt_when_the_indexed_attributes_change(self):
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        r._save(MockObj("uuid-0", "foo", version="1.0"))
+        r._save(MockObj("uuid-1", "bar", version="1.0"))
+
+        class MockFSRepositoryIndexingNames(MockFSRepository):
+            _INDEXED_ATTRIBUTES = (*MockFSRepository._INDEXED_ATTRIBUTES, "name")
+
+        other = MockFSRepositoryIndexingNames(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        assert other._index._match([{"name": "foo"}]) == {"uuid-0": None}
+        with open(r.dir_path / ".index") as f:
+            assert json.loads(f.readline()) == {"__attributes__": list(other._INDEXED_ATTRIBUTES)}
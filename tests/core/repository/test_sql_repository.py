@@ -0,0 +1,123 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+import pyforge.core.pyforge as tp
+from pyforge import Scope
+from pyforge.common.config import Config
+from pyforge.core._repository._sql_connection import _SQLConnection
+from pyforge.core._version._version_manager_factory import _VersionManagerFactory
+from pyforge.core._version._version_sql_repository import _VersionSQLRepository
+from pyforge.core.data._data_manager_factory import _DataManagerFactory
+from pyforge.core.data._data_sql_repository import _DataSQLRepository
+from pyforge.core.job._job_manager_factory import _JobManagerFactory
+from pyforge.core.job._job_sql_repository import _JobSQLRepository
+from pyforge.core.job.status import Status
+from pyforge.core.scenario._scenario_manager_factory import _ScenarioManagerFactory
+from pyforge.core.scenario._scenario_sql_repository import _ScenarioSQLRepository
+from pyforge.core.task._task_manager_factory import _TaskManagerFactory
+
+
+def mult_by_2(a):
+    return a * 2
+
+
+@pytest.fixture
+def sql_repository(tmp_sqlite):
+    Config.configure_core(repository_type="sql", repository_properties={"db_location": tmp_sqlite})
+    yield
+    _SQLConnection._close_all()
+    Config.unblock_update()
+    Config.configure_core(repository_type="filesystem", repository_properties={})
+
+
+@pytest.mark.usefixtures("sql_repository")
+def test_sql_repositories_are_built():
+    assert isinstance(_DataManagerFactory._build_manager()._repository, _DataSQLRepository)
+    assert isinstance(_JobManagerFactory._build_manager()._repository, _JobSQLRepository)
+    assert isinstance(_ScenarioManagerFactory._build_manager()._repository, _ScenarioSQLRepository)
+    assert isinstance(_VersionManagerFactory._build_manager()._repository, _VersionSQLRepository)
+
+
+@pytest.mark.usefixtures("sql_repository")
+def test_create_and_submit_scenario(tmp_sqlite):
+    input_cfg = Config.configure_data_node("number", default_data=21, scope=Scope.SCENARIO)
+    output_cfg = Config.configure_data_node("doubled_number", scope=Scope.SCENARIO)
+    task_cfg = Config.configure_task("double", mult_by_2, input_cfg, output_cfg)
+    scenario_cfg = Config.configure_scenario("scenario", [task_cfg])
+
+    scenario = tp.create_scenario(scenario_cfg)
+    tp.submit(scenario)
+
+    assert os.path.exists(tmp_sqlite)
+    assert tp.get(scenario.id).doubled_number.read() == 42
+    assert len(tp.get_scenarios()) == 1
+    assert len(tp.get_jobs()) == 1
+    assert tp.get_jobs()[0].is_completed()
+    assert len(_TaskManagerFactory._build_manager()._get_by_config_id("double")) == 1
+    assert len(_DataManagerFactory._build_manager()._get_by_config_id("number")) == 1
+
+    tp.delete(scenario.id)
+    assert len(tp.get_scenarios()) == 0
+    assert len(tp.get_jobs()) == 0
+    assert len(_DataManagerFactory._build_manager()._get_all()) == 0
+
+
+@pytest.mark.usefixtures("sql_repository")
+def test_version_settings():
+    version_manager = _VersionManagerFactory._build_manager()
+    version_manager._set_experiment_version("1.0")
+    assert version_manager._get_latest_version() == "1.0"
+    development_version = version_manager._get_development_version()
+    assert development_version != "1.0"
+    assert version_manager._get_latest_version() == "1.0"
+
+    version_manager._set_development_version("dev")
+    assert version_manager._get_latest_version() == "dev"
+    assert version_manager._get_development_version() == "dev"
+
+
+@pytest.mark.usefixtures("sql_repository")
+def test_latest_and_filtered_jobs(tmp_sqlite):
+    task_cfg = Config.configure_task("double", mult_by_2, Config.configure_data_node("number", default_data=21))
+    scenario = tp.create_scenario(Config.configure_scenario("scenario", [task_cfg]))
+    task = scenario.double
+
+    first_job = tp.submit(scenario).jobs[0]
+    since = datetime.now()
+    latest_job = tp.submit(scenario).jobs[0]
+
+    assert tp.get_latest_job(task).id == latest_job.id
+    assert tp.get_latest_submission(scenario).jobs[0].id == latest_job.id
+    assert {job.id for job in tp.get_jobs(task=task, status=Status.COMPLETED)} == {first_job.id, latest_job.id}
+    assert [job.id for job in tp.get_jobs(task=task, since=since)] == [latest_job.id]
+    assert tp.get_jobs(status=Status.FAILED) == []
+    assert [job.id for job in tp.get_jobs(task=task, order_by="creation_date", descending=True, limit=1)] == [
+        latest_job.id
+    ]
+    assert [job.id for job in tp.get_jobs(order_by="creation_date", offset=1)] == [latest_job.id]
+
+
+def test_indexed_columns_are_added_to_existing_tables(tmp_sqlite):
+    connection = sqlite3.connect(tmp_sqlite)
+    connection.execute("CREATE TABLE jobs (id TEXT PRIMARY KEY, config_id, model TEXT, stamp TEXT)")
+    connection.execute("INSERT INTO jobs VALUES ('JOB_1', NULL, '{\"task_id\": \"TASK_1\"}', 'stamp')")
+    connection.commit()
+
+    _JobSQLRepository()._create_table(connection)
+
+    assert connection.execute("SELECT task_id, status FROM jobs").fetchall() == [("TASK_1", None)]
+    connection.close()
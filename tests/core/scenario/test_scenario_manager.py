@@ -301,6 +301,31 @@ def test_create_scenario_does_not_modify_config():
     assert scenario_2.name is None
 
 
+def test_create_scenario_saves_tasks_and_data_nodes_in_batches():
+    dn_configs = [Config.configure_data_node(f"dn_{i}", "in_memory") for i in range(31)]
+    task_configs = [Config.configure_task(f"t_{i}", print, dn_configs[i], dn_configs[i + 1]) for i in range(30)]
+    scenario_config = Config.configure_scenario("sc", task_configs, sequences={"seq": task_configs[:10]})
+
+    with patch.object(_DataManager._repository, "_save") as mck_dn_save:
+        with patch.object(_TaskManager._repository, "_save") as mck_task_save:
+            scenario = _ScenarioManager._create(scenario_config)
+            mck_dn_save.assert_not_called()
+            mck_task_save.assert_not_called()
+
+    assert len(scenario.data_nodes) == 31
+    assert len(scenario.tasks) == 30
+    sequence_task_ids = {task.id for task in scenario.sequences["seq"].tasks.values()}
+    assert len(sequence_task_ids) == 10
+    for task in scenario.tasks.values():
+        expected_parent_ids = (
+            {scenario.id, scenario.sequences["seq"].id} if task.id in sequence_task_ids else {scenario.id}
+        )
+        assert _TaskManager._get(task.id).parent_ids == expected_parent_ids
+    task_ids = {task.id for task in scenario.tasks.values()}
+    for data_node in scenario.data_nodes.values():
+        assert _DataManager._get(data_node.id).parent_ids <= task_ids
+
+
 def test_create_and_delete_scenario():
     creation_date_1 = datetime.now()
     creation_date_2 = creation_date_1 + timedelta(minutes=10)
@@ -921,6 +946,38 @@ def test_get_primary_scenarios_sorted():
     )
 
 
+def test_get_scenarios_page():
+    scenario_1_cfg = Config.configure_scenario(id="scenario_1", frequency=Frequency.DAILY)
+    scenario_2_cfg = Config.configure_scenario(id="scenario_2", frequency=Frequency.DAILY)
+    now = datetime.now()
+    scenarios = [
+        _ScenarioManager._create(scenario_1_cfg, now, "B_scenario"),
+        _ScenarioManager._create(scenario_2_cfg, now + timedelta(days=1), "A_scenario"),
+        _ScenarioManager._create(scenario_2_cfg, now + timedelta(days=2), "D_scenario"),
+        _ScenarioManager._create(scenario_1_cfg, now + timedelta(days=3), "C_scenario"),
+        _ScenarioManager._create(scenario_2_cfg, now + timedelta(days=4), "E_scenario"),
+    ]
+    scenarios[0].tags = ["banana", "kiwi"]
+    scenarios[2].tags = ["apple", "banana"]
+    scenarios[3].tags = ["banana"]
+
+    for sort_key in ["name", "id", "config_id", "creation_date", "tags"]:
+        for descending in [False, True]:
+            expected = _ScenarioManager._sort_scenarios(_ScenarioManager._get_all(), descending, sort_key)  # type: ignore
+            page = _ScenarioManager._get_page(sort_key=sort_key, descending=descending, offset=1, limit=2)
+            assert page == expected[1:3]
+            tagged = [scenario for scenario in expected if scenario.has_tag("banana")]
+            page = _ScenarioManager._get_page(tag="banana", sort_key=sort_key, descending=descending, offset=1)
+            assert page == tagged[1:]
+
+    assert _ScenarioManager._get_page(limit=2) == scenarios[:2]
+    start, end = now + timedelta(days=1), now + timedelta(days=3)
+    assert _ScenarioManager._get_page(created_start_time=start, created_end_time=end) == scenarios[1:3]
+    assert _ScenarioManager._get_page(cycle=scenarios[3].cycle) == [scenarios[3]]
+    assert tp.get_scenarios(is_sorted=True, descending=True, sort_key="name", limit=2) == [scenarios[4], scenarios[2]]
+    assert tp.get_scenarios(tag="banana", offset=1) == [scenarios[2], scenarios[3]]
+
+
 def test_hard_delete_one_single_scenario_with_scenario_data_nodes():
     dn_input_config = Config.configure_data_node("my_input", "in_memory", scope=Scope.SCENARIO, default_data="testing")
     dn_output_config = Config.configure_data_node("my_output", "in_memory", scope=Scope.SCENARIO)
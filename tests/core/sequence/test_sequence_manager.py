@@ -460,6 +460,8 @@ def notify_multi_param(*args, **kwargs): ...
 
 def test_sequence_notification_subscribe(mocker):
     mocker.patch("pyforge.core._entity._reload._Reloader._reload", side_effect=lambda m, o: o)
+    # The mocked `_load_fct` below expects the scenario to be loaded from the repository on each access.
+    Config.configure_core(entity_cache_size=0)
 
     task_configs = [
         Config.configure_task(
@@ -79,6 +79,9 @@ class MockJob:
     def __init__(self, id: str, status):
         self.status = status
         self.id = id
+        self.submitted_at = datetime.now()
+        self.run_at = None
+        self.finished_at = None
 
     def is_failed(self):
         return self.status == Status.FAILED
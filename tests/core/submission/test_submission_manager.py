@@ -11,11 +11,14 @@
 
 from datetime import datetime
 from time import sleep
+from unittest import mock
 
+import freezegun
 import pytest
 
 from pyforge.core._version._version_manager_factory import _VersionManagerFactory
 from pyforge.core.exceptions.exceptions import SubmissionNotDeletedException
+from pyforge.core.job._job_manager import _JobManager
 from pyforge.core.job._job_manager_factory import _JobManagerFactory
 from pyforge.core.job.job import Job
 from pyforge.core.submission._submission_manager_factory import _SubmissionManagerFactory
@@ -224,3 +227,115 @@ def test_hard_delete():
     submission_manager._hard_delete(submission.id)
     assert len(job_manager._get_all()) == 1
     assert len(submission_manager._get_all()) == 0
+
+
+def test_update_submission_status_saves_the_submission_once_per_job_status_change():
+    submission_manager = _SubmissionManagerFactory._build_manager()
+    task = Task("task_config_id", {}, print)
+    _TaskManagerFactory._build_manager()._set(task)
+    submission = submission_manager._create(task.id, task._ID_PREFIX, task.config_id)
+    jobs = [Job(f"JOB_job_id_{i}", task, submission.id, submission.entity_id) for i in range(2)]
+    _JobManagerFactory._build_manager()._set_many(jobs)
+    submission.jobs = jobs
+    for job in jobs:
+        job._on_status_change(lambda j: submission_manager._update_submission_status(j.submit_id, j))
+    jobs[0].pending()
+
+    with mock.patch.object(submission_manager, "_set", wraps=submission_manager._set) as mck_set:
+        with mock.patch.object(
+            submission_manager._repository, "_load", wraps=submission_manager._repository._load
+        ) as mck_load:
+            jobs[0].running()
+            jobs[1].pending()
+
+    assert mck_set.call_count == 2
+    mck_load.assert_not_called()
+    assert submission.submission_status == SubmissionStatus.RUNNING
+
+
+def test_execution_dates_are_recorded_from_the_job_status_changes():
+    submission_manager = _SubmissionManagerFactory._build_manager()
+    task = Task("task_config_id", {}, print)
+    _TaskManagerFactory._build_manager()._set(task)
+    submission = submission_manager._create(task.id, task._ID_PREFIX, task.config_id)
+    jobs = [Job(f"JOB_job_id_{i}", task, submission.id, submission.entity_id) for i in range(2)]
+    _JobManagerFactory._build_manager()._set_many(jobs)
+    submission.jobs = jobs
+    for job in jobs:
+        job._on_status_change(lambda j: submission_manager._update_submission_status(j.submit_id, j))
+
+    with freezegun.freeze_time("2024-09-25 13:30:35"):
+        jobs[0].running()
+    with freezegun.freeze_time("2024-09-25 13:31:35"):
+        jobs[1].running()
+        jobs[0].completed()
+    assert submission.finished_at is None
+    with freezegun.freeze_time("2024-09-25 13:35:50"):
+        jobs[1].completed()
+
+    with mock.patch.object(_JobManager, "_get_many") as mck_get_many:
+        assert submission.submitted_at == min(job.submitted_at for job in jobs)
+        assert submission.run_at == datetime(2024, 9, 25, 13, 30, 35)
+        assert submission.finished_at == datetime(2024, 9, 25, 13, 35, 50)
+        assert submission.execution_duration == 315
+    mck_get_many.assert_not_called()
+
+
+def test_finished_jobs_are_counted_once():
+    submission_manager = _SubmissionManagerFactory._build_manager()
+    task = Task("task_config_id", {}, print)
+    _TaskManagerFactory._build_manager()._set(task)
+    submission = submission_manager._create(task.id, task._ID_PREFIX, task.config_id)
+    jobs = [Job(f"JOB_job_id_{i}", task, submission.id, submission.entity_id) for i in range(2)]
+    _JobManagerFactory._build_manager()._set_many(jobs)
+    submission.jobs = jobs
+    for job in jobs:
+        job._on_status_change(lambda j: submission_manager._update_submission_status(j.submit_id, j))
+
+    jobs[1].running()
+    jobs[0].completed()
+    jobs[0].completed()
+
+    assert submission_manager._get(submission.id)._finished_jobs == {jobs[0].id}
+    assert submission.submission_status == SubmissionStatus.RUNNING
+    with mock.patch.object(_JobManager, "_get_many") as mck_get_many:
+        assert submission.finished_at is None
+    mck_get_many.assert_not_called()
+
+    jobs[1].completed()
+    assert submission.submission_status == SubmissionStatus.COMPLETED
+    assert submission.finished_at is not None
+    assert submission_manager._get(submission.id)._finished_jobs == {job.id for job in jobs}
+
+
+def test_deleted_submissions_are_no_longer_tracked():
+    submission_manager = _SubmissionManagerFactory._build_manager()
+    tracked_submissions = submission_manager._SubmissionManager__tracked_submissions
+    task = Task("task_config_id", {}, print)
+    _TaskManagerFactory._build_manager()._set(task)
+
+    def submit_failing_task():
+        submission = submission_manager._create(task.id, task._ID_PREFIX, task.config_id)
+        jobs = [Job(f"JOB_job_id_{submission.id}_{i}", task, submission.id, submission.entity_id) for i in range(2)]
+        _JobManagerFactory._build_manager()._set_many(jobs)
+        submission.jobs = jobs
+        for job in jobs:
+            job._on_status_change(lambda j: submission_manager._update_submission_status(j.submit_id, j))
+        jobs[1].blocked()
+        jobs[0].failed()
+        # The submission is finished, but one of its jobs is not.
+        assert submission.is_finished()
+        assert submission.id in tracked_submissions
+        return submission
+
+    submission = submit_failing_task()
+    submission_manager._delete(submission.id)
+    assert submission.id not in tracked_submissions
+    submission = submit_failing_task()
+    submission_manager._delete_many([submission.id])
+    assert submission.id not in tracked_submissions
+    submit_failing_task()
+    submission_manager._delete_all()
+    assert tracked_submissions == {}
+    submission_manager._delete_by_version(submit_failing_task().version)
+    assert tracked_submissions == {}
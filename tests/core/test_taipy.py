@@ -44,6 +44,7 @@ from pyforge.core.data.pickle import PickleDataNode
 from pyforge.core.exceptions.exceptions import DataNodeConfigIsNotGlobal
 from pyforge.core.job._job_manager import _JobManager
 from pyforge.core.job.job import Job
+from pyforge.core.job.status import Status
 from pyforge.core.scenario._scenario_manager import _ScenarioManager
 from pyforge.core.submission._submission_manager import _SubmissionManager
 from pyforge.core.task._task_manager import _TaskManager
@@ -434,6 +435,9 @@ class TestPyForge:
         with mock.patch("pyforge.core.scenario._scenario_manager._ScenarioManager._filter_by_creation_time") as mck:
             tp.get_scenarios(created_start_time=datetime.datetime(2021, 1, 1))
             mck.assert_called_once_with([], datetime.datetime(2021, 1, 1), None)
+        with mock.patch("pyforge.core.scenario._scenario_manager._ScenarioManager._get_page") as mck:
+            tp.get_scenarios(cycle, is_sorted=True, descending=True, sort_key="creation_date", limit=10)
+            mck.assert_called_once_with(cycle, None, None, None, "creation_date", True, 0, 10)
 
     def test_get_scenarios_sorted(self):
         scenario_1_cfg = Config.configure_scenario(id="scenario_1")
@@ -590,6 +594,13 @@ class TestPyForge:
         with mock.patch("pyforge.core.job._job_manager._JobManager._get_all") as mck:
             tp.get_jobs()
             mck.assert_called_once_with()
+        with mock.patch("pyforge.core.job._job_manager._JobManager._get_all_matching") as mck:
+            since = datetime.datetime.now()
+            tp.get_jobs(status=Status.COMPLETED, since=since)
+            mck.assert_called_once_with(None, Status.COMPLETED, since, None, False, 0, None)
+        with mock.patch("pyforge.core.job._job_manager._JobManager._get_all_matching") as mck:
+            tp.get_jobs(order_by="creation_date", descending=True, limit=10, offset=20)
+            mck.assert_called_once_with(None, None, None, "creation_date", True, 20, 10)
 
     def test_job_exists(self):
         with mock.patch("pyforge.core.job._job_manager._JobManager._exists") as mck:
@@ -630,6 +641,10 @@ class TestPyForge:
         with mock.patch("pyforge.core.submission._submission_manager._SubmissionManager._get_all") as mck:
             tp.get_submissions()
             mck.assert_called_once_with()
+        with mock.patch("pyforge.core.submission._submission_manager._SubmissionManager._get_page_by") as mck:
+            tp.get_submissions({"entity_id": "SCENARIO_id"}, limit=10)
+            filters = [{"version": _VersionManager._get_latest_version(), "entity_id": "SCENARIO_id"}]
+            mck.assert_called_once_with(filters, "id", False, 0, 10)
 
     def test_get_submission(self, task):
         with mock.patch("pyforge.core.submission._submission_manager._SubmissionManager._get") as mck:
@@ -665,6 +680,10 @@ class TestPyForge:
         with mock.patch("pyforge.core.data._data_manager._DataManager._get_all") as mck:
             tp.get_data_nodes()
             mck.assert_called_once_with()
+        with mock.patch("pyforge.core.data._data_manager._DataManager._get_page_by") as mck:
+            tp.get_data_nodes({"config_id": "foo"}, order_by="owner_id", descending=True, offset=5)
+            filters = [{"version": _VersionManager._get_latest_version(), "config_id": "foo"}]
+            mck.assert_called_once_with(filters, "owner_id", True, 5, None)
 
     def test_data_node_exists(self):
         with mock.patch("pyforge.core.data._data_manager._DataManager._exists") as mck:
@@ -0,0 +1,131 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+
+import threading
+import time
+from unittest.mock import patch
+
+import pandas as pd
+
+from pyforge.gui import Gui, Markdown
+from pyforge.gui.data.data_scope import _DataScope, _DataScopes
+
+
+def test_variables_are_copied_on_write(gui: Gui, helpers):
+    data = pd.DataFrame({"a": range(1000)})  # noqa: F841
+    gui.add_page("test", Markdown("<|{data}|table|>"))
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+    for client_id in ["client_1", "client_2"]:
+        gui._bindings()._get_or_create_scope(client_id)
+        flask_client.get(f"/pyforge-jsx/test?client_id={client_id}")
+
+    usage = gui.get_memory_usage()
+    var_name = next(name for name in usage[_DataScopes._INITIAL_VALUES_ID] if name.startswith("data"))
+    assert usage[_DataScopes._INITIAL_VALUES_ID][var_name] > 8000
+    scopes = gui._get_all_data_scopes()
+    # The clients reference the initial value until they set the variable.
+    assert getattr(scopes["client_1"], var_name) is getattr(scopes["client_2"], var_name)
+    assert var_name not in usage["client_1"]
+    assert var_name not in usage["client_2"]
+
+    setattr(scopes["client_1"], var_name, pd.DataFrame({"a": range(10)}))
+    assert len(getattr(scopes["client_1"], var_name)) == 10
+    assert len(getattr(scopes["client_2"], var_name)) == 1000
+    usage = gui.get_memory_usage()
+    assert 0 < usage["client_1"][var_name] < usage[_DataScopes._INITIAL_VALUES_ID][var_name]
+    assert var_name not in usage["client_2"]
+    assert var_name in scopes["client_2"]._get_variables()
+
+
+def test_idle_scopes_are_spilled_and_reloaded(gui: Gui, tmp_path):
+    gui.run(run_server=False)
+    scopes = _DataScopes(gui)
+    scopes.set_single_client(False)
+    scopes.create_scope("client")
+    scope = scopes.get_scope("client")[0]
+    scope.data = pd.DataFrame({"a": range(1000)})
+    scope.small = 1
+
+    assert scopes.evict_idle_scopes(3600, str(tmp_path), 1000) == []
+    assert "data" in vars(scope)
+    assert scopes.evict_idle_scopes(0.000001, str(tmp_path), 1000) == []
+    assert "data" not in vars(scope)
+    assert scope.small == 1
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # The value is read back when it is accessed.
+    assert scope.data["a"].sum() == sum(range(1000))
+    assert "data" in vars(scope)
+    assert not list(tmp_path.iterdir())
+
+    scopes.evict_idle_scopes(0.000001, str(tmp_path), 1000)
+    assert len(list(tmp_path.iterdir())) == 0
+    scopes.set_scope_accessed("client")
+    scopes.evict_idle_scopes(0.000001, str(tmp_path), 1000)
+    assert len(list(tmp_path.iterdir())) == 1
+    scopes.delete_scope("client")
+    assert not list(tmp_path.iterdir())
+
+
+def test_values_set_while_spilled_are_kept(gui: Gui, tmp_path):
+    gui.run(run_server=False)
+    scopes = _DataScopes(gui)
+    scopes.set_single_client(False)
+    scopes.create_scope("client")
+    scope = scopes.get_scope("client")[0]
+    scope.data = pd.DataFrame({"a": range(1000)})
+    dump = _DataScope._DataScope__dump  # type: ignore[attr-defined]
+
+    def set_while_dumping(path, value):
+        scope.data = pd.DataFrame({"a": range(10)})
+        return dump(path, value)
+
+    with patch.object(_DataScope, "_DataScope__dump", side_effect=set_while_dumping):
+        assert scope._spill(str(tmp_path), 1000) == []
+    assert len(scope.data) == 10
+    assert not list(tmp_path.iterdir())
+
+    # A spill file removed from outside falls back to the initial value.
+    scope._spill(str(tmp_path), 0)
+    for path in tmp_path.iterdir():
+        path.unlink()
+    assert not hasattr(scope, "data")
+
+
+def test_idle_states_are_evicted_in_the_background(gui: Gui):
+    gui.run(run_server=False, state_idle_timeout=60)
+    evicted = threading.Event()
+    threads = []
+
+    def evict(*args):
+        threads.append(threading.current_thread())
+        evicted.set()
+        return []
+
+    with patch.object(gui._bindings(), "_evict_idle_scopes", side_effect=evict):
+        gui._Gui__evict_idle_states()  # type: ignore[attr-defined]
+        assert evicted.wait(5)
+    assert threads[0] is not threading.current_thread()
+
+
+def test_idle_scopes_are_deleted(gui: Gui):
+    gui.run(run_server=False)
+    scopes = _DataScopes(gui)
+    scopes.set_single_client(False)
+    scopes.create_scope("client_1")
+    scopes.create_scope("client_2")
+    assert scopes.evict_idle_scopes(0, None) == []
+    time.sleep(0.01)
+    scopes.set_scope_accessed("client_2")
+    assert scopes.evict_idle_scopes(0.005, None) == ["client_1"]
+    assert set(scopes.get_all_scopes()) == {_DataScopes._GLOBAL_ID, "client_2"}
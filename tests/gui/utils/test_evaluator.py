@@ -87,3 +87,22 @@ def test_evaluate_expression_2_clients(gui: Gui):
         g.client_id = "B"
         gui._evaluate_expr("x")
         gui._re_evaluate_expr("x")
+
+
+def test_re_evaluate_expressions_once(gui: Gui):
+    x = 10  # noqa: F841
+    y = 20  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.run(run_server=False, single_client=True)
+    with gui.get_flask_app().app_context():
+        sum_hash = gui._evaluate_expr("{x + y}")
+        x_hash = gui._evaluate_expr("{x}")
+        x_name = gui._bind_var("x")
+        y_name = gui._bind_var("y")
+        gui._bindings().x = 1
+        gui._bindings().y = 2
+        evaluator = gui._Gui__evaluator  # type: ignore[attr-defined]
+        modified_vars = evaluator.re_evaluate_exprs(gui, [x_name, y_name])
+        assert modified_vars == {sum_hash, x_hash}
+        assert getattr(gui._bindings(), sum_hash) == 3
+        assert evaluator.re_evaluate_exprs(gui, [y_name]) == {sum_hash}
@@ -0,0 +1,85 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pandas as pd
+
+from pyforge import Scope
+from pyforge.core.data._data_manager_factory import _DataManagerFactory
+from pyforge.core.data.csv import CSVDataNode
+from pyforge.gui_core._context import _GuiCoreContext
+from pyforge.gui_core._data_node_cache import _DataNodeReadCache
+
+
+def core_get(entity_id):
+    return _DataManagerFactory._build_manager()._get(entity_id)
+
+
+def is_true(entity_id):
+    return True
+
+
+class TestGuiCoreContext_data_node_cache:
+    def test_value_is_served_while_the_data_node_is_not_edited(self):
+        cache = _DataNodeReadCache(1000)
+        edit_date = datetime(2025, 1, 1)
+        cache._put("dn", edit_date, "value")
+
+        assert cache._get("dn", edit_date) == "value"
+        assert cache._get("dn", edit_date + timedelta(seconds=1)) is None
+        assert cache._get("dn", None) is None
+        cache._invalidate("dn")
+        assert cache._get("dn", edit_date) is None
+        assert cache._stats()["hits"] == 1
+
+    def test_least_recently_used_values_are_evicted(self):
+        edit_date = datetime(2025, 1, 1)
+        value = pd.DataFrame({"a": range(10)})
+        size = _DataNodeReadCache._size_of(value)
+        cache = _DataNodeReadCache(2 * size)
+        cache._put("a", edit_date, value)
+        cache._put("b", edit_date, value.copy())
+        assert cache._get("a", edit_date) is value
+        cache._put("c", edit_date, value.copy())
+
+        assert cache._get("b", edit_date) is None
+        assert cache._get("a", edit_date) is value
+        assert cache._stats()["size"] == 2 * size
+
+        # A value larger than the capacity is not cached.
+        cache._put("d", edit_date, pd.DataFrame({"a": range(1000)}))
+        assert cache._get("d", edit_date) is None
+        assert cache._stats()["entries"] == 2
+
+    def test_tabular_data_is_read_once_per_edit(self, tmp_path):
+        dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": str(tmp_path / "data.csv")})
+        _DataManagerFactory._build_manager()._set(dn)
+        dn.write(pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}))
+
+        with (
+            patch("pyforge.gui_core._context.core_get", side_effect=core_get),
+            patch("pyforge.gui_core._context.is_readable", side_effect=is_true),
+            patch.object(CSVDataNode, "_read", autospec=True, side_effect=CSVDataNode._read) as mock_read,
+        ):
+            gui_core_context = _GuiCoreContext(Mock())
+            data = gui_core_context.get_data_node_tabular_data(dn.id)
+            assert gui_core_context.get_data_node_tabular_data(dn.id) is data
+            # The columns are described from the schema of the file.
+            assert gui_core_context.get_data_node_tabular_columns(dn.id) is not None
+            assert gui_core_context.get_data_node_chart_config(dn.id) is not None
+            assert mock_read.call_count == 1
+
+            dn.write(pd.DataFrame({"a": [3], "b": ["z"]}))
+            assert gui_core_context.get_data_node_tabular_data(dn.id).equals(pd.DataFrame({"a": [3], "b": ["z"]}))
+            assert mock_read.call_count == 2
@@ -0,0 +1,129 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+
+from unittest.mock import Mock, patch
+
+import pandas as pd
+
+from pyforge import Scope
+from pyforge.core.data._data_manager_factory import _DataManagerFactory
+from pyforge.core.data.csv import CSVDataNode
+from pyforge.core.data.parquet import ParquetDataNode
+from pyforge.gui.data.data_accessor import _DataAccessors
+from pyforge.gui.data.data_format import _DataFormat
+from pyforge.gui_core._context import _GuiCoreContext
+from pyforge.gui_core._data_node_table import _DataNodeTable, _DataNodeTableAccessor
+
+
+def core_get(entity_id):
+    return _DataManagerFactory._build_manager()._get(entity_id)
+
+
+def is_true(entity_id):
+    return True
+
+
+def _build_gui():
+    gui = Mock()
+    gui._get_accessor.return_value = _DataAccessors(gui)
+    gui._get_accessor()._register(_DataNodeTableAccessor)
+    gui._get_client_id.return_value = "client"
+    return gui
+
+
+def _create_parquet_data_node(tmp_path, data):
+    dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": str(tmp_path / "data.parquet")})
+    _DataManagerFactory._build_manager()._set(dn)
+    dn.write(data)
+    return dn
+
+
+class TestGuiCoreContext_data_node_table:
+    def test_table_rows_are_read_by_window(self, tmp_path):
+        data = pd.DataFrame({"a": range(100), "b": [i % 7 for i in range(100)]})
+        dn = _create_parquet_data_node(tmp_path, data)
+        gui = _build_gui()
+
+        with (
+            patch("pyforge.gui_core._context.core_get", side_effect=core_get),
+            patch("pyforge.gui_core._context.is_readable", side_effect=is_true),
+        ):
+            gui_core_context = _GuiCoreContext(gui)
+            table = gui_core_context.get_data_node_tabular_data(dn.id)
+            assert isinstance(table, _DataNodeTable)
+
+            with patch.object(ParquetDataNode, "_read") as mock_read:
+                accessor = _DataNodeTableAccessor(gui)
+                value = accessor.get_data("data", table, {"start": 20, "end": 29, "columns": ["a"]}, _DataFormat.JSON)[
+                    "value"
+                ]
+                assert value["rowcount"] == 100
+                assert value["start"] == 20
+                assert [row["a"] for row in value["data"]] == list(range(20, 30))
+                assert [row["_tp_index"] for row in value["data"]] == list(range(20, 30))
+
+                payload = {
+                    "start": 0,
+                    "end": 1,
+                    "orderby": "a",
+                    "sort": "desc",
+                    "filters": [{"col": "b", "action": "==", "value": 2}],
+                }
+                value = accessor.get_data("data", table, payload, _DataFormat.JSON)["value"]
+                assert value["rowcount"] == 14
+                assert value["fullrowcount"] == 100
+                assert [row["a"] for row in value["data"]] == [93, 86]
+                assert mock_read.call_count == 0
+
+            # The requests that need all the rows are served from the whole data.
+            value = accessor.get_data("data", table, {"alldata": True}, _DataFormat.JSON)["value"]
+            assert len(value["data"]["a"]) == 100
+            payload = {"start": 0, "end": 9, "aggregates": ["b"], "applies": {"a": "sum"}}
+            assert accessor.get_data("data", table, payload, _DataFormat.JSON)["value"]["rowcount"] == 7
+            assert accessor.get_cols_description("data", table) == {"a": {"type": "int64"}, "b": {"type": "int64"}}
+
+    def test_unknown_columns_are_served_from_the_whole_data(self, tmp_path):
+        data = pd.DataFrame({"a": range(10), "b": [i % 3 for i in range(10)]})
+        dn = _create_parquet_data_node(tmp_path, data)
+        gui = _build_gui()
+
+        with (
+            patch("pyforge.gui_core._context.core_get", side_effect=core_get),
+            patch("pyforge.gui_core._context.is_readable", side_effect=is_true),
+        ):
+            table = _GuiCoreContext(gui).get_data_node_tabular_data(dn.id)
+            accessor = _DataNodeTableAccessor(gui)
+            payloads = [
+                {"start": 0, "end": 4, "orderby": "a; DROP TABLE t"},
+                {"start": 0, "end": 4, "filters": [{"col": "1=1 OR a", "action": "==", "value": 1}]},
+            ]
+            read_window = ParquetDataNode._read_window
+            with patch.object(ParquetDataNode, "_read_window", autospec=True, side_effect=read_window) as mock_window:
+                for payload in payloads:
+                    accessor.get_data("data", table, payload, _DataFormat.JSON)
+                assert mock_window.call_count == 0
+
+    def test_whole_data_is_served_when_the_data_node_cannot_read_windows(self, tmp_path):
+        dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": str(tmp_path / "data.csv")})
+        _DataManagerFactory._build_manager()._set(dn)
+        dn.write(pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}))
+        parquet_dn = _create_parquet_data_node(tmp_path, pd.DataFrame({"a": [1, 2]}))
+        parquet_dn.lock_edit("client")
+
+        with (
+            patch("pyforge.gui_core._context.core_get", side_effect=core_get),
+            patch("pyforge.gui_core._context.is_readable", side_effect=is_true),
+        ):
+            gui_core_context = _GuiCoreContext(_build_gui())
+            assert isinstance(gui_core_context.get_data_node_tabular_data(dn.id), pd.DataFrame)
+            # The rows being edited are indexed in the whole data.
+            assert isinstance(gui_core_context.get_data_node_tabular_data(parquet_dn.id), pd.DataFrame)
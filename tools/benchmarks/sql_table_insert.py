@@ -0,0 +1,83 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+
+"""Measure the time to write rows to a local SQLite table data node with each insert strategy.
+
+The *"copy"* strategy relies on PostgreSQL's `COPY FROM STDIN` and is not measured on SQLite.
+
+Usage:
+    python tools/benchmarks/sql_table_insert.py [--nb-rows 1000000] [--nb-columns 5] [--chunksize 10000]
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+_STRATEGIES = ["executemany", "multi"]
+
+
+def _create_database(folder: str, db_name: str, nb_columns: int):
+    columns = ", ".join(f"c{i} {'INTEGER' if i % 2 == 0 else 'REAL'}" for i in range(nb_columns))
+    with sqlite3.connect(os.path.join(folder, f"{db_name}.db")) as connection:
+        connection.execute(f"CREATE TABLE example ({columns})")
+
+
+def _build_data(nb_rows: int, nb_columns: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {f"c{i}": rng.integers(0, 1_000_000, nb_rows) if i % 2 == 0 else rng.random(nb_rows) for i in range(nb_columns)}
+    )
+
+
+def main(nb_rows: int, nb_columns: int, chunksize: int):
+    from pyforge.common.config import Config
+    from pyforge.core.common.scope import Scope
+    from pyforge.core.data.sql_table import SQLTableDataNode
+
+    Config.configure_core(storage_folder=tempfile.mkdtemp(), pyforge_storage_folder=tempfile.mkdtemp())
+    folder = tempfile.mkdtemp()
+    data = _build_data(nb_rows, nb_columns)
+    print(f"{nb_rows} rows of {nb_columns} columns")  # noqa: T201
+
+    for strategy in _STRATEGIES:
+        db_name = f"insert_{strategy}"
+        _create_database(folder, db_name, nb_columns)
+        dn = SQLTableDataNode(
+            f"dn_{strategy}",
+            Scope.SCENARIO,
+            properties={
+                "db_engine": "sqlite",
+                "db_name": db_name,
+                "sqlite_folder_path": folder,
+                "table_name": "example",
+                "insert_strategy": strategy,
+                "insert_chunksize": chunksize if strategy != "multi" else None,
+            },
+        )
+        start = time.perf_counter()
+        dn._write(data)
+        total = time.perf_counter() - start
+        print(f"{strategy:<20} {total:8.3f}s  {nb_rows / total:12.0f} rows/s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nb-rows", type=int, default=1_000_000)
+    parser.add_argument("--nb-columns", type=int, default=5)
+    parser.add_argument("--chunksize", type=int, default=10_000)
+    args = parser.parse_args()
+    main(args.nb_rows, args.nb_columns, args.chunksize)
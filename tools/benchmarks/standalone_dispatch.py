@@ -0,0 +1,105 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Measure the per-job overhead of dispatching no-op jobs to the standalone workers.
+
+The jobs are not sent to worker processes: the dispatcher submits them to an executor that only records
+the submissions, and the worker side is replayed in the current process. This isolates the overhead of
+the dispatch itself (mainly, sending the configuration) from the execution of the tasks.
+
+Usage:
+    python tools/benchmarks/standalone_dispatch.py [--nb-jobs 10000] [--nb-data-node-configs 500]
+"""
+
+import argparse
+import tempfile
+import time
+from concurrent.futures import Executor, Future
+
+
+class _RecordingExecutor(Executor):
+    def __init__(self):
+        self.submissions = []
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.submissions.append((fn, kwargs))
+        return Future()
+
+
+def nothing():
+    pass
+
+
+def _configure(nb_data_node_configs: int):
+    from pyforge.common.config import Config
+
+    for i in range(nb_data_node_configs):
+        Config.configure_csv_data_node(f"dn_{i}", default_path=f"data/dn_{i}.csv", has_header=True)
+    return Config.configure_task("no_op", nothing)
+
+
+def _print_time(label: str, total: float, nb_jobs: int):
+    print(f"{label:<50} {total:8.3f}s  {total / nb_jobs * 1e6:10.1f}µs/job")  # noqa: T201
+
+
+def main(nb_jobs: int, nb_data_node_configs: int):
+    from pyforge.common.config import Config
+    from pyforge.common.config._serializer._toml_serializer import _TomlSerializer
+    from pyforge.core._orchestrator._dispatcher import _StandaloneJobDispatcher
+    from pyforge.core._orchestrator._dispatcher._task_function_wrapper import _TaskFunctionWrapper
+    from pyforge.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+    from pyforge.core.job._job_manager_factory import _JobManagerFactory
+    from pyforge.core.job.job import Job
+    from pyforge.core.job.job_id import JobId
+    from pyforge.core.task._task_manager_factory import _TaskManagerFactory
+
+    Config.configure_core(storage_folder=tempfile.mkdtemp(), pyforge_storage_folder=tempfile.mkdtemp())
+    task_config = _configure(nb_data_node_configs)
+    task = _TaskManagerFactory._build_manager()._bulk_get_or_create([task_config])[0]
+    jobs = [Job(JobId(f"JOB_{i}"), task, "SUBMISSION_id", task.id) for i in range(nb_jobs)]
+    _JobManagerFactory._build_manager()._set_many(jobs)
+
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._build_orchestrator())
+    dispatcher._executor.shutdown()
+    dispatcher._executor = executor = _RecordingExecutor()
+    config_as_string = _TomlSerializer()._serialize(Config._applied_config)
+    print(f"{nb_jobs} jobs, configuration of {len(config_as_string) / 1024:.1f} KiB")  # noqa: T201
+
+    start = time.perf_counter()
+    for job in jobs:
+        dispatcher._dispatch(job)
+    _print_time("Dispatcher: submit the jobs", time.perf_counter() - start, nb_jobs)
+
+    _TaskFunctionWrapper._initialize_worker(config_as_string, dispatcher._worker_config_hash)
+    start = time.perf_counter()
+    for wrapper, kwargs in executor.submissions:
+        wrapper.execute(**kwargs)
+    with_config = time.perf_counter() - start
+    start = time.perf_counter()
+    for wrapper, _ in executor.submissions:
+        wrapper.execute()
+    _print_time("Workers: handle the configuration", max(with_config - (time.perf_counter() - start), 0), nb_jobs)
+
+    nb_round_trips = min(nb_jobs, 20)
+    start = time.perf_counter()
+    for _ in range(nb_round_trips):
+        serialized_config = _TomlSerializer()._serialize(Config._applied_config)
+        Config._applied_config._update(_TomlSerializer()._deserialize(serialized_config))
+    round_trip = (time.perf_counter() - start) / nb_round_trips * nb_jobs
+    _print_time("Reference: send the configuration with each job", round_trip, nb_jobs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nb-jobs", type=int, default=10000)
+    parser.add_argument("--nb-data-node-configs", type=int, default=500)
+    args = parser.parse_args()
+    main(args.nb_jobs, args.nb_data_node_configs)